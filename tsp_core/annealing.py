@@ -0,0 +1,192 @@
+"""Recocido simulado (con lista tabú opcional) con presupuesto de tiempo, iteraciones y semilla."""
+import math
+import time
+import numpy as np
+from candidates import vecinos_cercanos
+from local_search import UMBRAL_DOS_NIVELES
+from tour import Tour
+
+# cada cuántas iteraciones se revisa el reloj y se actualiza la temperatura
+BLOQUE_ITERACIONES = 256
+
+
+def _delta_2opt(matriz, vecina, a, c):
+    """(delta, b, d) del 2-opt que agrega (a, c) y (b, d) en el sentido de `vecina`; None si no aplica."""
+    b, d = vecina(a), vecina(c)
+    if c == b or d == a:
+        return None
+    return matriz[a, c] + matriz[b, d] - matriz[a, b] - matriz[c, d], b, d
+
+
+def _delta_intercambio(matriz, recorrido, a, c):
+    """Cambio de distancia al intercambiar las posiciones de `a` y `c`."""
+    pa, na = recorrido.anterior(a), recorrido.siguiente(a)
+    pc, nc = recorrido.anterior(c), recorrido.siguiente(c)
+    if c == na:
+        return matriz[pa, c] + matriz[a, nc] - matriz[pa, a] - matriz[c, nc]
+    if c == pa:
+        return matriz[pc, a] + matriz[c, na] - matriz[pc, c] - matriz[a, na]
+    return (matriz[pa, c] + matriz[c, na] + matriz[pc, a] + matriz[a, nc]
+            - matriz[pa, a] - matriz[a, na] - matriz[pc, c] - matriz[c, nc])
+
+
+def _temperatura_inicial(matriz, recorrido, vecinos, rng, muestras=200):
+    """Temperatura con la que un empeoramiento promedio se acepta con probabilidad 1/2."""
+    num, k = len(vecinos), len(vecinos[0])
+    empeoramientos = []
+    for a, j in zip(rng.integers(num, size=muestras).tolist(), rng.integers(k, size=muestras).tolist()):
+        movimiento = _delta_2opt(matriz, recorrido.siguiente, a, vecinos[a][j])
+        if movimiento is not None and movimiento[0] > 0:
+            empeoramientos.append(movimiento[0])
+    if not empeoramientos:
+        return float(matriz.mean()) or 1.0
+    return float(np.mean(empeoramientos)) / math.log(2)
+
+
+def recocido_simulado(matriz_dist, ruta, tiempo_limite=None, max_iteraciones=None, semilla=None,
+                      tenencia_tabu=0, prob_intercambio=0.2, temperatura_inicial=None,
+                      temperatura_final=None, k=8, vecinos=None, paso_historial=None, plazo=None,
+                      callback=None):
+    """
+    Recocido simulado sobre una sola ruta (p. ej. la de vecino_mas_cercano).
+    En cada iteración elige una ciudad `a` al azar y una de sus k candidatas
+    `c`, y propone un 2-opt que agrega la arista (a, c) o (con probabilidad
+    `prob_intercambio`) intercambiar a y c. Ambos se evalúan en O(1) por el
+    delta de las aristas que cambian; se aceptan si mejoran o con
+    probabilidad exp(-delta / T).
+    - Presupuesto: tiempo_limite (s) y/o max_iteraciones (si no se da
+      ninguno, max(10000, 100·n) iteraciones). La temperatura baja
+      geométricamente de temperatura_inicial a temperatura_final según la
+      fracción consumida del presupuesto, así que el enfriamiento completo
+      cabe en el plazo. Por defecto T inicial acepta la mitad de los
+      empeoramientos típicos y T final es mil veces menor.
+    - tenencia_tabu: si es > 0, las ciudades de un movimiento aceptado no se
+      pueden volver a mover durante ese número de iteraciones, salvo que el
+      movimiento mejore la mejor ruta (criterio de aspiración).
+    - semilla: para repetir exactamente la misma ejecución (con el mismo
+      presupuesto de iteraciones).
+    - paso_historial: se agrega un registro cada tantas mejoras del mejor
+      (por defecto n // 100, es decir, cada mejora en instancias pequeñas).
+    - plazo (anytime.Plazo): se revisa cada BLOQUE_ITERACIONES iteraciones;
+      al vencer se retorna la mejor ruta. callback(ruta, dist, stats) recibe
+      cada registro que se agrega al historial.
+    Retorna ruta, dist_total, historial
+    (historial: registros (ruta, dist) de la mejor ruta, como la búsqueda exhaustiva)
+    """
+    t0 = time.perf_counter()
+    matriz = np.asarray(matriz_dist, dtype=float)
+    inicio = ruta[0]
+    tour = list(ruta[:-1]) if ruta[0] == ruta[-1] and len(ruta) > 1 else list(ruta)
+    num = len(tour)
+    actual = float(matriz[tour, np.roll(tour, -1)].sum())
+    dist_inicial = actual
+    if paso_historial is None:
+        paso_historial = max(1, num // 100)
+    if max_iteraciones is None and tiempo_limite is None:
+        max_iteraciones = max(10_000, 100 * num)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO RECOCIDO SIMULADO ':^80}")
+    print("=" * 80)
+
+    recorrido = Tour(tour, dos_niveles=num >= UMBRAL_DOS_NIVELES)
+    mejor_ruta = recorrido.a_lista(inicio)
+    historial = [(mejor_ruta, actual)]
+    if num < 5:
+        return mejor_ruta, actual, historial
+
+    rng = np.random.default_rng(semilla)
+    if vecinos is None:
+        vecinos = vecinos_cercanos(matriz, k)
+    vecinos = np.asarray(vecinos)[:, :k].tolist()
+    k = len(vecinos[0])
+    if temperatura_inicial is None:
+        temperatura_inicial = _temperatura_inicial(matriz, recorrido, vecinos, rng)
+    if temperatura_final is None:
+        temperatura_final = temperatura_inicial / 1000
+    print(f" -> Distancia inicial: {dist_inicial:.4f} | T: {temperatura_inicial:.4f} -> "
+          f"{temperatura_final:.6f} | tabú: {tenencia_tabu}")
+
+    tabu_hasta = [0] * num
+    mejor = actual
+    en_mejor = True  # la ruta actual es la mejor: se copia solo al alejarse de ella
+    mejoras = aceptados = 0
+    iteracion = 0
+    temperatura = temperatura_inicial
+    while max_iteraciones is None or iteracion < max_iteraciones:
+        if iteracion % BLOQUE_ITERACIONES == 0:
+            progreso = 0.0
+            if max_iteraciones is not None:
+                progreso = iteracion / max_iteraciones
+            if tiempo_limite is not None:
+                progreso = max(progreso, (time.perf_counter() - t0) / tiempo_limite)
+            if progreso >= 1 or (plazo is not None and plazo.vencido()):
+                break
+            temperatura = temperatura_inicial * (temperatura_final / temperatura_inicial) ** progreso
+            azar = rng.random((BLOQUE_ITERACIONES, 4)).tolist()
+        u_ciudad, u_vecino, u_tipo, u_aceptar = azar[iteracion % BLOQUE_ITERACIONES]
+        iteracion += 1
+
+        a = int(u_ciudad * num)
+        c = vecinos[a][int(u_vecino * k)]
+        intercambio = u_tipo < prob_intercambio
+        if intercambio:
+            delta = _delta_intercambio(matriz, recorrido, a, c)
+        else:
+            # el sentido sale del mismo número: u_tipo es uniforme en [prob_intercambio, 1)
+            vecina = recorrido.siguiente if u_tipo < (1 + prob_intercambio) / 2 else recorrido.anterior
+            movimiento = _delta_2opt(matriz, vecina, a, c)
+            if movimiento is None:
+                continue
+            delta, b, d = movimiento
+
+        nuevo_record = actual + delta < mejor - 1e-10
+        if tenencia_tabu and not nuevo_record and (tabu_hasta[a] > iteracion or tabu_hasta[c] > iteracion):
+            continue
+        if delta > 0 and u_aceptar >= math.exp(-delta / temperatura):
+            continue
+
+        if delta > 0 and en_mejor:
+            mejor_ruta = recorrido.a_lista(inicio)
+            en_mejor = False
+        if intercambio:
+            recorrido.intercambiar(a, c)
+        elif recorrido.siguiente(a) == b:
+            recorrido.invertir(b, c)
+        else:
+            recorrido.invertir(c, b)
+        actual += delta
+        aceptados += 1
+        if tenencia_tabu:
+            tabu_hasta[a] = tabu_hasta[c] = iteracion + tenencia_tabu
+
+        if nuevo_record:
+            mejor = actual
+            en_mejor = True
+            mejoras += 1
+            if mejoras % paso_historial == 0:
+                historial.append((recorrido.a_lista(inicio), mejor))
+                if callback:
+                    callback(historial[-1][0], mejor, {"iteraciones": iteracion,
+                                                       "tiempo": time.perf_counter() - t0})
+        elif delta < 0 and actual <= mejor + 1e-10:
+            en_mejor = True
+
+    if en_mejor:
+        mejor_ruta = recorrido.a_lista(inicio)
+    dist_total = float(matriz[mejor_ruta[:-1], mejor_ruta[1:]].sum())
+    # solo si el último récord guardado (paso_historial) no es ya esta distancia;
+    # se compara con su largo recalculado para no arrastrar el error de los deltas
+    ultimo = historial[-1][0]
+    if dist_total < float(matriz[ultimo[:-1], ultimo[1:]].sum()) - 1e-10:
+        historial.append((mejor_ruta, dist_total))
+        if callback:
+            callback(mejor_ruta, dist_total, {"iteraciones": iteracion, "tiempo": time.perf_counter() - t0})
+
+    mejora = (dist_inicial - dist_total) / dist_inicial * 100 if dist_inicial > 0 else 0.0
+    print("-" * 80)
+    print(f" FIN RECOCIDO SIMULADO. Iteraciones: {iteracion} | Aceptados: {aceptados} | "
+          f"Récords: {mejoras}")
+    print(f"    Distancia: {dist_inicial:.4f} -> {dist_total:.4f} ({mejora:.2f}%)")
+    print("-" * 80)
+
+    return mejor_ruta, dist_total, historial
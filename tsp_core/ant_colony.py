@@ -0,0 +1,158 @@
+"""Optimización por colonia de hormigas con feromona matricial y listas de candidatos."""
+import time
+import numpy as np
+
+
+def _ruleta(rng, pesos):
+    """Un índice por fila, con probabilidad proporcional a los pesos de la fila."""
+    acumulado = np.cumsum(pesos, axis=1)
+    r = rng.random(len(pesos)) * acumulado[:, -1]
+    return np.minimum((acumulado < r[:, None]).sum(axis=1), pesos.shape[1] - 1)
+
+
+def _construir(rng, matriz, atractivo, vecinos, inicios, voraz=False):
+    """
+    Construye una ruta por hormiga, todas a la vez: en cada paso cada hormiga
+    elige su próxima ciudad por ruleta sobre `atractivo` (feromona^alfa ·
+    (1/d)^beta), con las visitadas en cero. Con `vecinos`, `atractivo` es
+    (n, k) y solo se sortea entre las candidatas libres. Si una hormiga no
+    tiene ninguna opción con peso positivo (sin candidatas libres, o pesos
+    que se anularon por underflow) va a la ciudad libre más cercana.
+    `voraz` elige siempre el máximo.
+    Retorna las rutas como array (hormigas, n).
+    """
+    m, num = len(inicios), len(matriz)
+    filas = np.arange(m)
+    rutas = np.empty((m, num), dtype=np.intp)
+    rutas[:, 0] = inicios
+    visitadas = np.zeros((m, num), dtype=bool)
+    visitadas[filas, inicios] = True
+    actuales = inicios
+    for paso in range(1, num):
+        if vecinos is None:
+            pesos = np.where(visitadas, 0.0, atractivo[actuales])
+            siguientes = pesos.argmax(axis=1) if voraz else _ruleta(rng, pesos)
+        else:
+            candidatas = vecinos[actuales]
+            pesos = np.where(visitadas[filas[:, None], candidatas], 0.0, atractivo[actuales])
+            elegidas = pesos.argmax(axis=1) if voraz else _ruleta(rng, pesos)
+            siguientes = candidatas[filas, elegidas]
+        # sin peso positivo (ninguna candidata libre, o todos los pesos en cero por
+        # underflow con beta grande o feromona evaporada): la ruleta daría el
+        # índice 0, quizá ya visitado; se va a la ciudad libre más cercana
+        sin_libres = np.flatnonzero(pesos.max(axis=1) <= 0)
+        if len(sin_libres):
+            resto = np.where(visitadas[sin_libres], np.inf, matriz[actuales[sin_libres]])
+            siguientes[sin_libres] = resto.argmin(axis=1)
+        rutas[:, paso] = siguientes
+        visitadas[filas, siguientes] = True
+        actuales = siguientes
+    return rutas
+
+
+def _depositar(feromona, vecinos, rutas, aportes):
+    """
+    Suma a la feromona el aporte de cada ruta en sus aristas (en ambos
+    sentidos) con un solo bincount sobre la matriz aplanada. Con `vecinos`
+    solo cuentan las aristas que son candidatas.
+    """
+    num = rutas.shape[1]
+    desde, hasta = rutas.ravel(), np.roll(rutas, -1, axis=1).ravel()
+    desde, hasta = np.concatenate([desde, hasta]), np.concatenate([hasta, desde])
+    aporte = np.tile(np.repeat(aportes, num), 2)
+    if vecinos is None:
+        indices = desde * num + hasta
+    else:
+        coincide = vecinos[desde] == hasta[:, None]
+        es_candidata = coincide.any(axis=1)
+        indices = desde[es_candidata] * vecinos.shape[1] + coincide[es_candidata].argmax(axis=1)
+        aporte = aporte[es_candidata]
+    feromona += np.bincount(indices, aporte, minlength=feromona.size).reshape(feromona.shape)
+
+
+def colonia_hormigas(matriz_dist, inicio=0, hormigas=20, iteraciones=100, alfa=1.0, beta=3.0,
+                     evaporacion=0.1, elitistas=1.0, tiempo_limite=None, semilla=None,
+                     vecinos=None, plazo=None, callback=None):
+    """
+    Optimización por colonia de hormigas (Ant System elitista).
+    La feromona y el atractivo heurístico (1/d) son matrices NumPy; en cada
+    iteración todas las hormigas construyen su ruta a la vez (ruleta
+    vectorizada sobre filas enmascaradas), la feromona se evapora con una
+    multiplicación de toda la matriz y cada hormiga deposita 1/L en sus
+    aristas, más `elitistas`/L* sobre la mejor ruta encontrada.
+    - vecinos: listas de candidatos (n, k). Con ellas la feromona y el
+      atractivo son (n, k): no hay filas de probabilidad de n columnas.
+    - tiempo_limite (s) y/o iteraciones: presupuesto. semilla: repetible.
+    - plazo (anytime.Plazo): se revisa entre iteraciones; callback(ruta,
+      dist, stats) recibe cada nueva mejor ruta.
+    Retorna ruta, dist_total, historial
+    (historial: registros (ruta, dist) de cada nueva mejor ruta, como la búsqueda exhaustiva)
+    """
+    t0 = time.perf_counter()
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    rng = np.random.default_rng(semilla)
+    if vecinos is not None:
+        vecinos = np.asarray(vecinos, dtype=np.intp)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO COLONIA DE HORMIGAS ':^80}")
+    print("=" * 80)
+    modo = f"{vecinos.shape[1]} candidatas por ciudad" if vecinos is not None else "filas completas"
+    print(f" -> {hormigas} hormigas | alfa = {alfa}, beta = {beta}, evaporación = {evaporacion} | {modo}")
+
+    if num < 3:
+        ruta = [inicio] + [c for c in range(num) if c != inicio] + [inicio]
+        dist_total = float(matriz[ruta[:-1], ruta[1:]].sum())
+        return ruta, dist_total, [(ruta, dist_total)]
+
+    # atractivo heurístico 1/d (sin dividir por cero), completo o solo de las candidatas
+    distancias = matriz if vecinos is None else matriz[np.arange(num)[:, None], vecinos]
+    heuristica = 1.0 / np.maximum(distancias, 1e-12)
+    if vecinos is None:
+        np.fill_diagonal(heuristica, 0.0)
+    heuristica_beta = heuristica ** beta
+
+    # feromona inicial: hormigas / L de la ruta golosa (vecino más cercano)
+    golosa = _construir(rng, matriz, heuristica_beta, vecinos, np.array([inicio]), voraz=True)[0]
+    dist_golosa = float(matriz[golosa, np.roll(golosa, -1)].sum())
+    feromona = np.full(heuristica.shape, hormigas / dist_golosa)
+    mejor_ruta, mejor_dist = golosa.tolist(), dist_golosa
+
+    def cerrada(ruta):
+        i = ruta.index(inicio)
+        return ruta[i:] + ruta[:i] + [inicio]
+
+    historial = [(cerrada(mejor_ruta), mejor_dist)]
+    if callback:
+        callback(historial[0][0], mejor_dist, {"iteraciones": 0, "tiempo": time.perf_counter() - t0})
+    hechas = 0
+    while (hechas < iteraciones and (tiempo_limite is None or time.perf_counter() - t0 < tiempo_limite)
+           and (plazo is None or not plazo.vencido())):
+        atractivo = feromona ** alfa * heuristica_beta
+        rutas = _construir(rng, matriz, atractivo, vecinos, rng.integers(num, size=hormigas))
+        dists = matriz[rutas, np.roll(rutas, -1, axis=1)].sum(axis=1)
+        hechas += 1
+
+        k = int(np.argmin(dists))
+        if dists[k] < mejor_dist - 1e-10:
+            mejor_ruta, mejor_dist = rutas[k].tolist(), float(dists[k])
+            historial.append((cerrada(mejor_ruta), mejor_dist))
+            if callback:
+                callback(historial[-1][0], mejor_dist, {"iteraciones": hechas,
+                                                        "tiempo": time.perf_counter() - t0})
+            print(f" [Iteración {hechas}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+
+        feromona *= 1.0 - evaporacion
+        _depositar(feromona, vecinos, rutas, 1.0 / dists)
+        if elitistas:
+            _depositar(feromona, vecinos, np.array([mejor_ruta]), np.array([elitistas / mejor_dist]))
+
+    ruta_final = cerrada(mejor_ruta)
+    dist_total = float(matriz[ruta_final[:-1], ruta_final[1:]].sum())
+
+    print("-" * 80)
+    print(f" FIN COLONIA DE HORMIGAS. Iteraciones: {hechas} | Distancia: {dist_total:.4f}")
+    print(f"    Ruta golosa inicial: {dist_golosa:.4f} | Tiempo: {time.perf_counter() - t0:.2f} s")
+    print("-" * 80)
+
+    return ruta_final, dist_total, historial
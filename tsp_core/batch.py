@@ -0,0 +1,88 @@
+"""Resolución en lote de muchas instancias pequeñas de TSP (Held-Karp vectorizado)."""
+import numpy as np
+
+
+def construir_matrices_lote(coordenadas):
+    """
+    Matrices de distancias de m instancias a la vez.
+    coordenadas: array (m, n, 2) con (lat, lon) de cada ciudad de cada instancia.
+    Retorna array (m, n, n) con la misma distancia euclidiana que construir_matriz_distancias.
+    """
+    coordenadas = np.asarray(coordenadas, dtype=float)
+    diferencias = coordenadas[:, :, None, :] - coordenadas[:, None, :, :]
+    return np.sqrt((diferencias ** 2).sum(axis=-1))
+
+
+def held_karp_lote(matrices):
+    """
+    Held-Karp sobre el eje de lote: las mismas tablas que held_karp pero con
+    forma (2^(n-1), n-1, lote), de modo que cada operación de NumPy avanza todas
+    las instancias a la vez.
+    Retorna: rutas (m, n+1) con inicio y retorno a la ciudad 0, distancias (m,)
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    lote, n, _ = matrices.shape
+    if n <= 3:
+        rutas = np.tile(np.append(np.arange(n), 0), (lote, 1))
+        distancias = matrices[:, rutas[0, :-1], rutas[0, 1:]].sum(axis=1)
+        return rutas, distancias
+
+    m = n - 1
+    total_mascaras = 1 << m
+    # el eje de lote va al final: cada fila de la tabla guarda todas las instancias juntas
+    sub = np.moveaxis(matrices[:, 1:, 1:], 0, -1)
+    instancias = np.arange(lote)
+
+    costos = np.full((total_mascaras, m, lote), np.inf)
+    padres = np.full((total_mascaras, m, lote), -1, dtype=np.int8)
+    for k in range(m):
+        costos[1 << k, k] = matrices[:, 0, k + 1]
+
+    mascaras = np.arange(total_mascaras)
+    tamanos = np.zeros(total_mascaras, dtype=np.int8)
+    for k in range(m):
+        tamanos += (mascaras >> k) & 1
+
+    for tam in range(2, m + 1):
+        capa = mascaras[tamanos == tam]
+        for k in range(m):
+            bit = 1 << k
+            destino = capa[(capa & bit) != 0]
+            origen = destino ^ bit
+            candidatos = costos[origen] + sub[:, k]
+            j = np.argmin(candidatos, axis=1)
+            costos[destino, k] = np.take_along_axis(candidatos, j[:, None, :], axis=1)[:, 0]
+            padres[destino, k] = j
+
+    cierre = costos[-1] + matrices[:, 1:, 0].T
+    ultimo = np.argmin(cierre, axis=0)
+    distancias = cierre[ultimo, instancias]
+
+    # reconstrucción hacia atrás, vectorizada sobre el lote
+    rutas = np.zeros((lote, n + 1), dtype=np.int64)
+    mascara = np.full(lote, total_mascaras - 1)
+    k = ultimo
+    for pos in range(m, 0, -1):
+        rutas[:, pos] = k + 1
+        anterior = padres[mascara, k, instancias].astype(np.int64)
+        mascara = mascara ^ (1 << k)
+        k = anterior
+    return rutas, distancias
+
+
+def resolver_lote(coordenadas, tam_lote=128):
+    """
+    Resuelve de forma óptima m instancias independientes de n ciudades.
+    coordenadas: array (m, n, 2). Las instancias se procesan en grupos de
+    `tam_lote` para acotar la memoria (tablas de 2^(n-1) x (n-1) x tam_lote).
+    Retorna: rutas (m, n+1) de índices, distancias (m,)
+    """
+    coordenadas = np.asarray(coordenadas, dtype=float)
+    rutas = []
+    distancias = []
+    for desde in range(0, len(coordenadas), tam_lote):
+        matrices = construir_matrices_lote(coordenadas[desde:desde + tam_lote])
+        r, d = held_karp_lote(matrices)
+        rutas.append(r)
+        distancias.append(d)
+    return np.concatenate(rutas), np.concatenate(distancias)
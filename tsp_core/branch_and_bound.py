@@ -0,0 +1,74 @@
+"""Algoritmo exacto de ramificación y poda para TSP."""
+from data import nombre_ciudad
+from spanning_tree import arbol_expansion_minima
+from nearest_neighbor import vecino_mas_cercano
+
+
+def ramificacion_y_poda(matriz_dist, ruta_inicial=None):
+    """
+    Ramificación y poda (branch and bound) en profundidad.
+    Una ruta parcial 0 -> ... -> actual solo se extiende si
+        costo_parcial + MST(no_visitadas ∪ {actual, 0}) < mejor_dist
+    (el resto del recorrido es un camino hamiltoniano entre `actual` y 0, que
+    nunca cuesta menos que un árbol de expansión mínima sobre esos nodos).
+    El récord inicial es la ruta de `ruta_inicial` o, si no se indica,
+    la del vecino más cercano.
+    Retorna: mejor_ruta, mejor_dist, historial
+    (historial contiene tuples (ruta, dist) cada vez que se encuentra nuevo record)
+    """
+    n = len(matriz_dist)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO RAMIFICACIÓN Y PODA (BRANCH AND BOUND) ':^80}")
+    print("=" * 80)
+
+    if ruta_inicial is None:
+        ruta_inicial, _, _ = vecino_mas_cercano(matriz_dist, inicio=0)
+    mejor_ruta = list(ruta_inicial)
+    mejor_dist = float(sum(matriz_dist[a, b] for a, b in zip(mejor_ruta, mejor_ruta[1:])))
+    historial = [(list(mejor_ruta), mejor_dist)]
+    explorados = 0
+    podados = 0
+
+    print(f" -> Récord inicial (vecino más cercano): {mejor_dist:.4f}")
+
+    ruta = [0]
+    pendientes = set(range(1, n))
+
+    def explorar(actual, costo):
+        nonlocal mejor_ruta, mejor_dist, explorados, podados
+        explorados += 1
+
+        if not pendientes:
+            total = costo + matriz_dist[actual, 0]
+            if total < mejor_dist:
+                mejor_dist = float(total)
+                mejor_ruta = ruta + [0]
+                historial.append((list(mejor_ruta), mejor_dist))
+                ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+                print(f" [Nodo {explorados}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+                print(f"    Ruta: {ruta_nombres}")
+            return
+
+        # probar primero los vecinos más cercanos para mejorar el récord cuanto antes
+        for siguiente in sorted(pendientes, key=lambda c: matriz_dist[actual, c]):
+            nuevo_costo = costo + matriz_dist[actual, siguiente]
+            if nuevo_costo >= mejor_dist:
+                podados += 1
+                continue
+            pendientes.remove(siguiente)
+            cota, _ = arbol_expansion_minima(matriz_dist, [siguiente, 0] + sorted(pendientes))
+            if nuevo_costo + cota < mejor_dist:
+                ruta.append(siguiente)
+                explorar(siguiente, nuevo_costo)
+                ruta.pop()
+            else:
+                podados += 1
+            pendientes.add(siguiente)
+
+    explorar(0, 0.0)
+
+    print("-" * 80)
+    print(f" Nodos explorados: {explorados} | Nodos podados: {podados}")
+    print(f" FIN RAMIFICACIÓN Y PODA. Mejor distancia encontrada: {mejor_dist:.4f}")
+
+    return mejor_ruta, mejor_dist, historial
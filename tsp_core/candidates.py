@@ -0,0 +1,78 @@
+"""Listas de candidatos: los k vecinos más cercanos de cada ciudad, compartidas por las heurísticas."""
+import math
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def _sin_propia(indices, propias):
+    """Quita de cada fila de `indices` a la propia ciudad (o la última columna si no aparece)."""
+    es_propia = indices == propias[:, None]
+    no_aparece = ~es_propia.any(axis=1)
+    es_propia[no_aparece, -1] = True
+    # con puntos repetidos la ciudad puede aparecer más de una vez: quitar solo la primera
+    primera = np.zeros_like(es_propia)
+    primera[np.arange(len(indices)), es_propia.argmax(axis=1)] = True
+    return indices[~primera].reshape(len(indices), -1)
+
+
+def vecinos_cercanos(matriz_dist=None, k=8, puntos=None, bloque=2048):
+    """
+    Listas de candidatos: los k vecinos más cercanos de cada ciudad (sin ella
+    misma), de más cerca a más lejos, como array (n, k) int32. Se calculan una
+    vez y las comparten el vecino más cercano, la inserción y la búsqueda local.
+    - Con `matriz_dist`: argpartition por bloques de `bloque` filas, así que
+      solo se copia un bloque a la vez (sirve para np.memmap o matrices que
+      se leen por filas).
+    - Con `puntos` (array (n, 2)) no hace falta matriz: árbol k-d
+      (scipy.spatial.cKDTree) consultado por bloques, O(n log n).
+    """
+    if puntos is not None:
+        puntos = np.asarray(puntos, dtype=float)
+        num = len(puntos)
+    else:
+        num = len(matriz_dist)
+    k = min(k, num - 1)
+    vecinos = np.empty((num, max(k, 0)), dtype=np.int32)
+    if k <= 0:
+        return vecinos
+
+    arbol = cKDTree(puntos) if puntos is not None else None
+    for i0 in range(0, num, bloque):
+        i1 = min(i0 + bloque, num)
+        propias = np.arange(i0, i1)
+        if arbol is not None:
+            _, indices = arbol.query(puntos[i0:i1], k=k + 1)
+            vecinos[i0:i1] = _sin_propia(indices, propias)
+            continue
+        filas = np.array(matriz_dist[i0:i1], dtype=float)
+        filas[np.arange(i1 - i0), propias] = np.inf
+        cercanos = np.argpartition(filas, k - 1, axis=1)[:, :k]
+        orden = np.argsort(np.take_along_axis(filas, cercanos, axis=1), axis=1, kind="stable")
+        vecinos[i0:i1] = np.take_along_axis(cercanos, orden, axis=1)
+    return vecinos
+
+
+class DistanciasPuntos:
+    """
+    Distancias euclidianas calculadas al vuelo desde las coordenadas: se
+    indexa como la matriz de distancias (d[a, b] con dos ciudades, o
+    d[filas, columnas] con arrays de índices) sin guardar los n² valores.
+    Sirve para pasar a la búsqueda local rutas de instancias sin matriz.
+    """
+
+    def __init__(self, puntos):
+        self.puntos = np.asarray(puntos, dtype=float)
+        self.shape = (len(self.puntos), len(self.puntos))
+        # listas de Python: el acceso escalar es mucho más rápido que con NumPy
+        self._x = self.puntos[:, 0].tolist()
+        self._y = self.puntos[:, 1].tolist()
+
+    def __len__(self):
+        return len(self.puntos)
+
+    def __getitem__(self, clave):
+        a, b = clave
+        if isinstance(a, (int, np.integer)) and isinstance(b, (int, np.integer)):
+            return math.hypot(self._x[a] - self._x[b], self._y[a] - self._y[b])
+        diferencias = self.puntos[np.asarray(a)] - self.puntos[np.asarray(b)]
+        return np.sqrt((diferencias ** 2).sum(axis=-1))
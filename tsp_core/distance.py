@@ -1,6 +1,7 @@
 """Funciones para calcular distancias entre ciudades."""
 import numpy as np
 from data import coordenadas, nombres_ciudades, n
+from kernels import matriz_euclidiana
 
 
 def distancia_euclidiana(c1_idx, c2_idx):
@@ -12,14 +13,9 @@ def distancia_euclidiana(c1_idx, c2_idx):
 
 
 def construir_matriz_distancias():
-    """Construye la matriz simétrica n x n de distancias."""
-    matriz = np.zeros((n, n))
-    for i in range(n):
-        for j in range(i + 1, n):
-            d = distancia_euclidiana(i, j)
-            matriz[i, j] = d
-            matriz[j, i] = d
-    return matriz
+    """Construye la matriz simétrica n x n de distancias
+    (kernels.matriz_euclidiana, compilado con numba si está disponible)."""
+    return matriz_euclidiana(obtener_coordenadas())
 
 
 def mostrar_matriz_bonita(matriz):
@@ -41,4 +37,9 @@ def mostrar_matriz_bonita(matriz):
             else:
                 print(f"{val:>10.2f}", end="")
         print()
-    print("-" * 85)
\ No newline at end of file
+    print("-" * 85)
+
+def obtener_coordenadas():
+    """Coordenadas (lat, lon) como array (n, 2), en el orden de nombres_ciudades.
+    (Para algoritmos que trabajan sin matriz de distancias.)"""
+    return np.array([coordenadas[nombre] for nombre in nombres_ciudades], dtype=float)
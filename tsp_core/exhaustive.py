@@ -1,11 +1,25 @@
 """Algoritmo de búsqueda exhaustiva para TSP."""
 import itertools
 import math
+import time
+import numpy as np
 from data import nombres_ciudades, n
+from kernels import distancias_rutas
 
+# permutaciones por llamada al kernel de distancias
+TAM_BLOQUE = 4096
 
-def busqueda_exhaustiva(matriz_dist):
-    """Búsqueda exhaustiva con prints cada vez que se encuentra un nuevo récord."""
+
+def busqueda_exhaustiva(matriz_dist, top=None, histograma=None, plazo=None, callback=None):
+    """Búsqueda exhaustiva con prints cada vez que se encuentra un nuevo récord.
+    Opcionalmente acumula las K mejores rutas en `top` (TopRutas) y el largo de
+    todas las rutas en `histograma` (HistogramaDistancias).
+    Las permutaciones se evalúan por bloques de TAM_BLOQUE con
+    kernels.distancias_rutas (compilado con numba si TSP_BACKEND lo permite).
+    Anytime: `plazo` (anytime.Plazo) se revisa entre bloques y, si vence, se
+    retorna el mejor récord hasta ese momento; `callback(ruta, dist, stats)`
+    se llama con cada nuevo récord."""
+    t0 = time.perf_counter()
     print("\n" + "=" * 80)
     print(f"{' INICIANDO BÚSQUEDA EXHAUSTIVA (FUERZA BRUTA) ':^80}")
     print("=" * 80)
@@ -21,26 +35,40 @@ def busqueda_exhaustiva(matriz_dist):
     total_perms = math.factorial(n - 1)
     print(f" -> Se evaluarán {total_perms} rutas posibles...")
 
-    for perm in itertools.permutations(otros):
-        contador += 1
-        ruta_actual = [inicio] + list(perm) + [inicio]
+    permutaciones = itertools.permutations(otros)
+    # el primer bloque se evalúa siempre, para tener al menos una ruta
+    while plazo is None or contador == 0 or not plazo.vencido():
+        bloque = list(itertools.islice(permutaciones, TAM_BLOQUE))
+        if not bloque:
+            break
+
+        # calc distancia total de cada ruta del bloque
+        dists = distancias_rutas(matriz_dist, inicio, bloque)
 
-        # calc distancia total de la ruta_actual
-        dist_actual = 0.0
-        for i in range(len(ruta_actual) - 1):
-            a = ruta_actual[i]
-            b = ruta_actual[i + 1]
-            dist_actual += matriz_dist[a, b]
+        if top is not None:
+            top.agregar_lote(dists, lambda fila: [inicio] + list(bloque[fila]) + [inicio])
+        if histograma is not None:
+            histograma.agregar_lote(dists)
 
-        if dist_actual < mejor_dist:
-            mejor_dist = dist_actual
-            mejor_ruta = list(ruta_actual)
+        # récord = distancia estrictamente menor que todas las anteriores
+        minimos = np.minimum.accumulate(dists)
+        anteriores = np.concatenate(([mejor_dist], np.minimum(minimos[:-1], mejor_dist)))
+        for fila in np.flatnonzero(dists < anteriores):
+            mejor_dist = dists[fila]
+            mejor_ruta = [inicio] + list(bloque[fila]) + [inicio]
             historial.append((list(mejor_ruta), mejor_dist))
+            if callback:
+                callback(list(mejor_ruta), mejor_dist, {"evaluadas": contador + fila + 1, "total": total_perms,
+                                                        "tiempo": time.perf_counter() - t0})
 
             ruta_nombres = " -> ".join([nombres_ciudades[idx][:9] for idx in mejor_ruta])
-            print(f" [Intento {contador}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+            print(f" [Intento {contador + fila + 1}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
             print(f"    Ruta: {ruta_nombres}")
 
+        contador += len(bloque)
+
     print("-" * 80)
+    if contador < total_perms:
+        print(f" Plazo vencido: se evaluaron {contador} de {total_perms} rutas.")
     print(f" FIN EXHAUSTIVA. Mejor distancia encontrada: {mejor_dist:.4f}")
     return mejor_ruta, mejor_dist, historial
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""Búsqueda exhaustiva por rangos de permutaciones con checkpoints reanudables."""
+import argparse
+import json
+import math
+import os
+from data import nombre_ciudad
+
+
+def rango_permutacion(perm):
+    """Posición (0-based) de `perm` en el orden lexicográfico de sus elementos."""
+    elementos = sorted(perm)
+    rango = 0
+    for i, valor in enumerate(perm):
+        pos = elementos.index(valor)
+        rango += pos * math.factorial(len(perm) - 1 - i)
+        elementos.pop(pos)
+    return rango
+
+
+def permutacion_de_rango(rango, elementos):
+    """Permutación de `elementos` que ocupa la posición `rango` en orden lexicográfico."""
+    elementos = sorted(elementos)
+    perm = []
+    for i in range(len(elementos), 0, -1):
+        pos, rango = divmod(rango, math.factorial(i - 1))
+        perm.append(elementos.pop(pos))
+    return perm
+
+
+def siguiente_permutacion(perm):
+    """Avanza `perm` (in place) a la siguiente en orden lexicográfico; False si era la última."""
+    i = len(perm) - 2
+    while i >= 0 and perm[i] >= perm[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    j = len(perm) - 1
+    while perm[j] <= perm[i]:
+        j -= 1
+    perm[i], perm[j] = perm[j], perm[i]
+    perm[i + 1:] = reversed(perm[i + 1:])
+    return True
+
+
+def guardar_checkpoint(archivo, estado):
+    """Escribe el checkpoint de forma atómica (archivo temporal + reemplazo)."""
+    temporal = archivo + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(estado, f)
+    os.replace(temporal, archivo)
+
+
+def cargar_checkpoint(archivo):
+    with open(archivo, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def busqueda_exhaustiva_rango(matriz_dist, desde=0, hasta=None, archivo_checkpoint=None,
+                              intervalo=100_000):
+    """
+    Búsqueda exhaustiva sobre las permutaciones de rango [desde, hasta)
+    (mismo orden lexicográfico que busqueda_exhaustiva).
+    Si `archivo_checkpoint` existe, la búsqueda se reanuda desde él; cada
+    `intervalo` rutas se guarda {rango, mejor_ruta, mejor_dist, historial}.
+    Retorna: mejor_ruta, mejor_dist, historial
+    """
+    n = len(matriz_dist)
+    inicio = 0
+    otros = list(range(1, n))
+    total_perms = math.factorial(n - 1)
+    hasta = total_perms if hasta is None else min(hasta, total_perms)
+
+    estado = {"n": n, "desde": desde, "hasta": hasta, "rango": desde,
+              "mejor_ruta": None, "mejor_dist": None, "historial": []}
+    if archivo_checkpoint and os.path.exists(archivo_checkpoint):
+        guardado = cargar_checkpoint(archivo_checkpoint)
+        if (guardado["n"], guardado["desde"], guardado["hasta"]) != (n, desde, hasta):
+            raise ValueError(f"El checkpoint {archivo_checkpoint} corresponde a otro rango o instancia.")
+        estado = guardado
+
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO BÚSQUEDA EXHAUSTIVA POR RANGO ':^80}")
+    print("=" * 80)
+    print(f" -> Rango [{desde}, {hasta}) de {total_perms} rutas; reanudando en {estado['rango']}...")
+
+    mejor_ruta = estado["mejor_ruta"]
+    mejor_dist = estado["mejor_dist"] if estado["mejor_dist"] is not None else float('inf')
+    historial = [(list(r), d) for r, d in estado["historial"]]
+    rango = estado["rango"]
+    perm = permutacion_de_rango(rango, otros) if rango < hasta else None
+
+    def guardar():
+        if archivo_checkpoint:
+            guardar_checkpoint(archivo_checkpoint, {
+                "n": n, "desde": desde, "hasta": hasta, "rango": rango,
+                "mejor_ruta": mejor_ruta,
+                "mejor_dist": mejor_dist if mejor_ruta is not None else None,
+                "historial": historial,
+            })
+
+    while rango < hasta:
+        ruta_actual = [inicio] + perm + [inicio]
+
+        dist_actual = 0.0
+        for i in range(len(ruta_actual) - 1):
+            dist_actual += matriz_dist[ruta_actual[i], ruta_actual[i + 1]]
+
+        if dist_actual < mejor_dist:
+            mejor_dist = float(dist_actual)
+            mejor_ruta = list(ruta_actual)
+            historial.append((list(mejor_ruta), mejor_dist))
+
+            ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+            print(f" [Intento {rango + 1}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+            print(f"    Ruta: {ruta_nombres}")
+
+        rango += 1
+        siguiente_permutacion(perm)
+        if rango % intervalo == 0:
+            guardar()
+
+    guardar()
+    print("-" * 80)
+    print(f" FIN RANGO. Mejor distancia encontrada: {mejor_dist:.4f}")
+    return mejor_ruta, mejor_dist, historial
+
+
+def fusionar_checkpoints(archivos):
+    """
+    Fusiona checkpoints terminados de rangos contiguos (en cualquier orden).
+    Un récord de un rango solo se conserva si mejora a todos los rangos anteriores,
+    así el resultado es el mismo que una única búsqueda sobre el rango completo.
+    Retorna: mejor_ruta, mejor_dist, historial
+    """
+    estados = sorted((cargar_checkpoint(a) for a in archivos), key=lambda e: e["desde"])
+    esperado = estados[0]["desde"] if estados else 0
+    for estado in estados:
+        if estado["desde"] != esperado:
+            raise ValueError(f"Falta el rango [{esperado}, {estado['desde']}).")
+        if estado["rango"] < estado["hasta"]:
+            raise ValueError(f"El rango [{estado['desde']}, {estado['hasta']}) no ha terminado.")
+        esperado = estado["hasta"]
+
+    mejor_ruta = None
+    mejor_dist = float('inf')
+    historial = []
+    for estado in estados:
+        for ruta, dist in estado["historial"]:
+            if dist < mejor_dist:
+                mejor_dist = dist
+                mejor_ruta = list(ruta)
+                historial.append((list(ruta), dist))
+    return mejor_ruta, mejor_dist, historial
+
+
+if __name__ == "__main__":
+    from distance import construir_matriz_distancias
+
+    parser = argparse.ArgumentParser(description="Búsqueda exhaustiva por rangos con checkpoints.")
+    parser.add_argument("--desde", type=int, default=0, help="primer rango (incluido)")
+    parser.add_argument("--hasta", type=int, default=None, help="último rango (excluido)")
+    parser.add_argument("--checkpoint", help="archivo JSON para guardar/reanudar el progreso")
+    parser.add_argument("--intervalo", type=int, default=100_000, help="rutas entre checkpoints")
+    parser.add_argument("--fusionar", nargs="+", metavar="ARCHIVO",
+                        help="fusiona checkpoints terminados en vez de buscar")
+    args = parser.parse_args()
+
+    if args.fusionar:
+        ruta, dist, _ = fusionar_checkpoints(args.fusionar)
+        print(f"Mejor distancia: {dist:.4f}")
+        print("Ruta: " + " -> ".join(nombre_ciudad(idx) for idx in ruta))
+    else:
+        busqueda_exhaustiva_rango(construir_matriz_distancias(), desde=args.desde, hasta=args.hasta,
+                                  archivo_checkpoint=args.checkpoint, intervalo=args.intervalo)
@@ -0,0 +1,149 @@
+"""Búsqueda exhaustiva paralela (ProcessPoolExecutor) para TSP."""
+import itertools
+import math
+import os
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Array
+from data import nombre_ciudad
+from tour_stats import TopRutas, HistogramaDistancias
+
+# Cada cuántas rutas un worker vuelve a leer los récords compartidos
+INTERVALO_SINCRONIZACION = 4096
+
+# Estado de cada proceso del pool (se fija una sola vez en _inicializar_worker)
+_matriz = None
+_mejores = None
+
+
+def _inicializar_worker(matriz, mejores):
+    global _matriz, _mejores
+    _matriz = matriz
+    _mejores = mejores
+
+
+def _explorar_fragmento(indice, prefijo, restantes, top_k, params_histograma):
+    """
+    Recorre, en el mismo orden que busqueda_exhaustiva, todas las rutas
+    0 -> prefijo -> permutación(restantes) -> 0.
+    Una ruta se abandona en cuanto su distancia parcial alcanza la cota, que es
+    el mínimo entre el récord propio y los récords actuales de los fragmentos
+    ANTERIORES: así nunca se descarta una ruta que sería récord en la versión serial.
+    Con top-K la ruta se abandona además solo si supera la K-ésima mejor del
+    fragmento (top.peor_dist(), inf hasta tener K rutas). Con histograma no se
+    poda, porque hay que medir todas las rutas.
+    Retorna (records, top, histograma); records es una lista de
+    (intento_local, ruta, dist) con los récords del fragmento.
+    """
+    records = []
+    top = TopRutas(top_k) if top_k else None
+    histograma = HistogramaDistancias(*params_histograma) if params_histograma else None
+    podar = histograma is None
+    mejor_local = float('inf')
+    cota = min(_mejores[:indice], default=float('inf')) if podar else float('inf')
+    # una ruta que no entra en el top-K del fragmento tampoco entra en el global
+    limite_top = float('-inf') if top is None else top.peor_dist()
+
+    for contador, perm in enumerate(itertools.permutations(restantes), start=1):
+        if podar and contador % INTERVALO_SINCRONIZACION == 0:
+            cota = min([mejor_local] + _mejores[:indice])
+
+        ruta_actual = [0] + list(prefijo) + list(perm) + [0]
+        dist_actual = 0.0
+        for i in range(len(ruta_actual) - 1):
+            dist_actual += _matriz[ruta_actual[i], ruta_actual[i + 1]]
+            if dist_actual >= cota and dist_actual > limite_top:
+                break
+        else:
+            if top is not None:
+                top.agregar(ruta_actual, dist_actual)
+                if podar:
+                    limite_top = top.peor_dist()
+            if histograma is not None:
+                histograma.agregar(dist_actual)
+            if dist_actual < mejor_local:
+                mejor_local = dist_actual
+                if podar:
+                    cota = min(cota, dist_actual)
+                _mejores[indice] = dist_actual
+                records.append((contador, ruta_actual, dist_actual))
+
+    return records, top, histograma
+
+
+def busqueda_exhaustiva_paralela(matriz_dist, workers=None, top=None, histograma=None):
+    """
+    Búsqueda exhaustiva repartida en un ProcessPoolExecutor.
+    El espacio de permutaciones se divide en fragmentos por prefijo fijo
+    (0, a, b, ...); los workers comparten su mejor distancia en un Array
+    para abandonar rutas peores. Los récords de cada fragmento se fusionan en
+    orden, por lo que ruta, distancia e historial coinciden con la versión serial.
+    `top` y `histograma` (opcionales) se llenan fusionando los de cada worker.
+    Retorna: mejor_ruta, mejor_dist, historial
+    """
+    n = len(matriz_dist)
+    workers = workers or os.cpu_count() or 1
+    otros = list(range(1, n))
+
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO BÚSQUEDA EXHAUSTIVA PARALELA ':^80}")
+    print("=" * 80)
+
+    # profundidad del prefijo: suficientes fragmentos para repartir bien la carga
+    profundidad = 1
+    while profundidad < len(otros) - 1 and math.perm(len(otros), profundidad) < 4 * workers:
+        profundidad += 1
+
+    prefijos = list(itertools.permutations(otros, profundidad))
+    restantes = [[c for c in otros if c not in prefijo] for prefijo in prefijos]
+    tam_fragmento = math.factorial(len(otros) - profundidad)
+    total_perms = math.factorial(n - 1)
+
+    print(f" -> Se evaluarán {total_perms} rutas posibles...")
+    print(f" -> {len(prefijos)} fragmentos de {tam_fragmento} rutas en {workers} procesos")
+
+    mejores = Array('d', [float('inf')] * len(prefijos), lock=False)
+    top_k = top.k if top is not None else 0
+    params_histograma = (
+        (histograma.minimo, histograma.maximo, histograma.bins) if histograma is not None else None
+    )
+    argumentos = (range(len(prefijos)), prefijos, restantes, repeat(top_k), repeat(params_histograma))
+    mejor_dist = float('inf')
+    mejor_ruta = None
+    historial = []
+
+    if workers == 1:
+        # sin pool: los fragmentos se recorren en este mismo proceso
+        _inicializar_worker(matriz_dist, mejores)
+        resultados = map(_explorar_fragmento, *argumentos)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                                       initargs=(matriz_dist, mejores))
+        resultados = executor.map(_explorar_fragmento, *argumentos)
+
+    try:
+        # fusionar en orden: un récord local solo es récord global si mejora a todos los anteriores
+        for indice, (records, top_fragmento, hist_fragmento) in enumerate(resultados):
+            if top is not None:
+                top.fusionar(top_fragmento)
+            if histograma is not None:
+                histograma.fusionar(hist_fragmento)
+            for intento_local, ruta, dist in records:
+                if dist < mejor_dist:
+                    mejor_dist = dist
+                    mejor_ruta = list(ruta)
+                    historial.append((list(mejor_ruta), mejor_dist))
+
+                    contador = indice * tam_fragmento + intento_local
+                    ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+                    print(f" [Intento {contador}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+                    print(f"    Ruta: {ruta_nombres}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print("-" * 80)
+    print(f" FIN EXHAUSTIVA PARALELA. Mejor distancia encontrada: {mejor_dist:.4f}")
+
+    return mejor_ruta, mejor_dist, historial
@@ -0,0 +1,100 @@
+"""Búsqueda exhaustiva vectorizada por bloques de NumPy para TSP."""
+import itertools
+import math
+import time
+import numpy as np
+from data import nombre_ciudad
+
+
+def busqueda_exhaustiva_vectorizada(matriz_dist, tam_bloque=1_000_000,
+                                    top=None, histograma=None, plazo=None, callback=None):
+    """
+    Búsqueda exhaustiva evaluando las permutaciones por bloques de NumPy.
+    Las rutas se generan en el mismo orden lexicográfico que busqueda_exhaustiva:
+    los últimos `s` elementos salen de una tabla fija de s! permutaciones
+    (s! <= tam_bloque) y los primeros de itertools. Cada bloque es un array int
+    de a lo sumo `tam_bloque` filas; su largo se calcula con indexado avanzado
+    sobre matriz_dist sumando columna a columna (mismo orden de suma que la
+    versión serial) y los récords salen de un mínimo acumulado.
+    `top` y `histograma` (opcionales) se actualizan con un bloque entero a la vez.
+    Anytime: `plazo` (anytime.Plazo) se revisa entre bloques y
+    `callback(ruta, dist, stats)` se llama con cada nuevo récord.
+    Retorna: mejor_ruta, mejor_dist, historial
+    """
+    t0 = time.perf_counter()
+    n = len(matriz_dist)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO BÚSQUEDA EXHAUSTIVA VECTORIZADA ':^80}")
+    print("=" * 80)
+
+    inicio = 0
+    otros = list(range(1, n))
+    m = len(otros)
+    mejor_dist = float('inf')
+    mejor_ruta = None
+    historial = []
+    contador = 0
+
+    total_perms = math.factorial(m)
+    print(f" -> Se evaluarán {total_perms} rutas posibles en bloques de hasta {tam_bloque}...")
+
+    # sufijo más largo cuya tabla de permutaciones cabe en un bloque
+    s = 1
+    while s < m and math.factorial(s + 1) <= tam_bloque:
+        s += 1
+    s = min(s, m)
+    tabla = np.array(list(itertools.permutations(range(s))), dtype=np.intp).reshape(-1, s)
+    prefijos_por_bloque = max(1, tam_bloque // len(tabla))
+    prefijos = itertools.permutations(otros, m - s)
+    dist_plana = np.asarray(matriz_dist, dtype=float).ravel()
+
+    # el primer bloque se evalúa siempre, para tener al menos una ruta
+    while plazo is None or contador == 0 or not plazo.vencido():
+        lote = list(itertools.islice(prefijos, prefijos_por_bloque))
+        if not lote:
+            break
+
+        # rutas del bloque por columnas (columnas contiguas => indexado más rápido):
+        # prefijo fijo + permutaciones de las ciudades restantes
+        k = len(lote)
+        pref = np.array(lote, dtype=np.intp).reshape(k, m - s)
+        restantes = np.array([[c for c in otros if c not in p] for p in lote], dtype=np.intp)
+        columnas = np.empty((m, k * len(tabla)), dtype=np.intp)
+        columnas[:m - s] = np.repeat(pref.T, len(tabla), axis=1)
+        posiciones = np.arange(k)[None, :, None] * s + tabla.T[:, None, :]
+        columnas[m - s:] = restantes.ravel()[posiciones].reshape(s, -1)
+
+        # largo de cada ruta: suma de aristas en el mismo orden que la versión serial
+        dist_bloque = dist_plana[inicio * n + columnas[0]]
+        for c in range(1, m):
+            dist_bloque += dist_plana[columnas[c - 1] * n + columnas[c]]
+        dist_bloque += dist_plana[columnas[-1] * n + inicio]
+
+        if top is not None:
+            top.agregar_lote(dist_bloque, lambda fila: [inicio] + columnas[:, fila].tolist() + [inicio])
+        if histograma is not None:
+            histograma.agregar_lote(dist_bloque)
+
+        # récord = distancia estrictamente menor que todas las anteriores
+        minimos = np.minimum.accumulate(dist_bloque)
+        anteriores = np.concatenate(([mejor_dist], np.minimum(minimos[:-1], mejor_dist)))
+        for fila in np.flatnonzero(dist_bloque < anteriores):
+            mejor_dist = dist_bloque[fila]
+            mejor_ruta = [inicio] + columnas[:, fila].tolist() + [inicio]
+            historial.append((list(mejor_ruta), mejor_dist))
+            if callback:
+                callback(list(mejor_ruta), mejor_dist, {"evaluadas": contador + fila + 1, "total": total_perms,
+                                                        "tiempo": time.perf_counter() - t0})
+
+            ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+            print(f" [Intento {contador + fila + 1}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+            print(f"    Ruta: {ruta_nombres}")
+
+        contador += columnas.shape[1]
+
+    print("-" * 80)
+    if contador < total_perms:
+        print(f" Plazo vencido: se evaluaron {contador} de {total_perms} rutas.")
+    print(f" FIN EXHAUSTIVA VECTORIZADA. Mejor distancia encontrada: {mejor_dist:.4f}")
+
+    return mejor_ruta, mejor_dist, historial
@@ -0,0 +1,79 @@
+"""Algoritmo exacto de Held-Karp (programación dinámica) para TSP."""
+import numpy as np
+from data import nombre_ciudad
+
+
+def held_karp(matriz_dist):
+    """
+    Solución óptima exacta por programación dinámica (Held-Karp) en O(2^n · n²).
+    Las tablas de la DP se guardan como arrays de NumPy indexados por máscara de bits:
+        - costos[mascara, k]: costo mínimo de salir de la ciudad 0, visitar exactamente
+          las ciudades de `mascara` y terminar en la ciudad k+1.
+        - padres[mascara, k]: penúltima ciudad de ese camino (para reconstruir la ruta).
+    Cada capa (tamaño de subconjunto) se calcula vectorizada sobre todas sus máscaras.
+    Retorna: mejor_ruta, mejor_dist, historial
+    (historial contiene un único record (ruta, dist): la ruta óptima)
+    """
+    n = len(matriz_dist)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO HELD-KARP (PROGRAMACIÓN DINÁMICA) ':^80}")
+    print("=" * 80)
+
+    if n <= 3:
+        mejor_ruta = list(range(n)) + [0]
+        mejor_dist = float(sum(matriz_dist[a, b] for a, b in zip(mejor_ruta, mejor_ruta[1:])))
+        return mejor_ruta, mejor_dist, [(list(mejor_ruta), mejor_dist)]
+
+    # La ciudad 0 es el inicio fijo; las ciudades 1..n-1 se mapean a los bits 0..m-1
+    m = n - 1
+    total_mascaras = 1 << m
+    sub = np.asarray(matriz_dist, dtype=float)[1:, 1:]
+
+    print(f" -> Subconjuntos: {total_mascaras}, tabla de {total_mascaras} x {m} estados...")
+
+    costos = np.full((total_mascaras, m), np.inf)
+    padres = np.full((total_mascaras, m), -1, dtype=np.int8)
+    for k in range(m):
+        costos[1 << k, k] = matriz_dist[0, k + 1]
+
+    mascaras = np.arange(total_mascaras)
+    tamanos = np.zeros(total_mascaras, dtype=np.int8)
+    for k in range(m):
+        tamanos += (mascaras >> k) & 1
+
+    for tam in range(2, m + 1):
+        capa = mascaras[tamanos == tam]
+        for k in range(m):
+            bit = 1 << k
+            destino = capa[(capa & bit) != 0]
+            origen = destino ^ bit
+            # costos[origen, j] es inf si j no pertenece a origen, así que el mínimo es válido
+            candidatos = costos[origen] + sub[:, k]
+            j = np.argmin(candidatos, axis=1)
+            costos[destino, k] = candidatos[np.arange(len(destino)), j]
+            padres[destino, k] = j
+        print(f"    Capa {tam}/{m} completada ({len(capa)} subconjuntos)")
+
+    # cerrar el ciclo volviendo a la ciudad 0
+    completa = total_mascaras - 1
+    cierre = costos[completa] + np.asarray(matriz_dist, dtype=float)[1:, 0]
+    ultimo = int(np.argmin(cierre))
+    mejor_dist = float(cierre[ultimo])
+
+    # reconstruir la ruta siguiendo los padres hacia atrás
+    ruta_inversa = []
+    mascara, k = completa, ultimo
+    while k != -1:
+        ruta_inversa.append(k + 1)
+        anterior = int(padres[mascara, k])
+        mascara ^= 1 << k
+        k = anterior
+    mejor_ruta = [0] + ruta_inversa[::-1] + [0]
+    historial = [(list(mejor_ruta), mejor_dist)]
+
+    ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+    print("-" * 80)
+    print(f" FIN HELD-KARP. Distancia óptima: {mejor_dist:.4f}")
+    print(f"    Ruta: {ruta_nombres}")
+
+    return mejor_ruta, mejor_dist, historial
@@ -0,0 +1,105 @@
+"""Kernels de bucles internos con backend opcional de Numba (variable TSP_BACKEND)."""
+import os
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba es opcional: sin él se usa el código Python de siempre
+    njit = None
+
+# Backend de los kernels, elegido con la variable de entorno TSP_BACKEND:
+# "auto" (numba si está instalado), "numba" (obligatorio) o "python".
+BACKENDS = ("auto", "numba", "python")
+BACKEND = os.environ.get("TSP_BACKEND", "auto").lower()
+if BACKEND not in BACKENDS:
+    raise ValueError(f"TSP_BACKEND debe ser uno de {BACKENDS}, no {BACKEND!r}")
+if BACKEND == "numba" and njit is None:
+    raise ImportError("TSP_BACKEND=numba pero numba no está instalado")
+USAR_NUMBA = njit is not None and BACKEND != "python"
+
+
+# ----------------------------------------------------------------------
+# Kernels: el mismo código corre en Python o compilado con @njit
+# ----------------------------------------------------------------------
+def _distancias_rutas(matriz, inicio, perms):
+    """Largo de cada ruta inicio -> perms[f] -> inicio, sumando las aristas en orden."""
+    dists = np.empty(len(perms))
+    for f in range(len(perms)):
+        total = 0.0
+        anterior = inicio
+        for actual in perms[f]:
+            total += matriz[anterior, actual]
+            anterior = actual
+        dists[f] = total + matriz[anterior, inicio]
+    return dists
+
+
+def _mas_cercano_libre(fila, visitadas):
+    """(índice, distancia) de la ciudad no visitada más cercana según `fila`; (-1, inf) si no queda ninguna."""
+    mejor = np.inf
+    siguiente = -1
+    for vecino in range(len(fila)):
+        if visitadas[vecino]:
+            continue
+        if fila[vecino] < mejor:
+            mejor = fila[vecino]
+            siguiente = vecino
+    return siguiente, mejor
+
+
+def _matriz_euclidiana(puntos):
+    """Matriz simétrica de distancias euclidianas entre las filas (lat, lon) de `puntos`."""
+    num = len(puntos)
+    matriz = np.zeros((num, num))
+    for i in range(num):
+        for j in range(i + 1, num):
+            d = np.sqrt((puntos[j, 0] - puntos[i, 0]) ** 2 + (puntos[j, 1] - puntos[i, 1]) ** 2)
+            matriz[i, j] = d
+            matriz[j, i] = d
+    return matriz
+
+
+def _compilar():
+    """Versiones @njit de los kernels (se compilan al primer uso y quedan en caché en disco)."""
+    return {nombre: njit(cache=True)(funcion) for nombre, funcion in (
+        ("distancias_rutas", _distancias_rutas),
+        ("mas_cercano_libre", _mas_cercano_libre),
+        ("matriz_euclidiana", _matriz_euclidiana),
+    )}
+
+
+_jit = _compilar() if USAR_NUMBA else None
+
+
+# ----------------------------------------------------------------------
+# API: elige el backend y adapta los argumentos (numba solo recibe arrays)
+# ----------------------------------------------------------------------
+def distancias_rutas(matriz, inicio, perms):
+    """
+    Largo de las rutas cerradas inicio -> perm -> inicio de un bloque de
+    permutaciones (lista de tuplas o array (m, n-1)), con el mismo orden de
+    suma que busqueda_exhaustiva. Retorna un array (m,).
+    """
+    if _jit is None:
+        return _distancias_rutas(matriz, inicio, perms)
+    return _jit["distancias_rutas"](np.asarray(matriz, dtype=float), inicio, np.asarray(perms, dtype=np.int64))
+
+
+def mas_cercano_libre(fila, visitadas):
+    """
+    Ciudad no visitada más cercana (empates: el menor índice) sobre una fila
+    de la matriz y una máscara booleana de visitadas.
+    Retorna (índice, distancia), o (-1, inf) si ya se visitaron todas.
+    """
+    if _jit is None:
+        return _mas_cercano_libre(fila, visitadas)
+    siguiente, mejor = _jit["mas_cercano_libre"](np.asarray(fila, dtype=float), np.asarray(visitadas, dtype=bool))
+    return int(siguiente), float(mejor)
+
+
+def matriz_euclidiana(puntos):
+    """Matriz (n, n) de distancias euclidianas de un array (n, 2) de coordenadas."""
+    puntos = np.asarray(puntos, dtype=float)
+    if _jit is None:
+        return _matriz_euclidiana(puntos)
+    return _jit["matriz_euclidiana"](puntos)
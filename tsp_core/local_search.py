@@ -0,0 +1,394 @@
+"""Búsqueda local para mejorar rutas ya construidas (2-opt, Or-opt y Lin-Kernighan)."""
+import time
+from collections import deque
+import numpy as np
+from candidates import DistanciasPuntos, vecinos_cercanos
+from tour import Tour
+
+# desde este tamaño la ruta usa la lista de dos niveles (inversiones en O(√n))
+UMBRAL_DOS_NIVELES = 5_000
+
+
+def _distancias(matriz_dist):
+    """La matriz como array de floats; una DistanciasPuntos (sin matriz) se usa tal cual."""
+    if isinstance(matriz_dist, DistanciasPuntos):
+        return matriz_dist
+    return np.asarray(matriz_dist, dtype=float)
+
+
+def _candidatos(matriz, k, vecinos):
+    """Listas de k candidatos por ciudad: las dadas (recortadas a k columnas) o calculadas."""
+    if vecinos is None:
+        if isinstance(matriz, DistanciasPuntos):
+            return vecinos_cercanos(k=k, puntos=matriz.puntos).tolist()
+        return vecinos_cercanos(matriz, k).tolist()
+    return np.asarray(vecinos)[:, :k].tolist()
+
+
+def _stats(t0, movimientos, iteraciones):
+    return {"movimientos": movimientos, "iteraciones": iteraciones, "tiempo": time.perf_counter() - t0}
+
+
+def _cerrar(tour, inicio):
+    """Ruta cerrada que empieza y termina en `inicio`."""
+    i = tour.index(inicio)
+    return tour[i:] + tour[:i] + [inicio]
+
+
+def _mover_2opt(recorrido, a, b, c, d):
+    """
+    Movimiento 2-opt por ciudades sobre un Tour: quita (a, b) y (c, d), donde
+    b sigue a `a` y d sigue a c en el mismo sentido, y agrega (a, c) y (b, d).
+    """
+    if recorrido.siguiente(a) == b:
+        recorrido.invertir(b, c)
+    else:
+        recorrido.invertir(c, b)
+
+
+def _agotado(t0, tiempo_limite, iteraciones, max_iteraciones, plazo=None):
+    """True si se acabó el presupuesto de tiempo (segundos) o de iteraciones, o venció `plazo`."""
+    if plazo is not None and plazo.vencido():
+        return True
+    if max_iteraciones is not None and iteraciones >= max_iteraciones:
+        return True
+    return tiempo_limite is not None and time.perf_counter() - t0 >= tiempo_limite
+
+
+def dos_opt(matriz_dist, ruta, k=8, tiempo_limite=None, max_iteraciones=None,
+            paso_historial=None, vecinos=None, plazo=None, callback=None):
+    """
+    Mejora 2-opt de una ruta cualquiera (lista cerrada, p. ej. la de
+    vecino_mas_cercano). Para cada ciudad `a` solo prueba como nueva arista
+    (a, c) a sus k vecinos más cercanos, y usa bits "no mirar": solo se
+    revisan las ciudades en la cola, que al inicio son todas y luego solo los
+    extremos de las aristas que cambió cada movimiento. Una pasada es O(n·k)
+    más el costo de las inversiones, que se hacen sobre un Tour (lista de dos
+    niveles desde UMBRAL_DOS_NIVELES ciudades: O(√n) por inversión).
+    - matriz_dist: matriz de distancias, o candidates.DistanciasPuntos para
+      rutas de instancias sin matriz (vale también para or_opt y lin_kernighan).
+    - tiempo_limite (s) / max_iteraciones: presupuesto opcional, como en or_opt.
+    - paso_historial: guarda la ruta cada tantos movimientos (por defecto
+      n // 100, es decir, cada movimiento en instancias pequeñas).
+    - vecinos: listas de candidatos ya calculadas (candidates.vecinos_cercanos);
+      si no se dan se calculan aquí.
+    - plazo (anytime.Plazo): al vencer se retorna la ruta hasta el momento;
+      callback(ruta, dist, stats) recibe cada ruta que se guarda en el historial.
+    Retorna ruta, dist_total, historial (rutas después de cada mejora)
+    """
+    t0 = time.perf_counter()
+    matriz = _distancias(matriz_dist)
+    inicio = ruta[0]
+    tour = list(ruta[:-1]) if ruta[0] == ruta[-1] and len(ruta) > 1 else list(ruta)
+    num = len(tour)
+    dist_inicial = float(matriz[tour, np.roll(tour, -1)].sum())
+    if paso_historial is None:
+        paso_historial = max(1, num // 100)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO MEJORA 2-OPT (LISTAS DE VECINOS) ':^80}")
+    print("=" * 80)
+    print(f" -> Distancia inicial: {dist_inicial:.4f} | k = {min(k, num - 1)} vecinos por ciudad")
+
+    historial = [_cerrar(tour, inicio)]
+    if num < 4:
+        return historial[0], dist_inicial, historial
+
+    vecinos = _candidatos(matriz, k, vecinos)
+    recorrido = Tour(tour, dos_niveles=num >= UMBRAL_DOS_NIVELES)
+    cola = deque(tour)
+    en_cola = [True] * num
+    movimientos = 0
+    iteraciones = 0
+    ganancia_total = 0.0
+
+    while cola and not _agotado(t0, tiempo_limite, iteraciones, max_iteraciones, plazo):
+        a = cola.popleft()
+        en_cola[a] = False
+        iteraciones += 1
+        mejorado = False
+        for vecina in (recorrido.siguiente, recorrido.anterior):
+            b = vecina(a)
+            d_ab = matriz[a, b]
+            for c in vecinos[a]:
+                d_ac = matriz[a, c]
+                if d_ac >= d_ab:
+                    break  # los vecinos están ordenados: ninguno más puede mejorar
+                d = vecina(c)
+                if c == b or d == a:
+                    continue
+                delta = d_ac + matriz[b, d] - d_ab - matriz[c, d]
+                if delta < -1e-10:
+                    # nuevas aristas (a, c) y (b, d)
+                    _mover_2opt(recorrido, a, b, c, d)
+                    movimientos += 1
+                    ganancia_total -= delta
+                    for x in (a, b, c, d):
+                        if not en_cola[x]:
+                            en_cola[x] = True
+                            cola.append(x)
+                    if movimientos % paso_historial == 0:
+                        historial.append(recorrido.a_lista(inicio))
+                        if callback:
+                            callback(historial[-1], dist_inicial - ganancia_total,
+                                     _stats(t0, movimientos, iteraciones))
+                    mejorado = True
+                    break
+            if mejorado:
+                break
+
+    ruta_final = recorrido.a_lista(inicio)
+    dist_total = float(matriz[ruta_final[:-1], ruta_final[1:]].sum())
+    if historial[-1] != ruta_final:
+        historial.append(ruta_final)
+        if callback:
+            callback(ruta_final, dist_total, _stats(t0, movimientos, iteraciones))
+
+    mejora = (dist_inicial - dist_total) / dist_inicial * 100 if dist_inicial > 0 else 0.0
+    print("-" * 80)
+    print(f" FIN 2-OPT. Movimientos: {movimientos} | Mejora: {ganancia_total:.4f} ({mejora:.2f}%)")
+    print(f"    Distancia: {dist_inicial:.4f} -> {dist_total:.4f}")
+
+    return ruta_final, dist_total, historial
+
+
+def or_opt(matriz_dist, ruta, k=8, tiempo_limite=None, max_iteraciones=None,
+           paso_historial=None, vecinos=None, plazo=None, callback=None):
+    """
+    Mejora Or-opt: mueve tramos de 1 a 3 ciudades consecutivas (en cualquier
+    sentido) entre otras dos ciudades vecinas. Cada movimiento se evalúa por
+    su delta (tres aristas que salen, tres que entran) sin recalcular la ruta;
+    los destinos son las aristas junto a los k vecinos más cercanos de los
+    extremos del tramo, y se usan bits "no mirar" como en dos_opt. La ruta
+    vive en un Tour y cada traslado se aplica como dos o tres movimientos
+    2-opt, sin recorrer la lista completa (O(√n) con la lista de dos niveles).
+    - tiempo_limite (s) / max_iteraciones: presupuesto; al agotarse se
+      retorna la mejor ruta hasta el momento.
+    - vecinos, plazo y callback: como en dos_opt.
+    Retorna ruta, dist_total, historial (rutas después de cada mejora)
+    """
+    t0 = time.perf_counter()
+    matriz = _distancias(matriz_dist)
+    inicio = ruta[0]
+    tour = list(ruta[:-1]) if ruta[0] == ruta[-1] and len(ruta) > 1 else list(ruta)
+    num = len(tour)
+    dist_inicial = float(matriz[tour, np.roll(tour, -1)].sum())
+    if paso_historial is None:
+        paso_historial = max(1, num // 100)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO MEJORA OR-OPT (TRAMOS DE 1 A 3) ':^80}")
+    print("=" * 80)
+    print(f" -> Distancia inicial: {dist_inicial:.4f}")
+
+    historial = [_cerrar(tour, inicio)]
+    if num < 5:
+        return historial[0], dist_inicial, historial
+
+    vecinos = _candidatos(matriz, k, vecinos)
+    recorrido = Tour(tour, dos_niveles=num >= UMBRAL_DOS_NIVELES)
+    siguiente, anterior = recorrido.siguiente, recorrido.anterior
+    cola = deque(tour)
+    en_cola = [True] * num
+    movimientos = 0
+    iteraciones = 0
+    ganancia_total = 0.0
+
+    while cola and not _agotado(t0, tiempo_limite, iteraciones, max_iteraciones, plazo):
+        s = cola.popleft()
+        en_cola[s] = False
+        iteraciones += 1
+        tramo = [s]
+        for largo in (1, 2, 3):
+            if largo > 1:
+                tramo.append(siguiente(tramo[-1]))
+            primero, ultimo = tramo[0], tramo[-1]
+            p, nx = anterior(primero), siguiente(ultimo)
+            ganancia_quitar = matriz[p, primero] + matriz[ultimo, nx] - matriz[p, nx]
+
+            mejor = None
+            for extremo in (primero, ultimo):
+                for c in vecinos[extremo]:
+                    if matriz[extremo, c] >= ganancia_quitar:
+                        break
+                    if c in tramo:
+                        continue
+                    for x, y in ((c, siguiente(c)), (anterior(c), c)):
+                        if x in tramo or y in tramo:
+                            continue
+                        base = matriz[x, y]
+                        directo = matriz[x, primero] + matriz[ultimo, y] - base
+                        invertido = matriz[x, ultimo] + matriz[primero, y] - base
+                        costo, invertir = (directo, False) if directo <= invertido else (invertido, True)
+                        delta = costo - ganancia_quitar
+                        if delta < -1e-10 and (mejor is None or delta < mejor[0]):
+                            mejor = (delta, x, y, invertir)
+            if mejor is None:
+                continue
+
+            delta, x, y, invertir = mejor
+            # p [primero..ultimo] nx .. x y  ->  p nx .. x [ultimo..primero] y
+            _mover_2opt(recorrido, p, primero, x, y)
+            _mover_2opt(recorrido, p, x, nx, ultimo)
+            if not invertir:
+                # ... x [primero..ultimo] y
+                _mover_2opt(recorrido, x, ultimo, primero, y)
+            movimientos += 1
+            ganancia_total -= delta
+            for c in (p, nx, x, y, primero, ultimo):
+                if not en_cola[c]:
+                    en_cola[c] = True
+                    cola.append(c)
+            if movimientos % paso_historial == 0:
+                historial.append(recorrido.a_lista(inicio))
+                if callback:
+                    callback(historial[-1], dist_inicial - ganancia_total, _stats(t0, movimientos, iteraciones))
+            break
+
+    ruta_final = recorrido.a_lista(inicio)
+    dist_total = float(matriz[ruta_final[:-1], ruta_final[1:]].sum())
+    if historial[-1] != ruta_final:
+        historial.append(ruta_final)
+        if callback:
+            callback(ruta_final, dist_total, _stats(t0, movimientos, iteraciones))
+
+    mejora = (dist_inicial - dist_total) / dist_inicial * 100 if dist_inicial > 0 else 0.0
+    print("-" * 80)
+    print(f" FIN OR-OPT. Movimientos: {movimientos} | Mejora: {ganancia_total:.4f} ({mejora:.2f}%)")
+    print(f"    Distancia: {dist_inicial:.4f} -> {dist_total:.4f} | Iteraciones: {iteraciones}")
+
+    return ruta_final, dist_total, historial
+
+
+def _candidatos_lk(matriz, recorrido, vecinos, t1, t2, ganancia):
+    """
+    Pasos posibles desde t2 (quitar (t1, t2) ya abierta): (valor, t3, t4) con t3 entre
+    los vecinos de t2 y ganancia parcial positiva, de mayor a menor valor.
+    """
+    # sentido actual de la ruta visto desde t1 (las inversiones pueden darla vuelta)
+    previa = recorrido.anterior if recorrido.siguiente(t1) == t2 else recorrido.siguiente
+    candidatos = []
+    for t3 in vecinos[t2]:
+        g1 = ganancia - matriz[t2, t3]
+        if g1 <= 0:
+            break
+        t4 = previa(t3)
+        if t3 == t1 or t3 == t2 or t4 == t2:
+            continue
+        # ganancia parcial tras agregar (t2, t3) y quitar (t4, t3)
+        candidatos.append((g1 + matriz[t4, t3], t3, t4))
+    candidatos.sort(reverse=True)
+    return candidatos
+
+
+def _cadena_lk(matriz, recorrido, vecinos, t1, t2, primero, profundidad):
+    """
+    Aplica una cadena de movimientos 2-opt desde (t1, t2) empezando por `primero`
+    y deja aplicado solo el prefijo con mayor ganancia al cerrar con (t1, t4).
+    Retorna (ganancia, ciudades tocadas); ganancia 0 si la ruta quedó igual.
+    """
+    cadena = []
+    mejor_ganancia, mejor_largo = 1e-10, 0
+    tocadas = {t1, t2}
+    paso = primero
+    while paso is not None:
+        valor, t3, t4 = paso
+        _mover_2opt(recorrido, t1, t2, t4, t3)
+        cadena.append((t1, t2, t4, t3))
+        tocadas.update((t3, t4))
+        cierre = valor - matriz[t4, t1]
+        if cierre > mejor_ganancia:
+            mejor_ganancia, mejor_largo = cierre, len(cadena)
+        t2 = t4
+        if len(cadena) >= profundidad:
+            break
+        siguientes = _candidatos_lk(matriz, recorrido, vecinos, t1, t2, valor)
+        paso = siguientes[0] if siguientes else None
+
+    # deshacer lo que sigue al mejor prefijo, en orden inverso: tras cada movimiento
+    # quedaron (a, c) y (b, d), que se vuelven a cambiar por (a, b) y (c, d)
+    for a, b, c, d in reversed(cadena[mejor_largo:]):
+        if recorrido.siguiente(a) == c:
+            _mover_2opt(recorrido, a, c, b, d)
+        else:
+            _mover_2opt(recorrido, d, b, c, a)
+    return (mejor_ganancia if mejor_largo else 0.0), tocadas
+
+
+def lin_kernighan(matriz_dist, ruta, k=8, profundidad=6, amplitud=5, tiempo_limite=None,
+                  max_iteraciones=None, paso_historial=None, vecinos=None, plazo=None, callback=None):
+    """
+    Búsqueda de profundidad variable estilo Lin-Kernighan, como cadena de
+    movimientos 2-opt: desde t1 se quita (t1, t2), se agrega (t2, t3) con t3
+    entre los k vecinos de t2 y se cierra con (t1, t4); si la ganancia parcial
+    sigue siendo positiva se continúa desde t4, hasta `profundidad` niveles.
+    Se aplica el prefijo de la cadena con mejor ganancia (el resto se deshace);
+    si no hay ganancia se prueban hasta `amplitud` alternativas para el primer t3.
+    Las ganancias se acumulan por deltas, sin recalcular la ruta.
+    - tiempo_limite (s) / max_iteraciones: presupuesto; al agotarse se
+      retorna la mejor ruta hasta el momento.
+    - vecinos, plazo y callback: como en dos_opt.
+    Retorna ruta, dist_total, historial (rutas después de cada mejora)
+    """
+    t0 = time.perf_counter()
+    matriz = _distancias(matriz_dist)
+    inicio = ruta[0]
+    tour = list(ruta[:-1]) if ruta[0] == ruta[-1] and len(ruta) > 1 else list(ruta)
+    num = len(tour)
+    dist_inicial = float(matriz[tour, np.roll(tour, -1)].sum())
+    if paso_historial is None:
+        paso_historial = max(1, num // 100)
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO MEJORA LIN-KERNIGHAN (PROFUNDIDAD VARIABLE) ':^80}")
+    print("=" * 80)
+    print(f" -> Distancia inicial: {dist_inicial:.4f} | profundidad máxima: {profundidad}")
+
+    historial = [_cerrar(tour, inicio)]
+    if num < 5:
+        return historial[0], dist_inicial, historial
+
+    vecinos = _candidatos(matriz, k, vecinos)
+    recorrido = Tour(tour, dos_niveles=num >= UMBRAL_DOS_NIVELES)
+    cola = deque(tour)
+    en_cola = [True] * num
+    movimientos = 0
+    iteraciones = 0
+    ganancia_total = 0.0
+
+    while cola and not _agotado(t0, tiempo_limite, iteraciones, max_iteraciones, plazo):
+        t1 = cola.popleft()
+        en_cola[t1] = False
+        iteraciones += 1
+        for vecina in (recorrido.siguiente, recorrido.anterior):
+            t2 = vecina(t1)
+            ganancia, tocadas = 0.0, ()
+            # amplitud en el primer nivel: si una cadena no mejora se prueba el siguiente t3
+            for primero in _candidatos_lk(matriz, recorrido, vecinos, t1, t2, matriz[t1, t2])[:amplitud]:
+                ganancia, tocadas = _cadena_lk(matriz, recorrido, vecinos, t1, t2, primero, profundidad)
+                if ganancia > 0:
+                    break
+            if ganancia > 0:
+                movimientos += 1
+                ganancia_total += ganancia
+                for c in tocadas:
+                    if not en_cola[c]:
+                        en_cola[c] = True
+                        cola.append(c)
+                if movimientos % paso_historial == 0:
+                    historial.append(recorrido.a_lista(inicio))
+                    if callback:
+                        callback(historial[-1], dist_inicial - ganancia_total,
+                                 _stats(t0, movimientos, iteraciones))
+                break
+
+    ruta_final = recorrido.a_lista(inicio)
+    dist_total = float(matriz[ruta_final[:-1], ruta_final[1:]].sum())
+    if historial[-1] != ruta_final:
+        historial.append(ruta_final)
+        if callback:
+            callback(ruta_final, dist_total, _stats(t0, movimientos, iteraciones))
+
+    mejora = (dist_inicial - dist_total) / dist_inicial * 100 if dist_inicial > 0 else 0.0
+    print("-" * 80)
+    print(f" FIN LIN-KERNIGHAN. Movimientos: {movimientos} | Mejora: {ganancia_total:.4f} ({mejora:.2f}%)")
+    print(f"    Distancia: {dist_inicial:.4f} -> {dist_total:.4f} | Iteraciones: {iteraciones}")
+
+    return ruta_final, dist_total, historial
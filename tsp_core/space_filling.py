@@ -0,0 +1,74 @@
+"""Ruta por curva de Hilbert (sin matriz de distancias) para instancias enormes."""
+import numpy as np
+
+# Desde este tamaño, por defecto no se guardan rutas parciales: unas 100 copias
+# parciales de la ruta son O(100·n) enteros, lo que una ruta sin matriz quiere evitar
+MAX_CIUDADES_HISTORIAL = 10_000
+
+
+def indice_hilbert(puntos, orden=16):
+    """
+    Índice de cada punto (array (n, 2) de (lat, lon)) sobre la curva de Hilbert
+    de una rejilla 2^orden x 2^orden que cubre las coordenadas. Vectorizado:
+    un paso de NumPy por nivel de la curva.
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    lado = 1 << orden
+    minimo = puntos.min(axis=0)
+    extension = float((puntos.max(axis=0) - minimo).max()) or 1.0
+    celdas = ((puntos - minimo) / extension * (lado - 1)).astype(np.int64)
+    y, x = celdas[:, 0], celdas[:, 1]  # lat -> y, lon -> x
+
+    indices = np.zeros(len(puntos), dtype=np.int64)
+    s = lado >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        indices += s * s * ((3 * rx) ^ ry)
+        # rotar el cuadrante para que el siguiente nivel siga la curva
+        voltear = ~ry & rx
+        x = np.where(voltear, lado - 1 - x, x)
+        y = np.where(voltear, lado - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return indices
+
+
+def ruta_hilbert(puntos, inicio=0, paso_historial=None):
+    """
+    Ruta por curva de Hilbert: ordena las ciudades por su índice sobre la curva
+    y usa ese orden como ruta. No necesita matriz de distancias y es O(n log n),
+    útil como respuesta inmediata (o semilla de búsqueda local) en instancias enormes.
+    - puntos: array (n, 2) de coordenadas (lat, lon).
+    - paso_historial: guarda una ruta parcial cada tantas ciudades (por defecto
+      n // 100, es decir, todas para instancias pequeñas; 0 guarda solo la ruta
+      final, el defecto desde MAX_CIUDADES_HISTORIAL ciudades).
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    num = len(puntos)
+    if paso_historial is None:
+        paso_historial = max(1, num // 100) if num <= MAX_CIUDADES_HISTORIAL else 0
+    print("\n" + "=" * 80)
+    print(f"{' INICIANDO RUTA POR CURVA DE HILBERT ':^80}")
+    print("=" * 80)
+
+    orden = np.argsort(indice_hilbert(puntos), kind="stable")
+    # rotar para empezar (y terminar) en `inicio`
+    desplazamiento = int(np.flatnonzero(orden == inicio)[0])
+    orden = np.roll(orden, -desplazamiento)
+    ruta = orden.tolist() + [inicio]
+
+    tramos = puntos[orden] - puntos[np.roll(orden, -1)]
+    dist_total = float(np.sqrt((tramos ** 2).sum(axis=1)).sum())
+    historial = [ruta[:k] for k in range(1, num + 1, paso_historial)] if paso_historial else []
+    if historial and historial[-1] != ruta[:-1]:
+        historial.append(ruta[:-1])
+    historial.append(ruta)
+
+    print(f" -> {num} ciudades ordenadas por índice de Hilbert")
+    print("-" * 80)
+    print(f"FIN CURVA DE HILBERT. Distancia total: {dist_total:.4f}")
+    print("-" * 80)
+
+    return ruta, dist_total, historial
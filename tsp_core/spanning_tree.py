@@ -0,0 +1,39 @@
+"""Árbol de expansión mínima (Prim) para cotas y constructores TSP."""
+import numpy as np
+
+
+def arbol_expansion_minima(matriz_dist, nodos=None):
+    """
+    Árbol de expansión mínima (Prim vectorizado, O(k²) con k = cantidad de nodos).
+    - nodos: lista opcional de índices; si se indica, el árbol se construye
+      solo sobre esas ciudades (submatriz).
+    Retorna: costo_total, padres
+    (padres[i] es el índice (en la matriz original) del padre de nodos[i]; -1 para la raíz)
+    """
+    if nodos is None:
+        nodos = np.arange(len(matriz_dist))
+    else:
+        nodos = np.asarray(nodos)
+    k = len(nodos)
+    padres = np.full(k, -1)
+    if k <= 1:
+        return 0.0, padres
+
+    sub = np.asarray(matriz_dist, dtype=float)[np.ix_(nodos, nodos)]
+    en_arbol = np.zeros(k, dtype=bool)
+    en_arbol[0] = True
+    mejor = sub[0].copy()
+    padre_local = np.zeros(k, dtype=int)
+    costo_total = 0.0
+
+    for _ in range(k - 1):
+        j = int(np.argmin(np.where(en_arbol, np.inf, mejor)))
+        costo_total += mejor[j]
+        en_arbol[j] = True
+        padres[j] = nodos[padre_local[j]]
+        # actualizar la arista más barata hacia el árbol para los nodos restantes
+        mas_cerca = (sub[j] < mejor) & ~en_arbol
+        mejor[mas_cerca] = sub[j, mas_cerca]
+        padre_local[mas_cerca] = j
+
+    return float(costo_total), padres
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# los módulos de tsp_core se importan planos (import kernels), como al correr los scripts
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
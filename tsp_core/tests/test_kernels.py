@@ -0,0 +1,131 @@
+"""Kernels y sus llamadores: backend Python contra resultados de referencia, y numba contra Python."""
+import itertools
+import numpy as np
+import pytest
+
+import kernels
+from data import n
+from distance import construir_matriz_distancias, obtener_coordenadas
+from exhaustive import busqueda_exhaustiva
+from nearest_neighbor import vecino_mas_cercano
+
+
+def _matriz_referencia(puntos):
+    diferencias = puntos[:, None, :] - puntos[None, :, :]
+    return np.sqrt((diferencias ** 2).sum(axis=-1))
+
+
+def _optimo_referencia(matriz):
+    """Largo óptimo por fuerza bruta vectorizada (ciudad 0 fija)."""
+    perms = np.array(list(itertools.permutations(range(1, len(matriz)))))
+    ceros = np.zeros((len(perms), 1), dtype=int)
+    rutas = np.hstack([ceros, perms, ceros])
+    return float(matriz[rutas[:, :-1], rutas[:, 1:]].sum(axis=1).min())
+
+
+def _vecino_referencia(matriz, inicio=0):
+    """Vecino más cercano con argmin sobre la fila enmascarada (empates: menor índice)."""
+    ruta = [inicio]
+    visitadas = np.zeros(len(matriz), dtype=bool)
+    visitadas[inicio] = True
+    while not visitadas.all():
+        fila = np.where(visitadas, np.inf, matriz[ruta[-1]])
+        ruta.append(int(np.argmin(fila)))
+        visitadas[ruta[-1]] = True
+    return ruta + [inicio]
+
+
+def _largo(matriz, ruta):
+    return float(matriz[ruta[:-1], ruta[1:]].sum())
+
+
+@pytest.fixture
+def puntos():
+    return np.random.default_rng(0).uniform(-120, 120, size=(60, 2))
+
+
+@pytest.fixture
+def backend_python(monkeypatch):
+    monkeypatch.setattr(kernels, "_jit", None)
+
+
+@pytest.fixture
+def jit():
+    pytest.importorskip("numba")
+    return kernels._compilar()
+
+
+# ----------------------------------------------------------------------
+# backend Python contra referencias independientes
+# ----------------------------------------------------------------------
+def test_matriz_euclidiana(backend_python, puntos):
+    assert np.allclose(kernels.matriz_euclidiana(puntos), _matriz_referencia(puntos), rtol=0, atol=1e-12)
+
+
+def test_distancias_rutas(backend_python, puntos):
+    matriz = _matriz_referencia(puntos)
+    rng = np.random.default_rng(1)
+    perms = [tuple(rng.permutation(np.arange(1, 60)).tolist()) for _ in range(50)]
+    esperado = [_largo(matriz, [0, *p, 0]) for p in perms]
+    assert np.allclose(kernels.distancias_rutas(matriz, 0, perms), esperado, rtol=0, atol=1e-9)
+
+
+def test_mas_cercano_libre(backend_python, puntos):
+    matriz = _matriz_referencia(puntos)
+    rng = np.random.default_rng(2)
+    for fila in range(60):
+        visitadas = rng.random(60) < 0.5
+        visitadas[fila] = True
+        indice, dist = kernels.mas_cercano_libre(matriz[fila], visitadas)
+        libre = np.where(visitadas, np.inf, matriz[fila])
+        assert indice == int(np.argmin(libre)) and dist == libre.min()
+    assert kernels.mas_cercano_libre(matriz[0], np.ones(60, dtype=bool)) == (-1, np.inf)
+
+
+def test_construir_matriz_distancias(backend_python):
+    assert np.allclose(construir_matriz_distancias(), _matriz_referencia(obtener_coordenadas()), rtol=0, atol=1e-12)
+
+
+def test_busqueda_exhaustiva(backend_python):
+    matriz = construir_matriz_distancias()
+    ruta, dist, _ = busqueda_exhaustiva(matriz)
+    assert sorted(ruta[:-1]) == list(range(n)) and ruta[0] == ruta[-1] == 0
+    assert np.isclose(dist, _largo(matriz, ruta))
+    assert np.isclose(dist, _optimo_referencia(matriz))
+
+
+def test_vecino_mas_cercano(backend_python):
+    matriz = construir_matriz_distancias()
+    ruta, dist, _ = vecino_mas_cercano(matriz)
+    assert list(ruta) == _vecino_referencia(matriz)
+    assert np.isclose(dist, _largo(matriz, ruta))
+
+
+# ----------------------------------------------------------------------
+# numba contra Python (se omiten si numba no está instalado)
+# ----------------------------------------------------------------------
+def test_paridad_kernels(jit, puntos):
+    matriz = kernels._matriz_euclidiana(puntos)
+    assert np.allclose(jit["matriz_euclidiana"](puntos), matriz, rtol=0, atol=1e-12)
+
+    rng = np.random.default_rng(0)
+    perms = np.array([rng.permutation(np.arange(1, 60)) for _ in range(500)])
+    assert np.array_equal(jit["distancias_rutas"](matriz, 0, perms),
+                          kernels._distancias_rutas(matriz, 0, [tuple(p) for p in perms.tolist()]))
+
+    for fila in range(60):
+        visitadas = rng.random(60) < fila / 60
+        assert tuple(jit["mas_cercano_libre"](matriz[fila], visitadas)) == \
+            kernels._mas_cercano_libre(matriz[fila], visitadas)
+
+
+@pytest.mark.parametrize("funcion", [busqueda_exhaustiva, vecino_mas_cercano])
+def test_paridad_llamadores(jit, monkeypatch, funcion):
+    resultados = []
+    for backend in (None, jit):
+        monkeypatch.setattr(kernels, "_jit", backend)
+        matriz = construir_matriz_distancias()
+        resultados.append((matriz, *funcion(matriz)))
+    (matriz_py, ruta_py, dist_py, _), (matriz_jit, ruta_jit, dist_jit, _) = resultados
+    assert np.allclose(matriz_py, matriz_jit, rtol=0, atol=1e-12)
+    assert list(ruta_py) == list(ruta_jit) and dist_py == dist_jit
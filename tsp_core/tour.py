@@ -0,0 +1,202 @@
+"""Estructura Tour compacta (arreglo o lista de dos niveles) para rutas grandes."""
+from array import array
+import math
+
+
+class _Segmento:
+    """Tramo de la lista de dos niveles: ciudades en `ciudades` y bit de inversión."""
+    __slots__ = ("ciudades", "invertido", "rango")
+
+    def __init__(self, ciudades, invertido=False):
+        self.ciudades = ciudades
+        self.invertido = invertido
+        self.rango = 0
+
+    def primera(self):
+        return self.ciudades[-1] if self.invertido else self.ciudades[0]
+
+    def ultima(self):
+        return self.ciudades[0] if self.invertido else self.ciudades[-1]
+
+
+class Tour:
+    """
+    Ruta cíclica compacta con índice de posiciones.
+    - Modo arreglo (por defecto): orden en array('i') y posición de cada ciudad;
+      siguiente/anterior/entre en O(1) e invertir en O(n) (el lado más corto).
+    - Modo dos niveles (dos_niveles=True): ~√n segmentos con bit de inversión;
+      siguiente/anterior/entre siguen en O(1) e invertir cuesta O(√n): solo se
+      parten los dos segmentos de los extremos y se invierte el orden de los
+      segmentos intermedios cambiando su bit.
+    Invertir un camino puede dejar invertido el sentido global de la ruta
+    (se invierte el lado más corto); la ruta cíclica resultante es la misma.
+    """
+    __slots__ = ("n", "dos_niveles", "_orden", "_pos", "_segmentos", "_seg_de", "_idx", "_tam")
+
+    def __init__(self, ruta, dos_niveles=False):
+        if len(ruta) > 1 and ruta[0] == ruta[-1]:
+            ruta = ruta[:-1]
+        self.n = len(ruta)
+        self.dos_niveles = dos_niveles
+        if dos_niveles:
+            self._tam = max(8, int(math.sqrt(self.n)))
+            self._construir_segmentos(list(ruta))
+            self._orden = self._pos = None
+        else:
+            self._orden = array('i', ruta)
+            self._pos = array('i', [0]) * self.n
+            for i, c in enumerate(ruta):
+                self._pos[c] = i
+            self._segmentos = self._seg_de = self._idx = None
+
+    def __len__(self):
+        return self.n
+
+    # ------------------------------------------------------------------
+    # consultas
+    # ------------------------------------------------------------------
+    def siguiente(self, c):
+        if not self.dos_niveles:
+            i = self._pos[c] + 1
+            return self._orden[i if i < self.n else 0]
+        seg = self._seg_de[c]
+        i = self._idx[c] + (-1 if seg.invertido else 1)
+        if 0 <= i < len(seg.ciudades):
+            return seg.ciudades[i]
+        return self._segmentos[(seg.rango + 1) % len(self._segmentos)].primera()
+
+    def anterior(self, c):
+        if not self.dos_niveles:
+            return self._orden[self._pos[c] - 1]
+        seg = self._seg_de[c]
+        i = self._idx[c] + (1 if seg.invertido else -1)
+        if 0 <= i < len(seg.ciudades):
+            return seg.ciudades[i]
+        return self._segmentos[seg.rango - 1].ultima()
+
+    def _clave(self, c):
+        """Posición de `c` en el recorrido, comparable entre ciudades."""
+        if not self.dos_niveles:
+            return self._pos[c]
+        seg = self._seg_de[c]
+        i = self._idx[c]
+        return seg.rango, (len(seg.ciudades) - 1 - i if seg.invertido else i)
+
+    def entre(self, a, b, c):
+        """True si, avanzando desde `a`, se llega a `b` antes que a `c` (o b es a o c)."""
+        ka, kb, kc = self._clave(a), self._clave(b), self._clave(c)
+        if ka <= kc:
+            return ka <= kb <= kc
+        return kb >= ka or kb <= kc
+
+    def a_lista(self, inicio=None):
+        """Ruta cerrada como lista (empieza y termina en `inicio`, o en la primera ciudad)."""
+        if self.dos_niveles:
+            orden = []
+            for seg in self._segmentos:
+                orden.extend(reversed(seg.ciudades) if seg.invertido else seg.ciudades)
+        else:
+            orden = self._orden.tolist()
+        if inicio is not None:
+            i = orden.index(inicio)
+            orden = orden[i:] + orden[:i]
+        return orden + orden[:1]
+
+    def distancia(self, matriz):
+        ruta = self.a_lista()
+        return float(sum(matriz[a, b] for a, b in zip(ruta, ruta[1:])))
+
+    # ------------------------------------------------------------------
+    # inversión
+    # ------------------------------------------------------------------
+    def invertir(self, a, b):
+        """Invierte el camino que va de `a` a `b` (avanzando): ... p a ... b q ... -> ... p b ... a q ..."""
+        if self.dos_niveles:
+            self._invertir_segmentos(a, b)
+            return
+        orden, pos, n = self._orden, self._pos, self.n
+        i, j = pos[a], pos[b]
+        largo = (j - i) % n + 1
+        if 2 * largo > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            largo = n - largo
+        for _ in range(largo // 2):
+            x, y = orden[i], orden[j]
+            orden[i], orden[j] = y, x
+            pos[x], pos[y] = j, i
+            i += 1
+            if i == n:
+                i = 0
+            j -= 1
+            if j < 0:
+                j = n - 1
+
+    def intercambiar(self, a, b):
+        """Intercambia las posiciones de las ciudades `a` y `b` (O(1) en ambos modos)."""
+        if self.dos_niveles:
+            sa, sb = self._seg_de[a], self._seg_de[b]
+            ia, ib = self._idx[a], self._idx[b]
+            sa.ciudades[ia], sb.ciudades[ib] = b, a
+            self._seg_de[a], self._seg_de[b] = sb, sa
+            self._idx[a], self._idx[b] = ib, ia
+            return
+        i, j = self._pos[a], self._pos[b]
+        self._orden[i], self._orden[j] = b, a
+        self._pos[a], self._pos[b] = j, i
+
+    def _construir_segmentos(self, orden):
+        tam = self._tam
+        self._segmentos = [_Segmento(array('i', orden[i:i + tam])) for i in range(0, len(orden), tam)]
+        self._seg_de = [None] * self.n
+        self._idx = array('i', [0]) * self.n
+        for r, seg in enumerate(self._segmentos):
+            seg.rango = r
+            for i, c in enumerate(seg.ciudades):
+                self._seg_de[c] = seg
+                self._idx[c] = i
+
+    def _partir_antes(self, c):
+        """Parte el segmento de `c` para que `c` quede al comienzo (en el sentido del recorrido)."""
+        seg = self._seg_de[c]
+        if seg.primera() == c:
+            return
+        i = self._idx[c]
+        # cantidad de ciudades del segmento que quedan antes de c en el recorrido
+        if seg.invertido:
+            delante, detras = seg.ciudades[i + 1:], seg.ciudades[:i + 1]
+        else:
+            delante, detras = seg.ciudades[:i], seg.ciudades[i:]
+        nuevo = _Segmento(delante, seg.invertido)
+        seg.ciudades = detras
+        for k, x in enumerate(nuevo.ciudades):
+            self._seg_de[x] = nuevo
+            self._idx[x] = k
+        for k, x in enumerate(seg.ciudades):
+            self._idx[x] = k
+        self._segmentos.insert(seg.rango, nuevo)
+        for r in range(seg.rango, len(self._segmentos)):
+            self._segmentos[r].rango = r
+
+    def _invertir_segmentos(self, a, b):
+        if a == b:
+            return
+        q = self.siguiente(b)
+        self._partir_antes(a)
+        if q != a:
+            self._partir_antes(q)
+        ra, rb = self._seg_de[a].rango, self._seg_de[b].rango
+        m = len(self._segmentos)
+        cantidad = (rb - ra) % m + 1
+        if 2 * cantidad > m:
+            # invertir los segmentos complementarios (misma ruta cíclica)
+            ra, rb = (rb + 1) % m, (ra - 1) % m
+            cantidad = m - cantidad
+        rangos = [(ra + k) % m for k in range(cantidad)]
+        tramo = [self._segmentos[r] for r in rangos]
+        for r, seg in zip(rangos, reversed(tramo)):
+            seg.invertido = not seg.invertido
+            seg.rango = r
+            self._segmentos[r] = seg
+        if len(self._segmentos) > 4 * max(1, self.n // self._tam):
+            # demasiados segmentos pequeños: reconstruir balanceado (amortizado)
+            self._construir_segmentos(self.a_lista()[:-1])
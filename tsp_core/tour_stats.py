@@ -0,0 +1,125 @@
+"""Estadísticas de búsqueda: K mejores rutas e histograma de largos."""
+import heapq
+import numpy as np
+
+
+class TopRutas:
+    """
+    Las K mejores rutas vistas durante una búsqueda (heap acotado de tamaño K).
+    Los empates se resuelven por orden lexicográfico de la ruta, así el resultado
+    no depende del orden en que se agregan (serial, por bloques o en paralelo).
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self._heap = []  # raíz = peor ruta guardada: (-dist, ruta_negada, ruta)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def peor_dist(self):
+        """Distancia de la K-ésima mejor ruta (inf mientras no haya K rutas)."""
+        return -self._heap[0][0] if len(self._heap) >= self.k else float('inf')
+
+    def agregar(self, ruta, dist):
+        if self.k <= 0 or dist > self.peor_dist():
+            return
+        dist = float(dist)
+        entrada = (-dist, [-c for c in ruta], list(ruta))
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entrada)
+        elif entrada > self._heap[0]:
+            heapq.heapreplace(self._heap, entrada)
+
+    def agregar_lote(self, dists, construir_ruta):
+        """
+        Agrega un bloque de distancias (array) sin recorrerlo en Python:
+        solo las (a lo sumo) K más cortas que mejoran el heap se convierten
+        en ruta con `construir_ruta(fila)`.
+        """
+        if self.k <= 0:
+            return
+        filas = np.flatnonzero(dists <= self.peor_dist())
+        if len(filas) > self.k:
+            # conservar empates en el límite para respetar el desempate lexicográfico
+            limite = np.partition(dists[filas], self.k - 1)[self.k - 1]
+            filas = filas[dists[filas] <= limite]
+        for fila in filas:
+            self.agregar(construir_ruta(fila), dists[fila])
+
+    def fusionar(self, otro):
+        for neg_dist, _, ruta in otro._heap:
+            self.agregar(ruta, -neg_dist)
+
+    def mejores(self):
+        """Lista de (ruta, dist) ordenada de menor a mayor distancia."""
+        return [(ruta, -neg_dist) for neg_dist, _, ruta in sorted(self._heap, reverse=True)]
+
+
+class HistogramaDistancias:
+    """
+    Histograma en streaming de largos de ruta con intervalos fijos en [minimo, maximo].
+    Los valores fuera de rango se acumulan en el primer/último intervalo.
+    """
+
+    def __init__(self, minimo, maximo, bins=50):
+        self.minimo = float(minimo)
+        self.maximo = float(maximo)
+        self.bins = bins
+        self.conteos = np.zeros(bins, dtype=np.int64)
+        self._ancho = (self.maximo - self.minimo) / bins or 1.0
+
+    @classmethod
+    def para_matriz(cls, matriz_dist, bins=50):
+        """
+        Rango que contiene cualquier ruta de la instancia: cada ciudad sale por
+        exactamente una arista, así que la ruta mide entre la suma de las aristas
+        mínimas y la suma de las máximas de cada fila.
+        """
+        matriz = np.asarray(matriz_dist, dtype=float)
+        sin_diagonal = matriz + np.diag(np.full(len(matriz), np.inf))
+        return cls(sin_diagonal.min(axis=1).sum(), matriz.max(axis=1).sum(), bins)
+
+    @property
+    def bordes(self):
+        return np.linspace(self.minimo, self.maximo, self.bins + 1)
+
+    def agregar(self, dist):
+        i = int((dist - self.minimo) / self._ancho)
+        self.conteos[min(max(i, 0), self.bins - 1)] += 1
+
+    def agregar_lote(self, dists):
+        indices = ((np.asarray(dists) - self.minimo) / self._ancho).astype(np.int64)
+        self.conteos += np.bincount(np.clip(indices, 0, self.bins - 1), minlength=self.bins)
+
+    def fusionar(self, otro):
+        if (otro.minimo, otro.maximo, otro.bins) != (self.minimo, self.maximo, self.bins):
+            raise ValueError("Solo se pueden fusionar histogramas con los mismos intervalos.")
+        self.conteos += otro.conteos
+
+    def total(self):
+        return int(self.conteos.sum())
+
+
+def mostrar_top_rutas(top, nombres):
+    """Imprime la tabla de las K mejores rutas."""
+    print("\n" + "█" * 80)
+    print(f"{f' TOP {len(top)} RUTAS ':^80}")
+    print("█" * 80)
+    for i, (ruta, dist) in enumerate(top.mejores(), start=1):
+        ruta_nombres = " -> ".join([nombres[idx][:9] for idx in ruta])
+        print(f"{i:>3}. {dist:>10.4f} | {ruta_nombres}")
+    print("-" * 80)
+
+
+def mostrar_histograma(histograma, ancho=50):
+    """Imprime el histograma de largos de ruta como barras de texto."""
+    print("\n" + "█" * 80)
+    print(f"{f' HISTOGRAMA DE LARGOS ({histograma.total()} rutas) ':^80}")
+    print("█" * 80)
+    bordes = histograma.bordes
+    maximo = max(int(histograma.conteos.max()), 1)
+    for i, conteo in enumerate(histograma.conteos):
+        barra = "#" * int(round(conteo / maximo * ancho))
+        print(f"[{bordes[i]:>8.2f}, {bordes[i + 1]:>8.2f}) {conteo:>10} {barra}")
+    print("-" * 80)
@@ -1,77 +1,293 @@
 """Programa principal para resolver TSP con diferentes algoritmos."""
+import argparse
+import os
 import time
 import matplotlib.pyplot as plt
 
 from data import coordenadas, nombres_ciudades
-from distance import construir_matriz_distancias, mostrar_matriz_bonita
+from distance import construir_matriz_distancias, mostrar_matriz_bonita, obtener_coordenadas
 from exhaustive import busqueda_exhaustiva
-from nearest_neighbor import vecino_mas_cercano
+from held_karp import held_karp
+from branch_and_bound import ramificacion_y_poda
+from exhaustive_parallel import busqueda_exhaustiva_paralela
+from exhaustive_vectorized import busqueda_exhaustiva_vectorizada
+from exhaustive_dfs import busqueda_exhaustiva_dfs
+from integer_programming import programacion_entera
+from lower_bound import cota_inferior_1arbol
+from candidates import vecinos_cercanos
+from tour_stats import TopRutas, HistogramaDistancias, mostrar_top_rutas, mostrar_histograma
+from nearest_neighbor import (vecino_mas_cercano, vecino_mas_cercano_vectorizado,
+                              vecino_mas_cercano_multiinicio, vecino_mas_cercano_rejilla)
+from insertion import insercion_mas_cercana, insercion_mas_lejana, insercion_mas_barata
+from greedy_edge import aristas_golosas
+from christofides import doble_arbol, christofides
+from space_filling import ruta_hilbert
+from decomposition import ruta_por_clusters
+from local_search import dos_opt, or_opt, lin_kernighan
+from annealing import recocido_simulado
+from genetic import algoritmo_genetico
+from ant_colony import colonia_hormigas
+from anytime import Plazo
 from graphics import grafico_solo_puntos, dibujar_grafo_completo, resaltar_ruta, TITULO_FS, EJES_FS, LEYENDA_FS
 from animation import animar_historial
 
+# Métodos exactos seleccionables: clave -> (nombre visible, función)
+METODOS_EXACTOS = {
+    "fuerza_bruta": ("Exhaustivo (Óptimo)", busqueda_exhaustiva),
+    "held_karp": ("Held-Karp (Óptimo)", held_karp),
+    "branch_and_bound": ("Ramificación y Poda (Óptimo)", ramificacion_y_poda),
+    "paralelo": ("Exhaustivo Paralelo (Óptimo)", busqueda_exhaustiva_paralela),
+    "vectorizado": ("Exhaustivo Vectorizado (Óptimo)", busqueda_exhaustiva_vectorizada),
+    "dfs": ("Exhaustivo DFS (Óptimo)", busqueda_exhaustiva_dfs),
+    "programacion_entera": ("Programación Entera (Óptimo)", programacion_entera),
+}
 
-def main():
+# Métodos que recorren todas las rutas y pueden acumular top-K e histograma
+METODOS_CON_ESTADISTICAS = ("fuerza_bruta", "paralelo", "vectorizado")
+
+# Métodos exactos anytime: aceptan plazo=Plazo y retornan el mejor récord al vencer
+METODOS_ANYTIME = ("fuerza_bruta", "vectorizado")
+
+# Etiqueta de un método exacto detenido por el plazo: su ruta no es necesariamente óptima
+ETIQUETA_PLAZO = "(mejor hasta el plazo)"
+
+def _vecino_rejilla(matriz, inicio=0):
+    """Vecino más cercano sobre las coordenadas (no usa la matriz)."""
+    return vecino_mas_cercano_rejilla(obtener_coordenadas(), inicio=inicio)
+
+
+def _ruta_hilbert(matriz, inicio=0):
+    """Ruta por curva de Hilbert sobre las coordenadas (no usa la matriz)."""
+    return ruta_hilbert(obtener_coordenadas(), inicio=inicio)
+
+
+def _ruta_clusters(matriz, inicio=0):
+    """Clusters resueltos con Held-Karp en paralelo sobre las coordenadas (no usa la matriz)."""
+    return ruta_por_clusters(obtener_coordenadas(), inicio=inicio)
+
+
+def _hormigas(matriz, inicio=0, **opciones):
+    """Colonia de hormigas: sus registros (ruta, dist) se pasan a rutas para la animación."""
+    ruta, dist, registros = colonia_hormigas(matriz, inicio=inicio, **opciones)
+    return ruta, dist, [r for r, _ in registros]
+
+
+# Heurísticas seleccionables: clave -> (nombre visible, función)
+HEURISTICAS = {
+    "clasico": ("Vecino Más Cercano", vecino_mas_cercano),
+    "vectorizado": ("Vecino Más Cercano (vect.)", vecino_mas_cercano_vectorizado),
+    "multiinicio": ("Vecino Más Cercano (multi)", vecino_mas_cercano_multiinicio),
+    "rejilla": ("Vecino Más Cercano (rejilla)", _vecino_rejilla),
+    "insercion_cercana": ("Inserción Más Cercana", insercion_mas_cercana),
+    "insercion_lejana": ("Inserción Más Lejana", insercion_mas_lejana),
+    "insercion_barata": ("Inserción Más Barata", insercion_mas_barata),
+    "aristas_golosas": ("Aristas Golosas", aristas_golosas),
+    "doble_arbol": ("Doble Árbol", doble_arbol),
+    "christofides": ("Christofides (goloso)", christofides),
+    "hilbert": ("Curva de Hilbert", _ruta_hilbert),
+    "clusters": ("Clusters + Held-Karp", _ruta_clusters),
+    "hormigas": ("Colonia de Hormigas", _hormigas),
+}
+
+# Iteraciones que una ciudad movida queda bloqueada en la variante tabú
+TENENCIA_TABU = 10
+
+
+def _recocido(matriz, ruta, **opciones):
+    """Recocido simulado como mejora: sus registros (ruta, dist) se pasan a rutas para la animación."""
+    ruta, dist, registros = recocido_simulado(matriz, ruta, **opciones)
+    return ruta, dist, [r for r, _ in registros]
+
+
+def _recocido_tabu(matriz, ruta, **opciones):
+    """Recocido simulado con tenencia tabú de TENENCIA_TABU iteraciones."""
+    return _recocido(matriz, ruta, tenencia_tabu=TENENCIA_TABU, **opciones)
+
+
+def _genetico(matriz, ruta, max_iteraciones=None, **opciones):
+    """Algoritmo genético con la población inicial sembrada con `ruta` (max_iteraciones = generaciones)."""
+    if max_iteraciones is not None:
+        opciones["generaciones"] = max_iteraciones
+    ruta, dist, registros = algoritmo_genetico(matriz, ruta=ruta, inicio=ruta[0], **opciones)
+    return ruta, dist, [r for r, _ in registros]
+
+
+# Mejoras locales encadenables tras cualquier heurística: clave -> (nombre visible, función)
+MEJORAS = {
+    "2opt": ("2-opt", dos_opt),
+    "oropt": ("Or-opt", or_opt),
+    "lk": ("Lin-Kernighan", lin_kernighan),
+    "recocido": ("Recocido Simulado", _recocido),
+    "tabu": ("Recocido + Tabú", _recocido_tabu),
+    "genetico": ("Algoritmo Genético", _genetico),
+}
+
+# Mejoras aleatorias: aceptan semilla= para repetir la ejecución
+MEJORAS_ALEATORIAS = ("recocido", "tabu", "genetico")
+
+# Heurísticas que aceptan vecinos= (listas de candidatos compartidas con la mejora)
+HEURISTICAS_CON_CANDIDATOS = ("vectorizado", "multiinicio", "insercion_cercana", "insercion_lejana",
+                              "insercion_barata", "hormigas")
+K_CANDIDATOS = 8
+
+# Heurísticas aleatorias: aceptan semilla= para repetir la ejecución
+HEURISTICAS_ALEATORIAS = ("hormigas",)
+
+
+def main(metodo_exacto="fuerza_bruta", workers=None, top_k=0, bins_histograma=0, heuristica="clasico",
+         mejora=None, tiempo_mejora=None, iteraciones_mejora=None, semilla=None, tiempo_exacto=None):
     print("\nMostrando gráfico de puntos (sin conexiones)...")
     grafico_solo_puntos()
 
     matriz = construir_matriz_distancias()
     mostrar_matriz_bonita(matriz)
 
-    # 1) Exhaustivo
-    t0 = time.time()
-    ruta_ex, dist_ex, hist_ex = busqueda_exhaustiva(matriz)
-    t1 = time.time()
-    tiempo_ex = t1 - t0
+    # 1) Exhaustivo (o el método exacto elegido; "ninguno" lo omite)
+    top = TopRutas(top_k) if top_k else None
+    histograma = HistogramaDistancias.para_matriz(matriz, bins_histograma) if bins_histograma else None
+    ruta_ex, dist_ex, hist_ex, tiempo_ex = None, None, [], 0.0
+    completo_ex = True
+    if metodo_exacto != "ninguno":
+        nombre_ex, solver_ex = METODOS_EXACTOS[metodo_exacto]
+        opciones_ex = {"workers": workers} if metodo_exacto == "paralelo" else {}
+        if top is not None or histograma is not None:
+            opciones_ex.update(top=top, histograma=histograma)
+        plazo = Plazo(tiempo_exacto) if tiempo_exacto is not None else None
+        if plazo is not None:
+            opciones_ex["plazo"] = plazo
+        t0 = time.time()
+        ruta_ex, dist_ex, hist_ex = solver_ex(matriz, **opciones_ex)
+        t1 = time.time()
+        tiempo_ex = t1 - t0
+        # si venció el plazo la búsqueda quedó incompleta: no hay óptimo contra el cual medir
+        completo_ex = plazo is None or not plazo.vencido()
+        if not completo_ex:
+            nombre_ex = f"{nombre_ex.removesuffix(' (Óptimo)')} {ETIQUETA_PLAZO}"
 
-    # 2) Vecino más cercano
+    # 2) Vecino más cercano (variante elegida)
+    nombre_nn, solver_nn = HEURISTICAS[heuristica]
     t0 = time.time()
-    ruta_nn, dist_nn, hist_nn = vecino_mas_cercano(matriz, inicio=0)
+    vecinos = None
+    if heuristica in HEURISTICAS_CON_CANDIDATOS or mejora is not None:
+        vecinos = vecinos_cercanos(matriz, k=K_CANDIDATOS)
+    opciones_nn = {"vecinos": vecinos} if heuristica in HEURISTICAS_CON_CANDIDATOS else {}
+    if heuristica in HEURISTICAS_ALEATORIAS:
+        opciones_nn["semilla"] = semilla
+    ruta_nn, dist_nn, hist_nn = solver_nn(matriz, inicio=0, **opciones_nn)
+    if mejora is not None:
+        nombre_mejora, mejorar = MEJORAS[mejora]
+        opciones_mejora = {"semilla": semilla} if mejora in MEJORAS_ALEATORIAS else {}
+        ruta_nn, dist_nn, hist_mejora = mejorar(matriz, ruta_nn, tiempo_limite=tiempo_mejora,
+                                                max_iteraciones=iteraciones_mejora, vecinos=vecinos,
+                                                **opciones_mejora)
+        hist_nn = hist_nn + hist_mejora
+        nombre_nn = f"{nombre_nn} + {nombre_mejora}"
     t1 = time.time()
     tiempo_nn = t1 - t0
 
+    # 3) Cota inferior de Held-Karp: certifica el gap sin conocer el óptimo
+    cota, _ = cota_inferior_1arbol(matriz, cota_superior=dist_nn)
+
     # Tabla comparativa (prints en consola)
     print("\n" + "█" * 80)
     print(f"{' RESUMEN DE RENDIMIENTO ':^80}")
     print("█" * 80)
     print(f"{'Método':<30} | {'Tiempo (seg)':<15} | {'Distancia Total':<15}")
     print("-" * 80)
-    print(f"{'Exhaustivo (Óptimo)':<30} | {tiempo_ex:<15.6f} | {dist_ex:<15.4f}")
-    print(f"{'Vecino Más Cercano':<30} | {tiempo_nn:<15.6f} | {dist_nn:<15.4f}")
+    if dist_ex is not None:
+        print(f"{nombre_ex:<30} | {tiempo_ex:<15.6f} | {dist_ex:<15.4f}")
+    print(f"{nombre_nn:<30} | {tiempo_nn:<15.6f} | {dist_nn:<15.4f}")
+    print(f"{'Cota Inferior (1-árbol)':<30} | {'-':<15} | {cota:<15.4f}")
     print("-" * 80)
 
-    if dist_ex is not None and dist_ex > 0:
+    if dist_ex is not None and dist_ex > 0 and completo_ex:
         gap = (dist_nn - dist_ex) / dist_ex * 100
         print(f" CONCLUSIÓN: El vecino más cercano se desvió un {gap:.2f}% del óptimo.")
+    elif not completo_ex:
+        print(f" El método exacto se detuvo en el plazo ({tiempo_exacto:g} s): su ruta no es necesariamente")
+        print(" óptima, así que el gap solo se mide contra la cota inferior.")
     else:
         print("\nNo se pudo calcular gap.")
+    if cota > 0:
+        gap_cota = (dist_nn - cota) / cota * 100
+        print(f" GAP VS COTA INFERIOR: como máximo {gap_cota:.2f}% sobre el óptimo.")
+
+    if top is not None:
+        mostrar_top_rutas(top, nombres_ciudades)
+    if histograma is not None:
+        mostrar_histograma(histograma)
 
     # --- ANIMACIONES ---
     print("\n--- ANIMACIONES ---")
-    input("Presiona ENTER para ver la animación del Vecino Más Cercano...")
-    animar_historial(hist_nn, "Vecino Más Cercano (construcción paso a paso)",
+    input(f"Presiona ENTER para ver la animación de {nombre_nn}...")
+    animar_historial(hist_nn, f"{nombre_nn} (construcción paso a paso)",
                      velocidad=0.8, es_exhaustivo=False)
 
-    input("Presiona ENTER para ver la animación del Exhaustivo (records)...")
-    animar_historial(hist_ex, "Exhaustivo (records encontrados)",
-                     velocidad=0.6, es_exhaustivo=True)
+    if ruta_ex is not None:
+        input(f"Presiona ENTER para ver la animación de {nombre_ex} (records)...")
+        animar_historial(hist_ex, f"{nombre_ex} (records encontrados)",
+                         velocidad=0.6, es_exhaustivo=True)
 
     # --- GRÁFICO FINAL (lo ÚLTIMO en mostrarse) ---
     ciudades = [coordenadas[name] for name in nombres_ciudades]
     fig, ax = plt.subplots(figsize=(8, 8))
     try:
-        fig.canvas.manager.set_window_title("Comparativa Final: Greedy vs Óptimo")
+        fig.canvas.manager.set_window_title(f"Comparativa Final: {nombre_nn} vs {nombre_ex}"
+                                            if ruta_ex is not None else f"Comparativa Final: {nombre_nn}")
     except Exception:
         pass
 
     dibujar_grafo_completo(ax, ciudades)
-    resaltar_ruta(ax, ruta_ex, color='red', ancho=3,
-                  etiqueta=f"Óptimo ({dist_ex:.4f})")
+    if ruta_ex is not None:
+        resaltar_ruta(ax, ruta_ex, color='red', ancho=3,
+                      etiqueta=f"{nombre_ex} ({dist_ex:.4f})")
     resaltar_ruta(ax, ruta_nn, color='green', ancho=2,
-                  etiqueta=f"NN ({dist_nn:.4f})")
+                  etiqueta=f"{nombre_nn} ({dist_nn:.4f})")
     ax.legend(loc='upper right', fontsize=LEYENDA_FS)
     ax.set_xlabel("Longitud (lon)", fontsize=EJES_FS)
     ax.set_ylabel("Latitud (lat)", fontsize=EJES_FS)
     ax.grid(True, linestyle='--', alpha=0.4)
     plt.show()   # <- este show se ejecuta al final de todo
+
+
+def parsear_argumentos():
+    """Opciones de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Resuelve el TSP y compara métodos.")
+    parser.add_argument("--exacto", choices=list(METODOS_EXACTOS.keys()) + ["ninguno"],
+                        default="fuerza_bruta",
+                        help="método exacto a ejecutar (por defecto: fuerza_bruta; "
+                             "'ninguno' compara solo contra la cota inferior)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="procesos para --exacto paralelo (por defecto: núcleos disponibles)")
+    parser.add_argument("--top-k", type=int, default=0,
+                        help="guardar las K mejores rutas del método exacto")
+    parser.add_argument("--histograma", type=int, default=0, metavar="BINS",
+                        help="histograma de largos de ruta con BINS intervalos")
+    parser.add_argument("--heuristica", choices=list(HEURISTICAS.keys()), default="clasico",
+                        help="heurística constructiva (por defecto: clasico, el vecino más cercano)")
+    parser.add_argument("--mejora", choices=list(MEJORAS.keys()), default=None,
+                        help="mejora local aplicada a la ruta de la heurística")
+    parser.add_argument("--tiempo-mejora", type=float, default=None, metavar="SEG",
+                        help="presupuesto de tiempo de la mejora local (segundos)")
+    parser.add_argument("--iteraciones-mejora", type=int, default=None, metavar="N",
+                        help="presupuesto de iteraciones de la mejora local")
+    parser.add_argument("--semilla", type=int, default=None,
+                        help=f"semilla de las heurísticas y mejoras aleatorias "
+                             f"({', '.join(HEURISTICAS_ALEATORIAS + MEJORAS_ALEATORIAS)})")
+    parser.add_argument("--tiempo-exacto", type=float, default=None, metavar="SEG",
+                        help="plazo del método exacto: al vencer se usa la mejor ruta hasta ese momento")
+    args = parser.parse_args()
+    if (args.top_k or args.histograma) and args.exacto not in METODOS_CON_ESTADISTICAS:
+        parser.error(f"--top-k/--histograma solo aplican a: {', '.join(METODOS_CON_ESTADISTICAS)}")
+    if args.tiempo_exacto is not None and args.exacto not in METODOS_ANYTIME:
+        parser.error(f"--tiempo-exacto solo aplica a: {', '.join(METODOS_ANYTIME)}")
+    return args
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parsear_argumentos()
+    main(metodo_exacto=args.exacto, workers=args.workers,
+         top_k=args.top_k, bins_histograma=args.histograma, heuristica=args.heuristica,
+         mejora=args.mejora, tiempo_mejora=args.tiempo_mejora,
+         iteraciones_mejora=args.iteraciones_mejora, semilla=args.semilla,
+         tiempo_exacto=args.tiempo_exacto)
\ No newline at end of file
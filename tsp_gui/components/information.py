@@ -72,31 +72,37 @@ def metric_tiempo_vecino(tiempo_nn):
 def metric_gap_optimalidad(gap):
     return MetricCard("Gap de Optimalidad", f"{gap:.2f}", "%", color="#ffd36b")
 
+def metric_gap_cota(gap_cota):
+    return MetricCard("Gap vs Cota Inferior", f"≤ {gap_cota:.2f}", "%", color="#ffb86b")
+
 def metric_factor_velocidad(factor_velocidad):
     return MetricCard("Factor de Velocidad", f"{factor_velocidad:.1f}", "x", color="#7bd389")
 
 # ===== CONCLUSIONES =====
 
-def conclusiones_detalladas(tiempo_ex, dist_ex, tiempo_nn, dist_nn, gap):
+def conclusiones_detalladas(tiempo_ex, dist_ex, tiempo_nn, dist_nn, gap, nombre_ex="Búsqueda Exhaustiva",
+                            nombre_nn="Vecino Más Cercano"):
     recomendacion = (
         "El heurístico ofrece excelente balance entre velocidad y calidad."
         if gap is not None and gap < 10
         else "Considerar heurísticas avanzadas o metaheurísticos para mejorar calidad."
     )
+    # sin óptimo (método exacto detenido por el plazo) no hay gap que mostrar
+    gap_texto = f"{gap:.2f}%" if gap is not None else "sin óptimo (ver cota inferior)"
 
     return f"""<div style="color:#9aa7bf; line-height:1.8; padding:10px;">
 <p style="margin:0 0 10px 0;">
-<strong style="color:#e6eef8;">Búsqueda Exhaustiva</strong><br>
+<strong style="color:#e6eef8;">{nombre_ex}</strong><br>
 - Tiempo: <strong>{tiempo_ex:.6f} s</strong><br>
 - Distancia: <strong>{dist_ex:.4f} km</strong><br>
 - Complejidad: <code>O(n!)</code>
 </p>
 
 <p style="margin:10px 0;">
-<strong style="color:#e6eef8;">Vecino Más Cercano</strong><br>
+<strong style="color:#e6eef8;">{nombre_nn}</strong><br>
 - Tiempo: <strong>{tiempo_nn:.6f} s</strong><br>
 - Distancia: <strong>{dist_nn:.4f} km</strong><br>
-- Gap: <strong>{gap:.2f}%</strong>
+- Gap: <strong>{gap_texto}</strong>
 </p>
 
 <p style="margin:10px 0 0 0;">
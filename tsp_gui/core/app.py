@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 import plotly.graph_objects as go
 from components.content import (
@@ -18,19 +19,33 @@ from components.information import (
     metric_distancia_vecino,
     metric_tiempo_vecino,
     metric_gap_optimalidad,
+    metric_gap_cota,
     metric_factor_velocidad,
     conclusiones_detalladas,
 )
-from logic.animation import animar_historial
+from logic.animation import animar_historial, dibujar_en_vivo
 from logic.data import coordenadas, nombres_ciudades
 from logic.graphics import dibujar_grafo_completo, resaltar_ruta
+from logic.tour_stats import TopRutas, HistogramaDistancias
 from core.state import  (
     append_log_ex, clear_logs_ex, get_logs_ex,
     get_resultado_ex, set_resultado_ex,
+    get_nombre_ex, set_nombre_ex,
+    get_completo_ex, set_completo_ex,
+    get_estadisticas_ex, set_estadisticas_ex,
     append_log_nn, clear_logs_nn, get_logs_nn,
-    get_resultado_nn, set_resultado_nn
+    get_resultado_nn, set_resultado_nn,
+    get_nombre_nn, set_nombre_nn
 )
 from core.processing import (
+    METODOS_EXACTOS,
+    METODOS_CON_ESTADISTICAS,
+    METODOS_ANYTIME,
+    ETIQUETA_PLAZO,
+    HEURISTICAS,
+    MEJORAS,
+    MEJORAS_ALEATORIAS,
+    HEURISTICAS_ALEATORIAS,
     get_coordenadas_dataframe,
     get_matriz_distancias,
     get_matriz_distancias_numpy,
@@ -38,8 +53,12 @@ from core.processing import (
     ejecutar_busqueda_exhaustiva,
     ejecutar_vecino_mas_cercano,
     convertir_ruta_a_nombres,
+    crear_dataframe_top,
+    crear_dataframe_histograma,
     crear_dataframe_comparativo,
     calcular_gap,
+    calcular_cota_inferior,
+    calcular_gap_cota,
     get_grafico_comparativo
 )
 
@@ -95,9 +114,43 @@ def render_seccion_exhaustiva(matriz):
 
     col_ex_control, col_ex_visual = st.columns([1, 2])
 
+    with col_ex_visual:
+        st.subheader(" Visualización del Proceso")
+        # Un solo placeholder que se usará para la ejecución en vivo, la animación y el último frame
+        placeholder_ex = st.empty()
+
     with col_ex_control:
         st.subheader(" Control de Ejecución")
 
+        # Selección del método exacto
+        metodo_ex = st.selectbox(
+            "Método exacto",
+            options=list(METODOS_EXACTOS.keys()),
+            format_func=lambda clave: METODOS_EXACTOS[clave][0],
+            key="metodo_exacto"
+        )
+        nombre_ex = METODOS_EXACTOS[metodo_ex][0]
+        opciones_ex = {}
+        if metodo_ex == "paralelo":
+            opciones_ex["workers"] = st.number_input(
+                "Procesos (workers)",
+                min_value=1,
+                max_value=os.cpu_count() or 1,
+                value=os.cpu_count() or 1,
+                key="workers_exacto"
+            )
+        if metodo_ex in METODOS_CON_ESTADISTICAS:
+            if st.checkbox("Calcular top-K rutas e histograma de largos", key="estadisticas_exacto"):
+                top_k = st.number_input("K mejores rutas", min_value=1, max_value=100, value=10, key="top_k_exacto")
+                bins = st.number_input("Intervalos del histograma", min_value=5, max_value=200, value=40, key="bins_exacto")
+                opciones_ex["top"] = TopRutas(top_k)
+                opciones_ex["histograma"] = HistogramaDistancias.para_matriz(matriz, bins)
+        if metodo_ex in METODOS_ANYTIME and st.checkbox("Limitar tiempo (mejor ruta hasta el plazo)",
+                                                        key="limitar_exacto"):
+            opciones_ex["tiempo_limite"] = st.number_input(
+                "Tiempo máximo (s)", min_value=0.1, max_value=600.0, value=5.0, key="tiempo_exacto"
+            )
+
         # Botón que ejecuta CON animación
         ejecutar_ex = st.button(
             "▶ Ejecutar Búsqueda Exhaustiva",
@@ -108,13 +161,21 @@ def render_seccion_exhaustiva(matriz):
 
         if ejecutar_ex:
             clear_logs_ex()
-            with st.spinner("Ejecutando búsqueda exhaustiva..."):
-                ruta_ex, dist_ex, tiempo_ex, hist_ex = ejecutar_busqueda_exhaustiva(
+            with st.spinner(f"Ejecutando {nombre_ex}..."):
+                ruta_ex, dist_ex, tiempo_ex, hist_ex, completo_ex = ejecutar_busqueda_exhaustiva(
                     matriz,
-                    logger=append_log_ex
+                    logger=append_log_ex,
+                    metodo=metodo_ex,
+                    callback=dibujar_en_vivo(nombre_ex, placeholder_ex),
+                    **opciones_ex
                 )
                 set_resultado_ex(ruta_ex, dist_ex, tiempo_ex, hist_ex)
-            st.success(" Ejecutado: Búsqueda Exhaustiva")
+                set_nombre_ex(nombre_ex)
+                set_completo_ex(completo_ex)
+                set_estadisticas_ex(opciones_ex.get("top"), opciones_ex.get("histograma"))
+            st.success(f" Ejecutado: {nombre_ex}")
+            if not completo_ex:
+                st.warning("⏱️ Se alcanzó el plazo: la ruta es la mejor hasta ese momento, no necesariamente la óptima.")
 
         # Mostrar resultados numéricos si ya existen
         resultado_ex = get_resultado_ex()
@@ -131,22 +192,18 @@ def render_seccion_exhaustiva(matriz):
             with metric_col2:
                 st.markdown(metric_tiempo_exhaustiva(tiempo_ex), unsafe_allow_html=True)
 
-            st.markdown("** Ruta Óptima:**")
+            st.markdown("** Ruta Óptima:**" if get_completo_ex() else "** Mejor ruta hasta el plazo:**")
             st.info(" → ".join(ruta_ex_nombres))
 
     with col_ex_visual:
-        st.subheader(" Visualización del Proceso")
-
         resultado_ex = get_resultado_ex()
-        # Un solo placeholder que se usará para animación y quedará con el último frame
-        placeholder_ex = st.empty()
 
         if resultado_ex is not None and ejecutar_ex:
             # Solo animar inmediatamente después de pulsar el botón
             _, _, _, hist_ex = resultado_ex
             animar_historial(
                 hist_ex,
-                "Búsqueda Exhaustiva",
+                get_nombre_ex(),
                 placeholder=placeholder_ex,
                 sleep=1.0,
                 es_exhaustivo=True,
@@ -156,18 +213,21 @@ def render_seccion_exhaustiva(matriz):
             # Ya hay resultado pero NO se acaba de pulsar el botón → NO animar de nuevo
             # Simplemente mostramos el último estado (ruta óptima) en el placeholder
             ruta_ex, dist_ex, _, _ = resultado_ex
+            completo_ex = get_completo_ex()
+            etiqueta_ex = "Óptimo" if completo_ex else "Mejor hasta el plazo"
 
             ciudades = [coordenadas[name] for name in nombres_ciudades]
             fig_final = go.Figure()
             dibujar_grafo_completo(fig_final, ciudades)
-            resaltar_ruta(fig_final, ruta_ex, color='red', ancho=4, etiqueta=f"Óptimo ({dist_ex:.4f})")
+            resaltar_ruta(fig_final, ruta_ex, color='red', ancho=4, etiqueta=f"{etiqueta_ex} ({dist_ex:.4f})")
 
             lats = [c[0] for c in ciudades]
             lons = [c[1] for c in ciudades]
             margin = 2
 
             fig_final.update_layout(
-                title=dict(text="Ruta Óptima Encontrada", font=dict(size=16)),
+                title=dict(text="Ruta Óptima Encontrada" if completo_ex else "Mejor Ruta hasta el Plazo",
+                           font=dict(size=16)),
                 xaxis=dict(
                     title=dict(text="Longitud (lon)", font=dict(size=14)),
                     showgrid=False,
@@ -188,6 +248,15 @@ def render_seccion_exhaustiva(matriz):
         else:
             placeholder_ex.markdown(alert_ejecutar_exhaustiva(), unsafe_allow_html=True)
 
+    # Top-K e histograma (solo si se pidieron en la última ejecución)
+    top_ex, histograma_ex = get_estadisticas_ex()
+    if top_ex is not None:
+        with st.expander(f" Ver las {len(top_ex)} mejores rutas"):
+            st.dataframe(crear_dataframe_top(top_ex), use_container_width=True)
+    if histograma_ex is not None:
+        with st.expander(f" Ver histograma de largos ({histograma_ex.total()} rutas)"):
+            st.bar_chart(crear_dataframe_histograma(histograma_ex), x="Intervalo", y="Rutas")
+
     # Logs detallados
     resultado_ex = get_resultado_ex()
     if resultado_ex is not None:
@@ -203,9 +272,39 @@ def render_seccion_vecino(matriz):
 
     col_nn_control, col_nn_visual = st.columns([1, 2])
 
+    with col_nn_visual:
+        st.subheader(" Visualización del Proceso")
+        # Un solo placeholder que se usará para la ejecución en vivo, la animación y el último frame
+        placeholder_nn = st.empty()
+
     with col_nn_control:
         st.subheader(" Control de Ejecución")
 
+        # Selección de la heurística constructiva
+        metodo_nn = st.selectbox(
+            "Heurística",
+            options=list(HEURISTICAS.keys()),
+            format_func=lambda clave: HEURISTICAS[clave][0],
+            key="metodo_nn"
+        )
+        mejora_nn = st.selectbox(
+            "Mejora local",
+            options=[None] + list(MEJORAS.keys()),
+            format_func=lambda clave: "Ninguna" if clave is None else MEJORAS[clave][0],
+            key="mejora_nn"
+        )
+        tiempo_mejora = None
+        if mejora_nn is not None and st.checkbox("Limitar tiempo de la mejora", key="limitar_mejora_nn"):
+            tiempo_mejora = st.number_input(
+                "Tiempo máximo (s)", min_value=0.1, max_value=600.0, value=5.0, key="tiempo_mejora_nn"
+            )
+        semilla_nn = None
+        if metodo_nn in HEURISTICAS_ALEATORIAS or mejora_nn in MEJORAS_ALEATORIAS:
+            semilla_nn = int(st.number_input("Semilla", min_value=0, value=0, step=1, key="semilla_nn"))
+        nombre_nn = HEURISTICAS[metodo_nn][0]
+        if mejora_nn is not None:
+            nombre_nn = f"{nombre_nn} + {MEJORAS[mejora_nn][0]}"
+
         # Botón que ejecuta CON animación
         ejecutar_nn = st.button(
             "▶ Ejecutar Vecino Más Cercano",
@@ -220,10 +319,16 @@ def render_seccion_vecino(matriz):
                 ruta_nn, dist_nn, tiempo_nn, hist_nn = ejecutar_vecino_mas_cercano(
                     matriz,
                     inicio=0,
-                    logger=append_log_nn
+                    logger=append_log_nn,
+                    metodo=metodo_nn,
+                    mejora=mejora_nn,
+                    tiempo_limite=tiempo_mejora,
+                    semilla=semilla_nn,
+                    callback=dibujar_en_vivo(nombre_nn, placeholder_nn, color="green")
                 )
                 set_resultado_nn(ruta_nn, dist_nn, tiempo_nn, hist_nn)
-            st.success("Ejecutado: Vecino Más Cercano")
+                set_nombre_nn(nombre_nn)
+            st.success(f"Ejecutado: {nombre_nn}")
 
         # Mostrar resultados numéricos si ya existen
         resultado_nn = get_resultado_nn()
@@ -244,18 +349,14 @@ def render_seccion_vecino(matriz):
             st.info(" → ".join(ruta_nn_nombres))
 
     with col_nn_visual:
-        st.subheader(" Visualización del Proceso")
-
         resultado_nn = get_resultado_nn()
-        # Un solo placeholder que se usará para animación y quedará con el último frame
-        placeholder_nn = st.empty()
 
         if resultado_nn is not None and ejecutar_nn:
             # Solo animar justo después de ejecutar
             _, _, _, hist_nn = resultado_nn
             animar_historial(
                 hist_nn,
-                "Vecino Más Cercano",
+                get_nombre_nn(),
                 placeholder=placeholder_nn,
                 sleep=1.0,
                 es_exhaustivo=False,
@@ -322,6 +423,20 @@ def render_seccion_comparacion(matriz):
     # Botón para mostrar la comparación (sigue existiendo)
     comparar_clicked = st.button("▶ Mostrar Comparación", type="primary", use_container_width=False)
 
+    # Solo heurístico: sin óptimo, se compara contra la cota inferior
+    if resultado_ex is None and resultado_nn is not None and comparar_clicked:
+        _, dist_nn, _, _ = resultado_nn
+        cota = calcular_cota_inferior(matriz, dist_nn)
+        gap_cota = calcular_gap_cota(cota, dist_nn)
+        st.info(
+            f"ℹ️ Sin búsqueda exhaustiva: el Vecino Más Cercano se compara con la cota "
+            f"inferior de Held-Karp (1-árbol), **{cota:.2f}**. El óptimo está entre "
+            f"la cota y {dist_nn:.2f}."
+        )
+        if gap_cota is not None:
+            st.markdown(metric_gap_cota(gap_cota), unsafe_allow_html=True)
+        return
+
     # Si falta alguno y se hizo click, mostrar advertencia
     if resultado_ex is None or resultado_nn is None:
         if comparar_clicked:
@@ -344,26 +459,37 @@ def render_seccion_comparacion(matriz):
     if should_show:
         ruta_ex, dist_ex, tiempo_ex, _ = resultado_ex
         ruta_nn, dist_nn, tiempo_nn, _ = resultado_nn
+        # detenido por el plazo: su ruta no es el óptimo, solo vale el gap contra la cota inferior
+        completo_ex = get_completo_ex()
+        gap = calcular_gap(dist_ex, dist_nn) if completo_ex else None
+        nombre_ex = get_nombre_ex() if completo_ex else f"{get_nombre_ex()} {ETIQUETA_PLAZO}"
 
         col_tabla, col_metricas = st.columns([2, 1])
 
         with col_tabla:
             st.subheader(" 📊 Tabla Comparativa")
-            df_resumen = crear_dataframe_comparativo(tiempo_ex, dist_ex, tiempo_nn, dist_nn)
+            df_resumen = crear_dataframe_comparativo(tiempo_ex, dist_ex, tiempo_nn, dist_nn,
+                                                     nombre_nn=get_nombre_nn(), nombre_ex=get_nombre_ex(),
+                                                     completo=completo_ex)
             st.dataframe(df_resumen, use_container_width=True)
 
         with col_metricas:
             st.subheader(" 📈 Métricas Clave")
-            gap = calcular_gap(dist_ex, dist_nn)
             if gap is not None:
                 st.markdown(metric_gap_optimalidad(gap), unsafe_allow_html=True)
+            elif not completo_ex:
+                st.info("ℹ️ El método exacto se detuvo en el plazo: sin óptimo, el gap se mide solo "
+                        "contra la cota inferior.")
+
+            gap_cota = calcular_gap_cota(calcular_cota_inferior(matriz, dist_nn), dist_nn)
+            if gap_cota is not None:
+                st.markdown(metric_gap_cota(gap_cota), unsafe_allow_html=True)
 
             factor_velocidad = (tiempo_ex / tiempo_nn) if (tiempo_nn and tiempo_nn > 0) else 0
             st.markdown(metric_factor_velocidad(factor_velocidad), unsafe_allow_html=True)
 
         st.subheader(" 🔍 Análisis de Resultados")
 
-        gap = calcular_gap(dist_ex, dist_nn)
         if gap is not None:
             if gap < 10:
                 st.markdown(alert_analisis_gap_bueno(gap), unsafe_allow_html=True)
@@ -371,12 +497,14 @@ def render_seccion_comparacion(matriz):
                 st.markdown(alert_analisis_gap_alto(gap), unsafe_allow_html=True)
 
         st.subheader(" 🗺️ Comparación Visual de Rutas")
-        fig_comp = get_grafico_comparativo(ruta_ex, dist_ex, ruta_nn, dist_nn)
+        fig_comp = get_grafico_comparativo(ruta_ex, dist_ex, ruta_nn, dist_nn,
+                                           nombre_ex=nombre_ex, nombre_nn=get_nombre_nn())
         st.plotly_chart(fig_comp, use_container_width=False)
 
         with st.expander(" 📝 Ver conclusiones detalladas"):
             st.markdown(
-                conclusiones_detalladas(tiempo_ex, dist_ex, tiempo_nn, dist_nn, gap),
+                conclusiones_detalladas(tiempo_ex, dist_ex, tiempo_nn, dist_nn, gap,
+                                        nombre_ex=nombre_ex, nombre_nn=get_nombre_nn()),
                 unsafe_allow_html=True
             )
 
@@ -1,11 +1,126 @@
 import time
 import pandas as pd
 from logic.data import coordenadas, nombres_ciudades
-from logic.distance import construir_matriz_distancias
+from logic.distance import construir_matriz_distancias, obtener_coordenadas
 from logic.exhaustive import busqueda_exhaustiva
-from logic.nearest_neighbor import vecino_mas_cercano
+from logic.held_karp import held_karp
+from logic.branch_and_bound import ramificacion_y_poda
+from logic.exhaustive_parallel import busqueda_exhaustiva_paralela
+from logic.exhaustive_vectorized import busqueda_exhaustiva_vectorizada
+from logic.exhaustive_dfs import busqueda_exhaustiva_dfs
+from logic.integer_programming import programacion_entera
+from logic.lower_bound import cota_inferior_1arbol
+from logic.candidates import vecinos_cercanos
+from logic.nearest_neighbor import (
+    vecino_mas_cercano, vecino_mas_cercano_vectorizado, vecino_mas_cercano_multiinicio,
+    vecino_mas_cercano_rejilla
+)
+from logic.insertion import insercion_mas_cercana, insercion_mas_lejana, insercion_mas_barata
+from logic.greedy_edge import aristas_golosas
+from logic.christofides import doble_arbol, christofides
+from logic.space_filling import ruta_hilbert
+from logic.decomposition import ruta_por_clusters
+from logic.local_search import dos_opt, or_opt, lin_kernighan
+from logic.annealing import recocido_simulado
+from logic.genetic import algoritmo_genetico
+from logic.ant_colony import colonia_hormigas
+from logic.anytime import Plazo
 from logic.graphics import grafico_solo_puntos_fig, comparativa_fig
 
+# Métodos exactos seleccionables: clave -> (nombre visible, función)
+METODOS_EXACTOS = {
+    "fuerza_bruta": ("Fuerza bruta (permutaciones)", busqueda_exhaustiva),
+    "held_karp": ("Held-Karp (programación dinámica)", held_karp),
+    "branch_and_bound": ("Ramificación y poda (cota MST)", ramificacion_y_poda),
+    "paralelo": ("Fuerza bruta paralela (procesos)", busqueda_exhaustiva_paralela),
+    "vectorizado": ("Fuerza bruta vectorizada (bloques NumPy)", busqueda_exhaustiva_vectorizada),
+    "dfs": ("Fuerza bruta DFS (sin rutas espejo)", busqueda_exhaustiva_dfs),
+    "programacion_entera": ("Programación entera (HiGHS)", programacion_entera),
+}
+
+# Métodos que recorren todas las rutas y aceptan top=TopRutas / histograma=HistogramaDistancias
+METODOS_CON_ESTADISTICAS = ("fuerza_bruta", "paralelo", "vectorizado")
+
+# Métodos exactos anytime: aceptan plazo=Plazo y callback=(ruta, dist, stats) con cada nuevo récord
+METODOS_ANYTIME = ("fuerza_bruta", "vectorizado")
+
+# Etiqueta de un método exacto detenido por el plazo: su ruta no es necesariamente óptima
+ETIQUETA_PLAZO = "(mejor hasta el plazo)"
+
+def _vecino_rejilla(matriz, inicio=0, logger=None):
+    """Vecino más cercano sobre las coordenadas (no usa la matriz)."""
+    return vecino_mas_cercano_rejilla(obtener_coordenadas(), inicio=inicio, logger=logger)
+
+def _ruta_hilbert(matriz, inicio=0, logger=None):
+    """Ruta por curva de Hilbert sobre las coordenadas (no usa la matriz)."""
+    return ruta_hilbert(obtener_coordenadas(), inicio=inicio, logger=logger)
+
+def _ruta_clusters(matriz, inicio=0, logger=None):
+    """Clusters resueltos con Held-Karp en paralelo sobre las coordenadas (no usa la matriz)."""
+    return ruta_por_clusters(obtener_coordenadas(), inicio=inicio, logger=logger)
+
+def _hormigas(matriz, inicio=0, logger=None, **opciones):
+    """Colonia de hormigas: sus registros (ruta, dist) se pasan a rutas para la animación."""
+    ruta, dist, registros = colonia_hormigas(matriz, inicio=inicio, logger=logger, **opciones)
+    return ruta, dist, [r for r, _ in registros]
+
+# Heurísticas seleccionables: clave -> (nombre visible, función(matriz, inicio, logger))
+HEURISTICAS = {
+    "clasico": ("Vecino más cercano (bucle)", vecino_mas_cercano),
+    "vectorizado": ("Vecino más cercano (argmin con máscara)", vecino_mas_cercano_vectorizado),
+    "multiinicio": ("Vecino más cercano multi-inicio", vecino_mas_cercano_multiinicio),
+    "rejilla": ("Vecino más cercano (rejilla espacial, sin matriz)", _vecino_rejilla),
+    "insercion_cercana": ("Inserción más cercana", insercion_mas_cercana),
+    "insercion_lejana": ("Inserción más lejana", insercion_mas_lejana),
+    "insercion_barata": ("Inserción más barata", insercion_mas_barata),
+    "aristas_golosas": ("Aristas golosas (union-find)", aristas_golosas),
+    "doble_arbol": ("Doble árbol (MST en preorden)", doble_arbol),
+    "christofides": ("Christofides (emparejamiento goloso)", christofides),
+    "hilbert": ("Curva de Hilbert (sin matriz)", _ruta_hilbert),
+    "clusters": ("Clusters + Held-Karp (sin matriz)", _ruta_clusters),
+    "hormigas": ("Colonia de hormigas", _hormigas),
+}
+
+# Heurísticas que aceptan vecinos= (listas de candidatos compartidas con la mejora local)
+HEURISTICAS_CON_CANDIDATOS = ("vectorizado", "multiinicio", "insercion_cercana", "insercion_lejana",
+                              "insercion_barata", "hormigas")
+K_CANDIDATOS = 8
+
+# Heurísticas aleatorias: aceptan semilla= para repetir la ejecución
+HEURISTICAS_ALEATORIAS = ("hormigas",)
+
+# Iteraciones que una ciudad movida queda bloqueada en la variante tabú
+TENENCIA_TABU = 10
+
+def _recocido(matriz, ruta, logger=None, **opciones):
+    """Recocido simulado como mejora: sus registros (ruta, dist) se pasan a rutas para la animación."""
+    ruta, dist, registros = recocido_simulado(matriz, ruta, logger=logger, **opciones)
+    return ruta, dist, [r for r, _ in registros]
+
+def _recocido_tabu(matriz, ruta, logger=None, **opciones):
+    """Recocido simulado con tenencia tabú de TENENCIA_TABU iteraciones."""
+    return _recocido(matriz, ruta, logger=logger, tenencia_tabu=TENENCIA_TABU, **opciones)
+
+def _genetico(matriz, ruta, logger=None, max_iteraciones=None, **opciones):
+    """Algoritmo genético con la población inicial sembrada con `ruta` (max_iteraciones = generaciones)."""
+    if max_iteraciones is not None:
+        opciones["generaciones"] = max_iteraciones
+    ruta, dist, registros = algoritmo_genetico(matriz, ruta=ruta, inicio=ruta[0], logger=logger, **opciones)
+    return ruta, dist, [r for r, _ in registros]
+
+# Mejoras locales encadenables tras cualquier heurística: clave -> (nombre visible, función(matriz, ruta, logger))
+MEJORAS = {
+    "2opt": ("2-opt (listas de vecinos)", dos_opt),
+    "oropt": ("Or-opt (tramos de 1 a 3)", or_opt),
+    "lk": ("Lin-Kernighan (profundidad variable)", lin_kernighan),
+    "recocido": ("Recocido simulado", _recocido),
+    "tabu": ("Recocido simulado con lista tabú", _recocido_tabu),
+    "genetico": ("Algoritmo genético (islas en paralelo)", _genetico),
+}
+
+# Mejoras aleatorias: aceptan semilla= para repetir la ejecución
+MEJORAS_ALEATORIAS = ("recocido", "tabu", "genetico")
+
 def get_coordenadas_dataframe():
     """Retorna un DataFrame con las coordenadas de las ciudades."""
     return pd.DataFrame([
@@ -34,27 +149,74 @@ def get_mapa_puntos():
     """Retorna la figura del mapa de ciudades (solo puntos)."""
     return grafico_solo_puntos_fig()
 
-def ejecutar_busqueda_exhaustiva(matriz, logger):
+def ejecutar_busqueda_exhaustiva(matriz, logger, metodo="fuerza_bruta", tiempo_limite=None,
+                                 cancelacion=None, callback=None, **opciones):
     """
-    Ejecuta la búsqueda exhaustiva y retorna (ruta, distancia, tiempo, historial).
+    Ejecuta el método exacto `metodo` (clave de METODOS_EXACTOS)
+    y retorna (ruta, distancia, tiempo, historial, completo).
+    `opciones` se pasan tal cual al método (p. ej. workers=4 para "paralelo").
+    Si `metodo` está en METODOS_ANYTIME, se detiene al pasar `tiempo_limite`
+    segundos o al cancelarse `cancelacion` (anytime.Cancelacion) y retorna la
+    mejor ruta hasta ese momento; `callback(ruta, dist, stats)` recibe cada
+    nuevo récord apenas se encuentra.
+    `completo` es False si el plazo venció antes de terminar: la ruta es la
+    mejor hasta el plazo, no necesariamente la óptima.
     Usa time.perf_counter() para mayor precisión.
     """
-    logger("Iniciando búsqueda exhaustiva...")
+    nombre, solver = METODOS_EXACTOS[metodo]
+    logger(f"Iniciando búsqueda exhaustiva ({nombre})...")
     t0 = time.perf_counter()
-    ruta, dist, historial = busqueda_exhaustiva(matriz, logger=logger)
+    plazo = None
+    if metodo in METODOS_ANYTIME:
+        plazo = Plazo(tiempo_limite, cancelacion)
+        opciones.update(plazo=plazo, callback=callback)
+    ruta, dist, historial = solver(matriz, logger=logger, **opciones)
     t1 = time.perf_counter()
     tiempo = t1 - t0
+    completo = plazo is None or not plazo.vencido()
     logger(f"Exhaustivo terminado en {tiempo:.6f} s. Distancia: {dist:.4f}")
-    return ruta, dist, tiempo, historial
+    if not completo:
+        logger("Se detuvo en el plazo: la ruta es la mejor hasta ese momento, no necesariamente la óptima.")
+    return ruta, dist, tiempo, historial, completo
 
-def ejecutar_vecino_mas_cercano(matriz, inicio, logger):
+def ejecutar_vecino_mas_cercano(matriz, inicio, logger, metodo="clasico", mejora=None,
+                                tiempo_limite=None, semilla=None, cancelacion=None, callback=None):
     """
-    Ejecuta el algoritmo de vecino más cercano y retorna (ruta, distancia, tiempo, historial).
+    Ejecuta la heurística `metodo` (clave de HEURISTICAS), y si se indica,
+    la mejora local `mejora` (clave de MEJORAS) sobre su ruta, con un
+    presupuesto opcional de `tiempo_limite` segundos (contados desde el
+    inicio, incluida la construcción). La mejora se detiene también al
+    cancelarse `cancelacion` (anytime.Cancelacion) y retorna la mejor ruta
+    hasta ese momento. `callback(ruta, dist, stats)` recibe la ruta construida
+    y luego cada mejora que se encuentre. `semilla` se pasa a la
+    heurística y a la mejora si están en HEURISTICAS_ALEATORIAS / MEJORAS_ALEATORIAS.
+    Las listas de candidatos (K_CANDIDATOS vecinos por ciudad) se calculan
+    una sola vez y las usan la heurística (si está en HEURISTICAS_CON_CANDIDATOS)
+    y la mejora.
+    Retorna (ruta, distancia, tiempo, historial); el historial de la mejora
+    se agrega a continuación del de la construcción.
     Usa time.perf_counter() para mayor precisión.
     """
-    logger("Iniciando Vecino Más Cercano...")
+    nombre, heuristica = HEURISTICAS[metodo]
+    logger(f"Iniciando Vecino Más Cercano ({nombre})...")
     t0 = time.perf_counter()
-    ruta, dist, historial = vecino_mas_cercano(matriz, inicio=inicio, logger=logger)
+    plazo = Plazo(tiempo_limite, cancelacion)
+    vecinos = None
+    if metodo in HEURISTICAS_CON_CANDIDATOS or mejora is not None:
+        vecinos = vecinos_cercanos(matriz, k=K_CANDIDATOS)
+    opciones = {"vecinos": vecinos} if metodo in HEURISTICAS_CON_CANDIDATOS else {}
+    if metodo in HEURISTICAS_ALEATORIAS:
+        opciones["semilla"] = semilla
+    ruta, dist, historial = heuristica(matriz, inicio=inicio, logger=logger, **opciones)
+    if callback:
+        callback(ruta, dist, {"tiempo": plazo.transcurrido()})
+    if mejora is not None:
+        _, mejorar = MEJORAS[mejora]
+        opciones_mejora = {"semilla": semilla} if mejora in MEJORAS_ALEATORIAS else {}
+        ruta, dist, historial_mejora = mejorar(matriz, ruta, tiempo_limite=plazo.restante(), vecinos=vecinos,
+                                               plazo=plazo, callback=callback, logger=logger,
+                                               **opciones_mejora)
+        historial = historial + historial_mejora
     t1 = time.perf_counter()
     tiempo = t1 - t0
     logger(f"Vecino Más Cercano terminado en {tiempo:.6f} s. Distancia: {dist:.4f}")
@@ -64,19 +226,41 @@ def convertir_ruta_a_nombres(ruta):
     """Convierte una ruta de índices a nombres de ciudades."""
     return [nombres_ciudades[i] for i in ruta]
 
-def crear_dataframe_comparativo(tiempo_ex, dist_ex, tiempo_nn, dist_nn):
+def crear_dataframe_top(top):
+    """DataFrame con las K mejores rutas (posición, distancia y ruta con nombres)."""
+    return pd.DataFrame([
+        {
+            "Posición": i,
+            "Distancia": float(dist),
+            "Ruta": " → ".join(convertir_ruta_a_nombres(ruta))
+        }
+        for i, (ruta, dist) in enumerate(top.mejores(), start=1)
+    ])
+
+def crear_dataframe_histograma(histograma):
+    """DataFrame con el conteo de rutas por intervalo de distancia."""
+    bordes = histograma.bordes
+    return pd.DataFrame({
+        "Intervalo": [f"{bordes[i]:.1f}–{bordes[i + 1]:.1f}" for i in range(histograma.bins)],
+        "Rutas": histograma.conteos
+    })
+
+def crear_dataframe_comparativo(tiempo_ex, dist_ex, tiempo_nn, dist_nn, nombre_nn="Vecino Más Cercano",
+                                nombre_ex="Exhaustivo", completo=True):
     """
     Crea un DataFrame comparativo de ambos métodos.
+    `nombre_ex` y `nombre_nn` son las etiquetas del método exacto y de la heurística ejecutados;
+    con completo=False el exacto se marca como detenido por el plazo (ETIQUETA_PLAZO).
     Asegura conversión explícita a float para evitar problemas de tipo.
     """
     return pd.DataFrame([
         {
-            "Método": "Exhaustivo (Óptimo)", 
+            "Método": f"{nombre_ex} (Óptimo)" if completo else f"{nombre_ex} {ETIQUETA_PLAZO}",
             "Tiempo (s)": float(tiempo_ex), 
             "Distancia": float(dist_ex)
         },
         {
-            "Método": "Vecino Más Cercano", 
+            "Método": nombre_nn, 
             "Tiempo (s)": float(tiempo_nn), 
             "Distancia": float(dist_nn)
         }
@@ -88,6 +272,23 @@ def calcular_gap(dist_ex, dist_nn):
         return (dist_nn - dist_ex) / dist_ex * 100
     return None
 
-def get_grafico_comparativo(ruta_ex, dist_ex, ruta_nn, dist_nn):
-    """Retorna la figura comparativa con ambas rutas superpuestas."""
-    return comparativa_fig(ruta_ex, dist_ex, ruta_nn, dist_nn)
\ No newline at end of file
+def calcular_cota_inferior(matriz, dist_heuristica=None):
+    """
+    Cota inferior del largo óptimo (1-árbol de Held-Karp con subgradiente).
+    `dist_heuristica` (largo de una ruta conocida) guía el tamaño de paso.
+    """
+    cota, _ = cota_inferior_1arbol(matriz, cota_superior=dist_heuristica)
+    return cota
+
+def calcular_gap_cota(cota, dist):
+    """
+    Gap certificado de una ruta respecto a la cota inferior: el gap real
+    respecto al óptimo es como máximo este valor.
+    """
+    if cota and cota > 0:
+        return (dist - cota) / cota * 100
+    return None
+
+def get_grafico_comparativo(ruta_ex, dist_ex, ruta_nn, dist_nn, nombre_ex="Óptimo", nombre_nn="NN"):
+    """Retorna la figura comparativa con ambas rutas superpuestas (leyendas `nombre_ex` y `nombre_nn`)."""
+    return comparativa_fig(ruta_ex, dist_ex, ruta_nn, dist_nn, nombre_ex=nombre_ex, nombre_nn=nombre_nn)
\ No newline at end of file
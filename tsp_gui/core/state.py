@@ -7,6 +7,15 @@ def init_state():
         st.session_state['resultado_ex'] = None
     if 'resultado_nn' not in st.session_state:
         st.session_state['resultado_nn'] = None
+    # nombre del método exacto del último resultado_ex
+    if 'nombre_ex' not in st.session_state:
+        st.session_state['nombre_ex'] = "Búsqueda Exhaustiva"
+    # False si el último resultado_ex se detuvo en el plazo (no es necesariamente óptimo)
+    if 'completo_ex' not in st.session_state:
+        st.session_state['completo_ex'] = True
+    # nombre de la heurística del último resultado_nn
+    if 'nombre_nn' not in st.session_state:
+        st.session_state['nombre_nn'] = "Vecino Más Cercano"
     # versiones para detectar cambios
     if 'resultado_ex_version' not in st.session_state:
         st.session_state['resultado_ex_version'] = 0
@@ -15,6 +24,9 @@ def init_state():
     # versión de la última comparación mostrada
     if 'ultima_version_comparacion' not in st.session_state:
         st.session_state['ultima_version_comparacion'] = (0, 0)
+    # top-K e histograma de la última búsqueda exhaustiva
+    if 'estadisticas_ex' not in st.session_state:
+        st.session_state['estadisticas_ex'] = (None, None)
     # logs
     if 'logs_ex' not in st.session_state:
         st.session_state['logs_ex'] = []
@@ -46,6 +58,24 @@ def set_resultado_ex(ruta, dist, tiempo, historial):
 def get_resultado_ex():
     return st.session_state.get('resultado_ex')
 
+def set_nombre_ex(nombre):
+    st.session_state['nombre_ex'] = nombre
+
+def get_nombre_ex():
+    return st.session_state.get('nombre_ex', "Búsqueda Exhaustiva")
+
+def set_completo_ex(completo):
+    st.session_state['completo_ex'] = completo
+
+def get_completo_ex():
+    return st.session_state.get('completo_ex', True)
+
+def set_estadisticas_ex(top, histograma):
+    st.session_state['estadisticas_ex'] = (top, histograma)
+
+def get_estadisticas_ex():
+    return st.session_state.get('estadisticas_ex', (None, None))
+
 def set_resultado_nn(ruta, dist, tiempo, historial):
     st.session_state['resultado_nn'] = (ruta, dist, tiempo, historial)
     st.session_state['resultado_nn_version'] += 1
@@ -53,4 +83,10 @@ def set_resultado_nn(ruta, dist, tiempo, historial):
 def get_resultado_nn():
     return st.session_state.get('resultado_nn')
 
+def set_nombre_nn(nombre):
+    st.session_state['nombre_nn'] = nombre
+
+def get_nombre_nn():
+    return st.session_state.get('nombre_nn', "Vecino Más Cercano")
+
 # funciones de logs, append_log_ex/clear_logs_ex, etc. (mantenerlas)
\ No newline at end of file
@@ -90,4 +90,49 @@ def animar_historial(
         time.sleep(sleep)
 
     # limpiar flag de stop para futuras ejecuciones
-    st.session_state['animation_stop'] = False
\ No newline at end of file
+    st.session_state['animation_stop'] = False
+
+def dibujar_en_vivo(titulo, placeholder, color="red", intervalo=0.5):
+    """
+    Retorna un callback(ruta, dist, stats) para los solvers anytime que dibuja
+    en `placeholder` (st.empty()) la mejor ruta encontrada hasta el momento.
+    Redibuja como mucho una vez cada `intervalo` segundos (el último récord
+    queda igual en el resultado que retorna el solver).
+    """
+    ciudades = [coordenadas[name] for name in nombres_ciudades]
+    lats = [c[0] for c in ciudades]
+    lons = [c[1] for c in ciudades]
+    margin = 2
+    ultimo = [-float("inf")]
+
+    def callback(ruta, dist, stats):
+        if time.perf_counter() - ultimo[0] < intervalo:
+            return
+        ultimo[0] = time.perf_counter()
+
+        fig = go.Figure()
+        dibujar_grafo_completo(fig, ciudades)
+        resaltar_ruta(fig, ruta, color=color, ancho=5, etiqueta=f"Mejor hasta ahora {dist:.4f}")
+        fig.update_layout(
+            title=dict(text=f"{titulo} (en curso, {stats.get('tiempo', 0.0):.1f} s)", font=dict(size=16)),
+            xaxis=dict(
+                title=dict(text="Longitud (lon)", font=dict(size=EJES_FS)),
+                showgrid=False,
+                range=[min(lons) - margin, max(lons) + margin],
+                fixedrange=True
+            ),
+            yaxis=dict(
+                title=dict(text="Latitud (lat)", font=dict(size=EJES_FS)),
+                showgrid=False,
+                range=[min(lats) - margin, max(lats) + margin],
+                fixedrange=True
+            ),
+            width=GRAPH_WIDTH,
+            height=GRAPH_HEIGHT,
+            hovermode='closest',
+            showlegend=True,
+            autosize=False
+        )
+        placeholder.plotly_chart(fig, use_container_width=False)
+
+    return callback
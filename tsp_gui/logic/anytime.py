@@ -0,0 +1,87 @@
+import queue
+import threading
+import time
+
+
+class Cancelacion:
+    """
+    Token de cancelación que se puede compartir entre hilos: cancelar() lo
+    activa y los solvers lo revisan en sus puntos de control. Con `padre`,
+    también queda cancelado cuando se cancela el padre.
+    """
+
+    def __init__(self, padre=None):
+        self._evento = threading.Event()
+        self.padre = padre
+
+    def cancelar(self):
+        self._evento.set()
+
+    @property
+    def cancelada(self):
+        return self._evento.is_set() or (self.padre is not None and self.padre.cancelada)
+
+
+class Plazo:
+    """
+    Límite de una ejecución anytime: `tiempo_limite` segundos desde que se
+    crea y/o un token de Cancelacion. Los solvers que aceptan `plazo=`
+    consultan vencido() entre bloques de trabajo y, al vencer, retornan la
+    mejor ruta encontrada hasta ese momento.
+    """
+
+    def __init__(self, tiempo_limite=None, cancelacion=None):
+        self.inicio = time.perf_counter()
+        self.fin = None if tiempo_limite is None else self.inicio + tiempo_limite
+        self.cancelacion = cancelacion
+
+    def transcurrido(self):
+        return time.perf_counter() - self.inicio
+
+    def restante(self):
+        """Segundos que quedan (None si no hay límite de tiempo)."""
+        return None if self.fin is None else max(0.0, self.fin - time.perf_counter())
+
+    def vencido(self):
+        if self.cancelacion is not None and self.cancelacion.cancelada:
+            return True
+        return self.fin is not None and time.perf_counter() >= self.fin
+
+
+def mejoras(solver, *args, plazo=None, **opciones):
+    """
+    Generador anytime sobre cualquier solver que acepte `plazo=` y
+    `callback=`: lo ejecuta en un hilo y produce (ruta, dist, stats) cada vez
+    que el solver encuentra una ruta mejor. Se agota cuando el solver termina
+    (o vence `plazo`) y su valor de retorno es el resultado del solver. Si
+    quien lo consume lo cierra antes (p. ej. con break), cancela al solver y
+    espera a que se detenga.
+
+        for ruta, dist, stats in mejoras(busqueda_exhaustiva, matriz, plazo=Plazo(5)):
+            dibujar(ruta)
+    """
+    padre = plazo.cancelacion if plazo is not None else None
+    propio = Plazo(plazo.restante() if plazo is not None else None, Cancelacion(padre))
+    cola = queue.Queue()
+    fin = object()
+
+    def ejecutar():
+        try:
+            resultado = solver(*args, plazo=propio, callback=lambda *mejora: cola.put(mejora), **opciones)
+        except BaseException as error:  # se relanza en el hilo que consume
+            resultado = error
+        cola.put((fin, resultado))
+
+    hilo = threading.Thread(target=ejecutar, daemon=True)
+    hilo.start()
+    try:
+        while True:
+            mejora = cola.get()
+            if mejora[0] is fin:
+                if isinstance(mejora[1], BaseException):
+                    raise mejora[1]
+                return mejora[1]
+            yield mejora
+    finally:
+        propio.cancelacion.cancelar()
+        hilo.join()
@@ -0,0 +1,125 @@
+import numpy as np
+from .data import nombre_ciudad
+from .spanning_tree import arbol_expansion_minima
+
+
+def _arbol_desde(matriz, inicio):
+    """Listas de adyacencia del árbol de expansión mínima con raíz en `inicio`."""
+    num = len(matriz)
+    nodos = [inicio] + [c for c in range(num) if c != inicio]
+    costo, padres = arbol_expansion_minima(matriz, nodos)
+    adyacencia = [[] for _ in range(num)]
+    for hijo, padre in zip(nodos, padres.tolist()):
+        if padre >= 0:
+            adyacencia[padre].append(hijo)
+            adyacencia[hijo].append(padre)
+    return costo, adyacencia
+
+
+def _atajar(recorrido, inicio):
+    """Convierte un recorrido que repite ciudades en ruta, saltando las ya visitadas."""
+    vistas = set()
+    ruta = []
+    for c in recorrido:
+        if c not in vistas:
+            vistas.add(c)
+            ruta.append(c)
+    return ruta + [inicio]
+
+
+def _circuito_euleriano(adyacencia, inicio):
+    """Circuito euleriano (Hierholzer) de un multigrafo con todos los grados pares."""
+    restantes = [list(v) for v in adyacencia]
+    pila = [inicio]
+    circuito = []
+    while pila:
+        v = pila[-1]
+        if restantes[v]:
+            u = restantes[v].pop()
+            restantes[u].remove(v)
+            pila.append(u)
+        else:
+            circuito.append(pila.pop())
+    return circuito[::-1]
+
+
+def _terminar(matriz, ruta, titulo, logger):
+    historial = [ruta[:k] for k in range(1, len(ruta) + 1)]
+    dist_total = float(matriz[ruta[:-1], ruta[1:]].sum())
+    if logger:
+        logger("-" * 80)
+        logger(f"FIN {titulo}. Ruta final: {' → '.join([nombre_ciudad(i) for i in ruta])}")
+        logger(f"Distancia total: {dist_total:.4f}")
+        logger("-" * 80)
+    return ruta, dist_total, historial
+
+
+def doble_arbol(matriz_dist, inicio=0, logger=None):
+    """
+    Doble árbol: recorrido en preorden del árbol de expansión mínima (Prim
+    vectorizado), que equivale a duplicar sus aristas y atajar el circuito
+    euleriano. Con desigualdad triangular mide como máximo 2 veces el óptimo.
+    O(n²).
+    Retorna ruta, dist_total, historial (rutas parciales del recorrido).
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO DOBLE ÁRBOL (MST EN PREORDEN) ':^80}")
+        logger("=" * 80)
+
+    costo_mst, adyacencia = _arbol_desde(matriz, inicio)
+    if logger:
+        logger(f" -> Árbol de expansión mínima: {costo_mst:.4f}")
+
+    # preorden iterativo visitando primero al hijo más cercano
+    recorrido = []
+    pila = [(inicio, -1)]
+    while pila:
+        v, padre = pila.pop()
+        recorrido.append(v)
+        hijos = sorted((u for u in adyacencia[v] if u != padre), key=lambda u: -matriz[v, u])
+        pila.extend((u, v) for u in hijos)
+
+    return _terminar(matriz, recorrido + [inicio], "DOBLE ÁRBOL", logger)
+
+
+def christofides(matriz_dist, inicio=0, logger=None):
+    """
+    Estilo Christofides: árbol de expansión mínima + emparejamiento de las
+    ciudades de grado impar, circuito euleriano del multigrafo y atajos.
+    El emparejamiento es goloso (aristas de menor a mayor), no el de costo
+    mínimo exacto: la garantía 1.5 del algoritmo original no aplica, pero en
+    la práctica queda cerca y el costo total sigue siendo O(n² log n).
+    Retorna ruta, dist_total, historial (rutas parciales del atajo).
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO CHRISTOFIDES (EMPAREJAMIENTO GOLOSO) ':^80}")
+        logger("=" * 80)
+
+    costo_mst, adyacencia = _arbol_desde(matriz, inicio)
+    impares = np.array([v for v in range(num) if len(adyacencia[v]) % 2 == 1], dtype=int)
+    if logger:
+        logger(f" -> Árbol de expansión mínima: {costo_mst:.4f} | Ciudades de grado impar: {len(impares)}")
+
+    # emparejamiento goloso sobre las ciudades impares
+    filas, columnas = np.triu_indices(len(impares), k=1)
+    a, b = impares[filas], impares[columnas]
+    orden = np.argsort(matriz[a, b], kind="stable")
+    emparejada = np.zeros(num, dtype=bool)
+    costo_emparejamiento = 0.0
+    for i, j in zip(a[orden].tolist(), b[orden].tolist()):
+        if emparejada[i] or emparejada[j]:
+            continue
+        emparejada[i] = emparejada[j] = True
+        adyacencia[i].append(j)
+        adyacencia[j].append(i)
+        costo_emparejamiento += matriz[i, j]
+    if logger:
+        logger(f" -> Emparejamiento goloso: {costo_emparejamiento:.4f}")
+
+    recorrido = _circuito_euleriano(adyacencia, inicio)
+    return _terminar(matriz, _atajar(recorrido, inicio), "CHRISTOFIDES", logger)
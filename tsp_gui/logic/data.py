@@ -12,3 +12,9 @@ coordenadas = {
 
 nombres_ciudades = list(coordenadas.keys())
 n = len(nombres_ciudades)
+
+
+
+def nombre_ciudad(idx):
+    """Nombre de la ciudad `idx`; el índice como texto si la instancia tiene más ciudades que `coordenadas`."""
+    return nombres_ciudades[idx] if idx < n else str(idx)
@@ -0,0 +1,227 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .candidates import DistanciasPuntos, vecinos_cercanos
+from .held_karp import held_karp
+from .local_search import dos_opt, or_opt
+
+# Tamaño máximo de cluster (y de ventana) que se resuelve exacto: Held-Karp es O(2^n · n²)
+MAX_CLUSTER = 13
+
+# Desde este tamaño el historial por defecto es solo la ruta final: sus rutas
+# parciales ocuparían O(100·n) enteros en instancias pensadas para no tener matriz
+MAX_CIUDADES_HISTORIAL = 10_000
+
+
+def _matriz_local(puntos):
+    """Matriz de distancias euclidianas de un grupo pequeño de puntos (m, 2)."""
+    diferencias = puntos[:, None, :] - puntos[None, :, :]
+    return np.sqrt((diferencias ** 2).sum(axis=-1))
+
+
+def _partir(puntos, tam_cluster):
+    """
+    Clusters espaciales por bisección: cada grupo con más de `tam_cluster`
+    puntos se parte por la mediana de su eje más largo (rejilla adaptativa,
+    los clusters quedan de tam_cluster/2 a tam_cluster puntos).
+    Retorna una lista de arrays de índices.
+    """
+    pendientes = [np.arange(len(puntos))]
+    clusters = []
+    while pendientes:
+        indices = pendientes.pop()
+        if len(indices) <= tam_cluster:
+            clusters.append(indices)
+            continue
+        sub = puntos[indices]
+        eje = int(np.argmax(sub.max(axis=0) - sub.min(axis=0)))
+        mitad = len(indices) // 2
+        orden = np.argpartition(sub[:, eje], mitad)
+        pendientes += [indices[orden[:mitad]], indices[orden[mitad:]]]
+    return clusters
+
+
+def _ciclos_exactos(grupos):
+    """Ciclo óptimo (Held-Karp) de cada grupo de puntos, como orden de índices locales sin cerrar."""
+    return [held_karp(_matriz_local(p))[0][:-1] for p in grupos]
+
+
+def _caminos_exactos(grupos):
+    """Camino óptimo de cada grupo de puntos del primero al último (extremos fijos), como orden local."""
+    caminos = []
+    for p in grupos:
+        matriz = _matriz_local(p)
+        ultimo = len(p) - 1
+        # una arista muy negativa entre los extremos obliga al ciclo óptimo a usarla
+        matriz[0, ultimo] = matriz[ultimo, 0] = -(matriz.sum() + 1)
+        ciclo = held_karp(matriz)[0][:-1]
+        caminos.append(ciclo if ciclo[-1] == ultimo else [0] + ciclo[:0:-1])
+    return caminos
+
+
+def _en_lotes(mapear, funcion, grupos, workers):
+    """Aplica `funcion` a `grupos` repartidos en lotes (unos 4 por worker) y aplana los resultados."""
+    tam = max(1, -(-len(grupos) // (4 * workers)))
+    lotes = [grupos[i:i + tam] for i in range(0, len(grupos), tam)]
+    return [r for resultado in mapear(funcion, lotes) for r in resultado]
+
+
+def _unir(puntos, ciclos, centroides, orden):
+    """
+    Concatena los ciclos de los clusters en el orden `orden`. Cada ciclo se
+    abre quitando una de sus aristas (a, b): se entra por a, se recorre el
+    ciclo y se sale por b, eligiendo la arista y el sentido que minimizan
+    d(salida anterior, a) + d(b, centroide siguiente) - d(a, b).
+    """
+    ruta = []
+    anterior = centroides[orden[-1]]
+    for pos, c in enumerate(orden):
+        ciclo = ciclos[c]
+        siguiente = centroides[orden[(pos + 1) % len(orden)]]
+        p = puntos[ciclo]
+        arista = np.linalg.norm(p - np.roll(p, -1, axis=0), axis=1)
+        entrada = np.linalg.norm(p - anterior, axis=1)
+        salida = np.linalg.norm(p - siguiente, axis=1)
+        # quitar la arista (i, i+1): entrar por i hacia atrás o entrar por i+1 hacia adelante
+        hacia_atras = entrada + np.roll(salida, -1) - arista
+        hacia_adelante = np.roll(entrada, -1) + salida - arista
+        i = int(np.argmin(hacia_atras))
+        j = int(np.argmin(hacia_adelante))
+        if hacia_atras[i] <= hacia_adelante[j]:
+            camino = np.roll(ciclo[::-1], i + 1 - len(ciclo))
+        else:
+            camino = np.roll(ciclo, -(j + 1))
+        ruta.extend(camino.tolist())
+        anterior = puntos[camino[-1]]
+    return np.array(ruta)
+
+
+def _suavizar(puntos, ruta, costuras, ventana, mapear, workers):
+    """
+    Reoptimiza exacto una ventana de `ventana` ciudades alrededor de cada
+    costura entre clusters (extremos fijos, Held-Karp). En cada una de las
+    dos rondas (costuras pares e impares) las ventanas no se solapan y se
+    resuelven en paralelo.
+    """
+    num = len(ruta)
+    antes = ventana // 2
+    for ronda in (costuras[0::2], costuras[1::2]):
+        elegidas = []
+        for p in ronda:
+            if not elegidas or p - elegidas[-1] >= ventana:
+                elegidas.append(p)
+        if len(elegidas) > 1 and elegidas[0] + num - elegidas[-1] < ventana:
+            elegidas.pop()
+        posiciones = [(np.arange(ventana) + p - antes + 1) % num for p in elegidas]
+        caminos = _en_lotes(mapear, _caminos_exactos, [puntos[ruta[pos]] for pos in posiciones], workers)
+        for pos, camino in zip(posiciones, caminos):
+            ruta[pos] = ruta[pos][camino]
+    return ruta
+
+
+def _resolver(puntos, tam_cluster, ventana, mapear, workers, logger, nivel=1):
+    """Ruta (array de índices, sin cerrar) por clusters; el orden de los clusters se resuelve igual, recursivamente."""
+    num = len(puntos)
+    if num <= tam_cluster:
+        return np.array(_ciclos_exactos([puntos])[0])
+    clusters = _partir(puntos, tam_cluster)
+    if logger:
+        logger(f" -> Nivel {nivel}: {num} puntos en {len(clusters)} clusters")
+    locales = _en_lotes(mapear, _ciclos_exactos, [puntos[c] for c in clusters], workers)
+    ciclos = [c[local] for c, local in zip(clusters, locales)]
+    centroides = np.array([puntos[c].mean(axis=0) for c in clusters])
+    orden = _resolver(centroides, tam_cluster, ventana, mapear, workers, logger, nivel + 1)
+
+    ruta = _unir(puntos, ciclos, centroides, orden)
+    if 4 <= ventana <= num:
+        costuras = np.cumsum([len(clusters[c]) for c in orden]) - 1
+        ruta = _suavizar(puntos, ruta, costuras, ventana, mapear, workers)
+    return ruta
+
+
+def ruta_por_clusters(puntos, inicio=0, tam_cluster=12, ventana=10, workers=None, paso_historial=None,
+                      pulir=True, k=8, logger=None):
+    """
+    Divide y vencerás para instancias muy grandes (sin matriz de distancias):
+    1) parte las ciudades en clusters espaciales de a lo sumo `tam_cluster`
+       (bisección por la mediana del eje más largo);
+    2) resuelve cada cluster de forma exacta con Held-Karp, repartidos en un
+       ProcessPoolExecutor (`workers` procesos, por defecto todos los núcleos);
+    3) ordena los clusters resolviendo el TSP de sus centroides (con este
+       mismo método si son muchos) y abre cada ciclo por la arista más
+       conveniente para unirlo con el siguiente;
+    4) si ventana >= 4, reoptimiza exacto las `ventana` ciudades alrededor de
+       cada costura (también en paralelo);
+    5) si pulir, pasa 2-opt y Or-opt con listas de k candidatos sobre la ruta
+       completa (distancias calculadas al vuelo, sin matriz): las costuras
+       dejan aristas largas que las ventanas exactas no alcanzan, y sin este
+       paso la ruta queda peor que la del vecino más cercano.
+    - puntos: array (n, 2) de coordenadas (lat, lon).
+    - tam_cluster y ventana se limitan a MAX_CLUSTER.
+    - paso_historial: guarda una ruta parcial cada tantas ciudades (por defecto
+      n // 100, es decir, todas para instancias pequeñas; 0 guarda solo la ruta
+      final, el defecto desde MAX_CIUDADES_HISTORIAL ciudades).
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    t0 = time.time()
+    puntos = np.asarray(puntos, dtype=float)
+    num = len(puntos)
+    tam_cluster = min(max(tam_cluster, 2), MAX_CLUSTER)
+    ventana = min(ventana, MAX_CLUSTER)
+    workers = workers or os.cpu_count() or 1
+    if paso_historial is None:
+        paso_historial = max(1, num // 100) if num <= MAX_CIUDADES_HISTORIAL else 0
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO DESCOMPOSICIÓN EN CLUSTERS ':^80}")
+        logger("=" * 80)
+        logger(f" -> Clusters de hasta {tam_cluster} ciudades | ventana de costura: {ventana} | "
+               f"{workers} procesos")
+
+    if workers == 1:
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    mapear = map if executor is None else executor.map
+    try:
+        orden = _resolver(puntos, tam_cluster, ventana, mapear, workers, logger)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if pulir and num >= 5:
+        distancias = DistanciasPuntos(puntos)
+        vecinos = vecinos_cercanos(k=k, puntos=puntos)
+        cerrada = orden.tolist() + [int(orden[0])]
+        cerrada, _, _ = dos_opt(distancias, cerrada, k=k, vecinos=vecinos, paso_historial=num, logger=logger)
+        cerrada, _, _ = or_opt(distancias, cerrada, k=k, vecinos=vecinos, paso_historial=num, logger=logger)
+        orden = np.array(cerrada[:-1])
+
+    # rotar para empezar (y terminar) en `inicio`
+    orden = np.roll(orden, -int(np.flatnonzero(orden == inicio)[0]))
+    ruta = orden.tolist() + [inicio]
+    tramos = puntos[orden] - puntos[np.roll(orden, -1)]
+    dist_total = float(np.sqrt((tramos ** 2).sum(axis=1)).sum())
+    historial = [ruta[:k] for k in range(1, num + 1, paso_historial)] if paso_historial else []
+    if historial and historial[-1] != ruta[:-1]:
+        historial.append(ruta[:-1])
+    historial.append(ruta)
+
+    if logger:
+        logger("-" * 80)
+        logger(f" FIN DESCOMPOSICIÓN EN CLUSTERS. Distancia: {dist_total:.4f}")
+        logger(f"    Tiempo: {time.time() - t0:.2f} s")
+        logger("-" * 80)
+
+    return ruta, dist_total, historial
+
+
+if __name__ == "__main__":
+    # Comprobación de calidad: python -m logic.decomposition
+    from .nearest_neighbor import vecino_mas_cercano_rejilla
+    puntos = np.random.default_rng(0).random((5000, 2))
+    _, dist, _ = ruta_por_clusters(puntos, workers=1)
+    _, dist_vecino, _ = vecino_mas_cercano_rejilla(puntos)
+    assert dist < dist_vecino, (dist, dist_vecino)
+    print(f"OK: clusters {dist:.4f} < vecino más cercano {dist_vecino:.4f}")
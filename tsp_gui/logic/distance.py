@@ -1,5 +1,6 @@
 import numpy as np
 from .data import coordenadas, nombres_ciudades, n
+from .kernels import matriz_euclidiana
 
 def distancia_euclidiana(c1_idx, c2_idx):
     lat1, lon1 = coordenadas[nombres_ciudades[c1_idx]]
@@ -7,10 +8,9 @@ def distancia_euclidiana(c1_idx, c2_idx):
     return np.sqrt((lon2 - lon1)**2 + (lat2 - lat1)**2)
 
 def construir_matriz_distancias():
-    matriz = np.zeros((n, n))
-    for i in range(n):
-        for j in range(i + 1, n):
-            d = distancia_euclidiana(i, j)
-            matriz[i, j] = d
-            matriz[j, i] = d
-    return matriz
+    """Matriz simétrica n x n de distancias (kernels.matriz_euclidiana, con numba si está disponible)."""
+    return matriz_euclidiana(obtener_coordenadas())
+
+def obtener_coordenadas():
+    """Coordenadas (lat, lon) de las ciudades como array (n, 2), en el orden de nombres_ciudades."""
+    return np.array([coordenadas[nombre] for nombre in nombres_ciudades], dtype=float)
@@ -1,13 +1,27 @@
 import itertools
 import math
+import time
+import numpy as np
 from .data import n, nombres_ciudades
+from .kernels import distancias_rutas
 
-def busqueda_exhaustiva(matriz_dist, logger=None):
+# permutaciones por llamada al kernel de distancias
+TAM_BLOQUE = 4096
+
+def busqueda_exhaustiva(matriz_dist, logger=None, top=None, histograma=None, plazo=None, callback=None):
     """
     Búsqueda exhaustiva con posibilidad de enviar logs mediante `logger(msg)`.
+    Opcionalmente acumula las K mejores rutas en `top` (TopRutas) y el largo de
+    todas las rutas en `histograma` (HistogramaDistancias).
+    Las permutaciones se evalúan por bloques de TAM_BLOQUE con
+    kernels.distancias_rutas (compilado con numba si TSP_BACKEND lo permite).
+    Anytime: `plazo` (anytime.Plazo) se revisa entre bloques y, si vence, se
+    retorna el mejor récord hasta ese momento; `callback(ruta, dist, stats)`
+    se llama con cada nuevo récord.
     Retorna: mejor_ruta, mejor_dist, historial
     (historial contiene tuples (ruta, dist) cada vez que se encuentra nuevo record)
     """
+    t0 = time.perf_counter()
     if logger:
         logger("\n" + "=" * 80)
         logger(f"{' INICIANDO BÚSQUEDA EXHAUSTIVA (FUERZA BRUTA) ':^80}")
@@ -25,28 +39,43 @@ def busqueda_exhaustiva(matriz_dist, logger=None):
     if logger:
         logger(f" -> Se evaluarán {total_perms} rutas posibles...")
 
-    for perm in itertools.permutations(otros):
-        contador += 1
-        ruta_actual = [inicio] + list(perm) + [inicio]
+    permutaciones = itertools.permutations(otros)
+    # el primer bloque se evalúa siempre, para tener al menos una ruta
+    while plazo is None or contador == 0 or not plazo.vencido():
+        bloque = list(itertools.islice(permutaciones, TAM_BLOQUE))
+        if not bloque:
+            break
+
+        # calcular distancia total de cada ruta del bloque
+        dists = distancias_rutas(matriz_dist, inicio, bloque)
 
-        # calcular distancia total de la ruta_actual
-        dist_actual = 0.0
-        for i in range(len(ruta_actual) - 1):
-            a = ruta_actual[i]; b = ruta_actual[i + 1]
-            dist_actual += matriz_dist[a, b]
+        if top is not None:
+            top.agregar_lote(dists, lambda fila: [inicio] + list(bloque[fila]) + [inicio])
+        if histograma is not None:
+            histograma.agregar_lote(dists)
 
-        if dist_actual < mejor_dist:
-            mejor_dist = dist_actual
-            mejor_ruta = list(ruta_actual)
+        # récord = distancia estrictamente menor que todas las anteriores
+        minimos = np.minimum.accumulate(dists)
+        anteriores = np.concatenate(([mejor_dist], np.minimum(minimos[:-1], mejor_dist)))
+        for fila in np.flatnonzero(dists < anteriores):
+            mejor_dist = dists[fila]
+            mejor_ruta = [inicio] + list(bloque[fila]) + [inicio]
             historial.append((list(mejor_ruta), mejor_dist))
+            if callback:
+                callback(list(mejor_ruta), mejor_dist, {"evaluadas": contador + fila + 1, "total": total_perms,
+                                                        "tiempo": time.perf_counter() - t0})
 
             if logger:
                 ruta_nombres = " -> ".join([nombres_ciudades[idx][:9] for idx in mejor_ruta])
-                logger(f" [Intento {contador}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+                logger(f" [Intento {contador + fila + 1}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
                 logger(f"    Ruta: {ruta_nombres}")
 
+        contador += len(bloque)
+
     if logger:
         logger("-" * 80)
+        if contador < total_perms:
+            logger(f" Plazo vencido: se evaluaron {contador} de {total_perms} rutas.")
         logger(f" FIN EXHAUSTIVA. Mejor distancia encontrada: {mejor_dist:.4f}")
 
     return mejor_ruta, mejor_dist, historial
\ No newline at end of file
@@ -0,0 +1,72 @@
+import math
+from .data import nombre_ciudad
+
+
+def busqueda_exhaustiva_dfs(matriz_dist, logger=None):
+    """
+    Búsqueda exhaustiva recorriendo las permutaciones como un árbol en profundidad.
+    - El costo del prefijo se arrastra hacia abajo: cada hoja cuesta O(1) extra.
+    - Como la matriz es simétrica, cada ciclo se evalúa en un solo sentido:
+      solo se completan rutas cuya última ciudad es mayor que la segunda
+      (ruta[1] < ruta[-2]), lo que recorre (n-1)!/2 rutas en vez de (n-1)!.
+      Un prefijo se poda apenas no le queda ninguna pendiente mayor que
+      ruta[1], así que tampoco se visitan los nodos internos de los espejos.
+    Retorna: mejor_ruta, mejor_dist, historial
+    (historial contiene tuples (ruta, dist) cada vez que se encuentra nuevo record)
+    """
+    n = len(matriz_dist)
+    if logger:
+        logger("\n" + "=" * 80)
+        logger(f"{' INICIANDO BÚSQUEDA EXHAUSTIVA (DFS SIN ESPEJOS) ':^80}")
+        logger("=" * 80)
+
+    inicio = 0
+    mejor_dist = float('inf')
+    mejor_ruta = None
+    historial = []
+    contador = 0
+
+    total_perms = max(1, math.factorial(n - 1) // 2)
+    if logger:
+        logger(f" -> Se evaluarán {total_perms} rutas posibles (un sentido por ciclo)...")
+
+    ruta = [inicio]
+    pendientes = [c for c in range(n) if c != inicio]  # siempre ordenadas
+
+    def explorar(actual, costo):
+        nonlocal mejor_dist, mejor_ruta, contador
+
+        if len(pendientes) == 1:
+            ultimo = pendientes[0]
+            contador += 1
+            dist_actual = costo + matriz_dist[actual, ultimo] + matriz_dist[ultimo, inicio]
+            if dist_actual < mejor_dist:
+                mejor_dist = dist_actual
+                mejor_ruta = ruta + [ultimo, inicio]
+                historial.append((list(mejor_ruta), mejor_dist))
+
+                if logger:
+                    ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+                    logger(f" [Intento {contador}/{total_perms}] ¡NUEVO RÉCORD! Distancia: {mejor_dist:.4f}")
+                    logger(f"    Ruta: {ruta_nombres}")
+            return
+
+        for i in range(len(pendientes)):
+            siguiente = pendientes.pop(i)
+            segunda = ruta[1] if len(ruta) > 1 else siguiente
+            # sin pendientes mayores que la segunda ciudad, todo el subárbol es
+            # el sentido espejo de ciclos que ya se evalúan (pendientes está ordenada)
+            if pendientes[-1] > segunda:
+                ruta.append(siguiente)
+                explorar(siguiente, costo + matriz_dist[actual, siguiente])
+                ruta.pop()
+            pendientes.insert(i, siguiente)
+
+    if pendientes:
+        explorar(inicio, 0.0)
+
+    if logger:
+        logger("-" * 80)
+        logger(f" FIN EXHAUSTIVA DFS. Mejor distancia encontrada: {mejor_dist:.4f}")
+
+    return mejor_ruta, mejor_dist, historial
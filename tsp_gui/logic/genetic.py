@@ -0,0 +1,250 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .candidates import vecinos_cercanos
+
+# Estado de cada proceso del pool (se fija una sola vez en _inicializar_worker)
+_matriz = None
+_vecinos = None
+
+
+def _inicializar_worker(matriz, vecinos):
+    global _matriz, _vecinos
+    _matriz = matriz
+    _vecinos = vecinos
+
+
+def _distancias(matriz, poblacion):
+    """Largo de cada ruta de la población (pop, n) con una sola suma indexada."""
+    return matriz[poblacion, np.roll(poblacion, -1, axis=1)].sum(axis=1)
+
+
+def _cortes(rng, m, n):
+    """m intervalos [i, j) al azar dentro de 0..n."""
+    a, b = rng.integers(n, size=m), rng.integers(n, size=m)
+    return np.minimum(a, b), np.maximum(a, b) + 1
+
+
+def _torneo(rng, dist, cantidad, tam):
+    """Índices de `cantidad` ganadores de torneos de `tam` individuos."""
+    candidatos = rng.integers(len(dist), size=(cantidad, tam))
+    return candidatos[np.arange(cantidad), np.argmin(dist[candidatos], axis=1)]
+
+
+def _cruce_ox(rng, padres1, padres2):
+    """
+    Cruce de orden (OX) por lotes: cada hijo copia un tramo [i, j) del primer
+    padre y completa el resto, desde j y dando la vuelta, con las ciudades
+    del segundo padre en su orden (también desde j) que no están en el tramo.
+    """
+    m, n = padres1.shape
+    i, j = _cortes(rng, m, n)
+    columnas = np.arange(n)
+    filas = np.arange(m)[:, None]
+    en_tramo = (columnas >= i[:, None]) & (columnas < j[:, None])
+    ciudad_en_tramo = np.zeros((m, n), dtype=bool)
+    ciudad_en_tramo[filas, padres1] = en_tramo
+
+    # recorrer posiciones y genes del segundo padre a partir de j
+    orden = (columnas + j[:, None]) % n
+    genes = np.take_along_axis(padres2, orden, axis=1)
+    libres = ~np.take_along_axis(en_tramo, orden, axis=1)
+    hijos = np.where(en_tramo, padres1, 0).astype(padres1.dtype)
+    # en cada fila hay tantas posiciones libres como genes fuera del tramo, y
+    # ambas máscaras se recorren fila por fila: se emparejan en orden
+    hijos[np.nonzero(libres)[0], orden[libres]] = genes[~ciudad_en_tramo[filas, genes]]
+    return hijos
+
+
+def _mutar(rng, poblacion, tasa, vecinos=None):
+    """
+    Mutación por inversión de un tramo (un 2-opt) en una fracción `tasa` de
+    la población. Sin `vecinos` el tramo es al azar; con listas de candidatos
+    se elige una ciudad `a` y una candidata `c`, y se invierte el tramo que
+    deja a `c` junto a `a`.
+    """
+    m, n = poblacion.shape
+    filas = np.flatnonzero(rng.random(m) < tasa)
+    if len(filas) == 0:
+        return
+    elegidas = poblacion[filas]
+    if vecinos is None:
+        i, j = _cortes(rng, len(filas), n)
+    else:
+        indices = np.arange(len(filas))
+        p = rng.integers(n, size=len(filas))
+        c = vecinos[elegidas[indices, p], rng.integers(vecinos.shape[1], size=len(filas))]
+        posiciones = np.empty_like(elegidas)
+        posiciones[indices[:, None], elegidas] = np.arange(n)
+        q = posiciones[indices, c]
+        # ... a(p) x ... c(q) ...  ->  invertir [p+1, q];  ... c(q) ... z a(p) ...  ->  invertir [q, p-1]
+        i = np.where(q > p, p + 1, q)
+        j = np.where(q > p, q + 1, p)
+    columnas = np.arange(n)
+    dentro = (columnas >= i[:, None]) & (columnas < j[:, None])
+    indices = np.where(dentro, i[:, None] + j[:, None] - 1 - columnas, columnas)
+    poblacion[filas] = np.take_along_axis(elegidas, indices, axis=1)
+
+
+def _evolucionar_isla(poblacion, rng, generaciones, fin, tasa_mutacion, elite, torneo):
+    """
+    Evoluciona una isla `generaciones` generaciones (o hasta el instante `fin`
+    de time.time()). Retorna (poblacion, rng, records, generaciones hechas);
+    records es una lista de (ruta, dist) con cada mejora de la isla.
+    """
+    matriz = _matriz
+    tam = len(poblacion)
+    dist = _distancias(matriz, poblacion)
+    mejor = float(dist.min())
+    records = []
+    hechas = 0
+    for _ in range(generaciones):
+        if fin is not None and time.time() >= fin:
+            break
+        elites = poblacion[np.argsort(dist)[:elite]]
+        cantidad = tam - elite
+        padres1 = poblacion[_torneo(rng, dist, cantidad, torneo)]
+        padres2 = poblacion[_torneo(rng, dist, cantidad, torneo)]
+        hijos = _cruce_ox(rng, padres1, padres2)
+        _mutar(rng, hijos, tasa_mutacion, _vecinos)
+        poblacion = np.concatenate([elites, hijos])
+        dist = _distancias(matriz, poblacion)
+        hechas += 1
+        k = int(np.argmin(dist))
+        if dist[k] < mejor - 1e-10:
+            mejor = float(dist[k])
+            records.append((poblacion[k].tolist(), mejor))
+    return poblacion, rng, records, hechas
+
+
+def _poblacion_inicial(rng, num, tam, ruta):
+    """Permutaciones al azar o, si se da `ruta`, copias de ella con 1 a 3 inversiones."""
+    if ruta is None:
+        return np.argsort(rng.random((tam, num)), axis=1).astype(np.int32)
+    base = np.array(ruta[:-1] if ruta[0] == ruta[-1] and len(ruta) > 1 else ruta, dtype=np.int32)
+    poblacion = np.tile(base, (tam, 1))
+    for _ in range(3):
+        _mutar(rng, poblacion[1:], 0.7)
+    return poblacion
+
+
+def _rotar(ruta, inicio):
+    i = ruta.index(inicio)
+    return ruta[i:] + ruta[:i] + [inicio]
+
+
+def algoritmo_genetico(matriz_dist, ruta=None, inicio=0, tam_poblacion=200, generaciones=500,
+                       islas=4, workers=None, migracion=25, tasa_mutacion=0.3, elite=2, torneo=3,
+                       tiempo_limite=None, semilla=None, k=8, vecinos=None, plazo=None, callback=None,
+                       logger=None):
+    """
+    Algoritmo genético vectorizado con islas. Cada isla guarda su población
+    como un array (tam_poblacion, n) int32; la aptitud es una suma indexada
+    sobre la matriz, y la selección por torneo, el cruce de orden (OX) y la
+    mutación por inversión se aplican a toda la población a la vez. La
+    inversión une cada ciudad elegida con una de sus k candidatas
+    (`vecinos`, calculadas aquí si no se dan).
+    Las islas evolucionan en un ProcessPoolExecutor durante `migracion`
+    generaciones; entre épocas el mejor de cada isla reemplaza al peor de la
+    siguiente (anillo).
+    - ruta: si se da, la población inicial son variaciones de ella.
+    - workers: procesos (por defecto, uno por isla hasta los núcleos
+      disponibles; con 1 todo corre en este proceso).
+    - tiempo_limite (s) y/o generaciones: presupuesto.
+    - semilla: con el mismo número de islas y sin tiempo_limite, repite
+      exactamente la ejecución (cada isla tiene su propio generador).
+    - plazo (anytime.Plazo): su fecha límite acota cada época y la
+      cancelación se revisa entre épocas. callback(ruta, dist, stats) recibe
+      cada nueva mejor ruta.
+    Retorna ruta, dist_total, historial
+    (historial: registros (ruta, dist) de cada nueva mejor ruta, como la búsqueda exhaustiva)
+    """
+    t0 = time.time()
+    fin = t0 + tiempo_limite if tiempo_limite is not None else None
+    if plazo is not None and plazo.restante() is not None:
+        fin = min(fin or float('inf'), t0 + plazo.restante())
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    workers = min(workers or os.cpu_count() or 1, islas)
+    elite = min(elite, tam_poblacion - 1)
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO ALGORITMO GENÉTICO (ISLAS) ':^80}")
+        logger("=" * 80)
+        logger(f" -> {islas} islas x {tam_poblacion} individuos | {workers} procesos | "
+               f"migración cada {migracion} generaciones")
+
+    if num < 4:
+        base = list(range(num))
+        ruta_final = _rotar(base, inicio)
+        dist_total = float(matriz[ruta_final[:-1], ruta_final[1:]].sum())
+        return ruta_final, dist_total, [(ruta_final, dist_total)]
+
+    if vecinos is None:
+        vecinos = vecinos_cercanos(matriz, k)
+    vecinos = np.asarray(vecinos)[:, :k]
+    generadores = [np.random.default_rng(s) for s in np.random.SeedSequence(semilla).spawn(islas)]
+    poblaciones = [_poblacion_inicial(rng, num, tam_poblacion, ruta) for rng in generadores]
+    mejor_ruta, mejor_dist = None, float('inf')
+    for poblacion in poblaciones:
+        dist = _distancias(matriz, poblacion)
+        k = int(np.argmin(dist))
+        if dist[k] < mejor_dist:
+            mejor_ruta, mejor_dist = poblacion[k].tolist(), float(dist[k])
+    historial = [(_rotar(mejor_ruta, inicio), mejor_dist)]
+    if callback:
+        callback(historial[0][0], mejor_dist, {"generaciones": 0, "tiempo": time.time() - t0})
+
+    if workers == 1:
+        # sin pool: las islas se evolucionan en este mismo proceso
+        _inicializar_worker(matriz, vecinos)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                                       initargs=(matriz, vecinos))
+    mapear = map if executor is None else executor.map
+
+    hechas = 0
+    try:
+        while (hechas < generaciones and (fin is None or time.time() < fin)
+               and (plazo is None or not plazo.vencido())):
+            epoca = min(migracion, generaciones - hechas)
+            resultados = list(mapear(_evolucionar_isla, poblaciones, generadores, [epoca] * islas,
+                                     [fin] * islas, [tasa_mutacion] * islas, [elite] * islas,
+                                     [torneo] * islas))
+            poblaciones = [r[0] for r in resultados]
+            generadores = [r[1] for r in resultados]
+            hechas += max(r[3] for r in resultados)
+            for isla, (_, _, records, _) in enumerate(resultados):
+                for ruta_isla, dist in records:
+                    if dist < mejor_dist - 1e-10:
+                        mejor_ruta, mejor_dist = ruta_isla, dist
+                        historial.append((_rotar(mejor_ruta, inicio), mejor_dist))
+                        if callback:
+                            callback(historial[-1][0], mejor_dist, {"generaciones": hechas,
+                                                                    "tiempo": time.time() - t0})
+                        if logger:
+                            logger(f" [Generación {hechas}] Isla {isla}: ¡NUEVO RÉCORD! Distancia: {dist:.4f}")
+
+            # migración en anillo: el mejor de cada isla reemplaza al peor de la siguiente
+            if islas > 1:
+                aptitudes = [_distancias(matriz, p) for p in poblaciones]
+                mejores = [p[int(np.argmin(d))].copy() for p, d in zip(poblaciones, aptitudes)]
+                for isla in range(islas):
+                    peor = int(np.argmax(aptitudes[isla]))
+                    poblaciones[isla][peor] = mejores[isla - 1]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    ruta_final = _rotar(mejor_ruta, inicio)
+    dist_total = float(matriz[ruta_final[:-1], ruta_final[1:]].sum())
+
+    if logger:
+        logger("-" * 80)
+        logger(f" FIN ALGORITMO GENÉTICO. Generaciones: {hechas} | Distancia: {dist_total:.4f}")
+        logger(f"    Tiempo: {time.time() - t0:.2f} s | Récords: {len(historial) - 1}")
+        logger("-" * 80)
+
+    return ruta_final, dist_total, historial
@@ -98,7 +98,7 @@ def grafico_solo_puntos_fig():
     
     return fig
 
-def comparativa_fig(ruta_ex, dist_ex, ruta_nn, dist_nn):
+def comparativa_fig(ruta_ex, dist_ex, ruta_nn, dist_nn, nombre_ex="Óptimo", nombre_nn="NN"):
     """Crea un gráfico comparativo con ambas rutas superpuestas."""
     ciudades = [coordenadas[name] for name in nombres_ciudades]
     
@@ -109,11 +109,11 @@ def comparativa_fig(ruta_ex, dist_ex, ruta_nn, dist_nn):
     
     # Resaltar ruta exhaustiva
     if ruta_ex is not None:
-        resaltar_ruta(fig, ruta_ex, color='red', ancho=3, etiqueta=f"Óptimo ({dist_ex:.4f})")
+        resaltar_ruta(fig, ruta_ex, color='red', ancho=3, etiqueta=f"{nombre_ex} ({dist_ex:.4f})")
     
     # Resaltar ruta vecino más cercano
     if ruta_nn is not None:
-        resaltar_ruta(fig, ruta_nn, color='green', ancho=2, etiqueta=f"NN ({dist_nn:.4f})")
+        resaltar_ruta(fig, ruta_nn, color='green', ancho=2, etiqueta=f"{nombre_nn} ({dist_nn:.4f})")
     
     fig.update_layout(
         xaxis=dict(
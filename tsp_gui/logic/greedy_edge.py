@@ -0,0 +1,80 @@
+import numpy as np
+from .data import nombre_ciudad
+
+
+def _raiz(padre, x):
+    """Representante del conjunto de `x` (union-find con compresión por mitades)."""
+    while padre[x] != x:
+        padre[x] = padre[padre[x]]
+        x = padre[x]
+    return x
+
+
+def aristas_golosas(matriz_dist, inicio=0, logger=None):
+    """
+    Heurística golosa de aristas: recorre las aristas de menor a mayor y acepta
+    cada una si ninguno de sus extremos tiene ya grado 2 y no cierra un ciclo
+    (union-find). Con n-1 aristas queda un camino hamiltoniano que se cierra
+    uniendo sus dos extremos. O(n² log n) por el ordenamiento.
+    Retorna ruta, dist_total, historial
+    (historial: recorrido de la ruta final desde `inicio`, ya que las aristas
+    se eligen en cualquier orden)
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO HEURÍSTICA GOLOSA DE ARISTAS ':^80}")
+        logger("=" * 80)
+
+    if num <= 2:
+        ruta = [inicio] + [c for c in range(num) if c != inicio] + [inicio]
+        return ruta, float(matriz[ruta[:-1], ruta[1:]].sum()), [ruta]
+
+    grado = [0] * num
+    padre = list(range(num))
+    vecinos = [[] for _ in range(num)]
+    aceptadas = 0
+
+    filas, columnas = np.triu_indices(num, k=1)
+    orden = np.argsort(matriz[filas, columnas], kind="stable")
+    for i, j in zip(filas[orden].tolist(), columnas[orden].tolist()):
+        if grado[i] == 2 or grado[j] == 2:
+            continue
+        ri, rj = _raiz(padre, i), _raiz(padre, j)
+        if ri == rj:
+            continue
+        padre[ri] = rj
+        grado[i] += 1
+        grado[j] += 1
+        vecinos[i].append(j)
+        vecinos[j].append(i)
+        aceptadas += 1
+        if logger:
+            logger(f"   + Arista {nombre_ciudad(i)} - {nombre_ciudad(j)} ({matriz[i, j]:.2f})")
+        if aceptadas == num - 1:
+            break
+
+    # cerrar el camino uniendo sus dos extremos
+    a, b = [c for c in range(num) if grado[c] < 2]
+    vecinos[a].append(b)
+    vecinos[b].append(a)
+
+    # recorrer el ciclo desde inicio
+    ruta = [inicio]
+    anterior, actual = None, inicio
+    for _ in range(num - 1):
+        siguiente = vecinos[actual][0] if vecinos[actual][0] != anterior else vecinos[actual][1]
+        ruta.append(siguiente)
+        anterior, actual = actual, siguiente
+    ruta.append(inicio)
+    historial = [ruta[:k] for k in range(1, num + 2)]
+    dist_total = float(matriz[ruta[:-1], ruta[1:]].sum())
+
+    if logger:
+        logger("-" * 80)
+        logger(f"FIN ARISTAS GOLOSAS. Ruta final: {' → '.join([nombre_ciudad(i) for i in ruta])}")
+        logger(f"Distancia total: {dist_total:.4f}")
+        logger("-" * 80)
+
+    return ruta, dist_total, historial
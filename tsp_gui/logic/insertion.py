@@ -0,0 +1,185 @@
+import numpy as np
+from .data import nombre_ciudad
+
+
+def _recorrer(sucesor, inicio):
+    """Ruta cerrada (inicio ... inicio) a partir del arreglo de sucesores."""
+    ruta = [inicio]
+    actual = sucesor[inicio]
+    while actual != inicio:
+        ruta.append(actual)
+        actual = sucesor[actual]
+    ruta.append(inicio)
+    return ruta
+
+
+def _mejor_arista(matriz, sucesor, en_ruta, ciudades):
+    """
+    Arista (a, sucesor[a]) más barata para insertar cada una de `ciudades`
+    (array de índices). Retorna (costos, a) como arrays.
+    """
+    desde = np.flatnonzero(en_ruta)
+    hasta = sucesor[desde]
+    costos = (matriz[np.ix_(ciudades, desde)] + matriz[np.ix_(ciudades, hasta)]
+              - matriz[desde, hasta])
+    j = np.argmin(costos, axis=1)
+    return costos[np.arange(len(ciudades)), j], desde[j]
+
+
+def _mejor_arista_candidatas(matriz, sucesor, predecesor, en_ruta, ciudades, vecinos):
+    """
+    Como _mejor_arista, pero solo prueba las aristas que tocan a las
+    candidatas de cada ciudad que ya están en la ruta: (v, sucesor[v]) y
+    (predecesor[v], v). O(k) por ciudad; las que no tienen candidatas en la
+    ruta se resuelven con _mejor_arista.
+    """
+    ciudades = np.asarray(ciudades)
+    cand = vecinos[ciudades]
+    desde = np.concatenate([cand, predecesor[cand]], axis=1)
+    hasta = sucesor[desde]
+    filas = ciudades[:, None]
+    costos = matriz[filas, desde] + matriz[filas, hasta] - matriz[desde, hasta]
+    costos[~np.tile(en_ruta[cand], 2)] = np.inf
+    j = np.argmin(costos, axis=1)
+    fila = np.arange(len(ciudades))
+    mejores, aristas = costos[fila, j], desde[fila, j]
+    sin_candidatas = np.isinf(mejores)
+    if sin_candidatas.any():
+        mejores[sin_candidatas], aristas[sin_candidatas] = _mejor_arista(
+            matriz, sucesor, en_ruta, ciudades[sin_candidatas])
+    return mejores, aristas
+
+
+def _insercion(matriz_dist, inicio, criterio, titulo, vecinos, logger):
+    """
+    Esqueleto común de las heurísticas de inserción. La ruta se guarda como
+    arreglo de sucesores (insertar es O(1)) y cada criterio mantiene un caché
+    por ciudad que solo se actualiza con lo que cambió en la última inserción:
+    - "cercana"/"lejana": distancia de cada ciudad a la ruta (np.minimum con
+      la fila de la ciudad insertada).
+    - "barata": costo y arista de su mejor inserción; solo se recalculan desde
+      cero las ciudades cuya mejor arista fue la que se partió.
+    Con `vecinos` (listas de candidatos) la mejor arista de una ciudad se
+    busca solo junto a sus candidatas ya insertadas (O(k) en vez de O(n)).
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    if logger:
+        logger("=" * 80)
+        logger(f"{titulo:^80}")
+        logger("=" * 80)
+        logger(f"Comenzamos en: {nombre_ciudad(inicio).upper()}")
+
+    sucesor = np.full(num, -1)
+    predecesor = np.full(num, -1)
+    en_ruta = np.zeros(num, dtype=bool)
+    sucesor[inicio] = predecesor[inicio] = inicio
+    en_ruta[inicio] = True
+    historial = [[inicio]]
+    if num == 1:
+        return [inicio, inicio], 0.0, historial
+    if vecinos is not None:
+        vecinos = np.asarray(vecinos)
+
+        def mejor_arista(ciudades):
+            return _mejor_arista_candidatas(matriz, sucesor, predecesor, en_ruta, ciudades, vecinos)
+    else:
+        def mejor_arista(ciudades):
+            return _mejor_arista(matriz, sucesor, en_ruta, ciudades)
+
+    # distancia de cada ciudad a la ruta (para elegir la próxima en cercana/lejana)
+    dist_a_ruta = matriz[inicio].copy()
+    # caché de la inserción más barata de cada ciudad: costo y ciudad `a` de la arista (a, sucesor[a])
+    costo_ins = 2 * matriz[inicio]
+    arista_ins = np.full(num, inicio)
+
+    for _ in range(num - 1):
+        fuera = ~en_ruta
+        if criterio == "cercana":
+            ciudad = int(np.argmin(np.where(fuera, dist_a_ruta, np.inf)))
+        elif criterio == "lejana":
+            ciudad = int(np.argmax(np.where(fuera, dist_a_ruta, -np.inf)))
+        else:
+            ciudad = int(np.argmin(np.where(fuera, costo_ins, np.inf)))
+
+        if criterio == "barata":
+            costo, a = costo_ins[ciudad], int(arista_ins[ciudad])
+        else:
+            costos, aristas = mejor_arista([ciudad])
+            costo, a = costos[0], int(aristas[0])
+        b = int(sucesor[a])
+
+        # insertar entre a y b
+        sucesor[a] = ciudad
+        sucesor[ciudad] = b
+        predecesor[ciudad] = a
+        predecesor[b] = ciudad
+        en_ruta[ciudad] = True
+        historial.append(_recorrer(sucesor, inicio))
+
+        if logger:
+            logger(f" >>> Inserto {nombre_ciudad(ciudad)} entre {nombre_ciudad(a)} "
+                   f"y {nombre_ciudad(b)} (costo +{costo:.2f})")
+
+        # actualizar solo lo afectado por la inserción
+        if criterio == "barata":
+            pendientes = np.flatnonzero(~en_ruta)
+            obsoletas = pendientes[arista_ins[pendientes] == a]
+            vigentes = pendientes[arista_ins[pendientes] != a]
+            # las dos aristas nuevas: (a, ciudad) y (ciudad, b)
+            por_a = matriz[a, vigentes] + matriz[vigentes, ciudad] - matriz[a, ciudad]
+            por_ciudad = matriz[ciudad, vigentes] + matriz[vigentes, b] - matriz[ciudad, b]
+            mejora_a = por_a < costo_ins[vigentes]
+            costo_ins[vigentes[mejora_a]] = por_a[mejora_a]
+            arista_ins[vigentes[mejora_a]] = a
+            mejora_c = por_ciudad < costo_ins[vigentes]
+            costo_ins[vigentes[mejora_c]] = por_ciudad[mejora_c]
+            arista_ins[vigentes[mejora_c]] = ciudad
+            if len(obsoletas):
+                costo_ins[obsoletas], arista_ins[obsoletas] = mejor_arista(obsoletas)
+        else:
+            np.minimum(dist_a_ruta, matriz[ciudad], out=dist_a_ruta)
+
+    ruta = _recorrer(sucesor, inicio)
+    dist_total = float(matriz[ruta[:-1], ruta[1:]].sum())
+
+    if logger:
+        logger("-" * 80)
+        logger(f"FIN INSERCIÓN. Ruta final: {' → '.join([nombre_ciudad(i) for i in ruta])}")
+        logger(f"Distancia total: {dist_total:.4f}")
+        logger("-" * 80)
+
+    return ruta, dist_total, historial
+
+
+def insercion_mas_cercana(matriz_dist, inicio=0, vecinos=None, logger=None):
+    """
+    Inserción más cercana: agrega la ciudad más cercana a la ruta en su
+    posición más barata. O(n²).
+    Con `vecinos` solo prueba las aristas junto a sus candidatas ya insertadas.
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    return _insercion(matriz_dist, inicio, "cercana", " INICIANDO INSERCIÓN MÁS CERCANA ",
+                      vecinos, logger)
+
+
+def insercion_mas_lejana(matriz_dist, inicio=0, vecinos=None, logger=None):
+    """
+    Inserción más lejana: agrega la ciudad más alejada de la ruta en su
+    posición más barata. O(n²).
+    Con `vecinos` solo prueba las aristas junto a sus candidatas ya insertadas.
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    return _insercion(matriz_dist, inicio, "lejana", " INICIANDO INSERCIÓN MÁS LEJANA ",
+                      vecinos, logger)
+
+
+def insercion_mas_barata(matriz_dist, inicio=0, vecinos=None, logger=None):
+    """
+    Inserción más barata: agrega la ciudad (y posición) que menos alarga la ruta.
+    O(n²) más el recálculo de las ciudades cuya mejor arista se partió.
+    Con `vecinos` solo prueba las aristas junto a sus candidatas ya insertadas.
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    return _insercion(matriz_dist, inicio, "barata", " INICIANDO INSERCIÓN MÁS BARATA ",
+                      vecinos, logger)
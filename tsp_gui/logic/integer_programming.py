@@ -0,0 +1,106 @@
+import numpy as np
+from scipy.optimize import milp, LinearConstraint, Bounds
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from .data import nombre_ciudad
+
+
+def _ciclos(n, aristas_i, aristas_j):
+    """Separa la solución (cada ciudad con grado 2) en sus ciclos, cada uno cerrado."""
+    vecinos = [[] for _ in range(n)]
+    for a, b in zip(aristas_i.tolist(), aristas_j.tolist()):
+        vecinos[a].append(b)
+        vecinos[b].append(a)
+    visitadas = [False] * n
+    ciclos = []
+    for origen in range(n):
+        if visitadas[origen]:
+            continue
+        ciclo = [origen]
+        visitadas[origen] = True
+        anterior, actual = None, origen
+        while True:
+            siguiente = vecinos[actual][0] if vecinos[actual][0] != anterior else vecinos[actual][1]
+            if siguiente == origen:
+                break
+            ciclo.append(siguiente)
+            visitadas[siguiente] = True
+            anterior, actual = actual, siguiente
+        ciclos.append(ciclo + [origen])
+    return ciclos
+
+
+def programacion_entera(matriz_dist, max_iteraciones=500, logger=None):
+    """
+    Solución exacta por programación entera (MILP con HiGHS vía scipy.optimize.milp).
+    Variables binarias x_ij por arista (i < j), con grado 2 en cada ciudad.
+    Las restricciones de eliminación de subtours se agregan de forma perezosa:
+    se resuelve, se buscan las componentes conexas de la solución y, mientras
+    haya más de una, se agrega  sum(x_e, e dentro de S) <= |S| - 1  para cada
+    componente S y se vuelve a resolver.
+    Retorna: mejor_ruta, mejor_dist, historial
+    (historial contiene (ruta, dist) por iteración; mientras hay subtours, la
+    "ruta" es la concatenación de los ciclos y dist el valor del modelo)
+    """
+    n = len(matriz_dist)
+    if logger:
+        logger("\n" + "=" * 80)
+        logger(f"{' INICIANDO PROGRAMACIÓN ENTERA (SUBTOURS PEREZOSOS) ':^80}")
+        logger("=" * 80)
+
+    aristas_i, aristas_j = np.triu_indices(n, k=1)
+    num_aristas = len(aristas_i)
+    costos = np.asarray(matriz_dist, dtype=float)[aristas_i, aristas_j]
+
+    # grado 2: cada arista aparece en la fila de sus dos extremos
+    columnas = np.arange(num_aristas)
+    grado = coo_matrix(
+        (np.ones(2 * num_aristas), (np.concatenate([aristas_i, aristas_j]), np.tile(columnas, 2))),
+        shape=(n, num_aristas)
+    ).tocsr()
+    restricciones = [LinearConstraint(grado, 2, 2)]
+    historial = []
+
+    if logger:
+        logger(f" -> {num_aristas} variables binarias, {n} restricciones de grado")
+
+    for iteracion in range(1, max_iteraciones + 1):
+        resultado = milp(costos, constraints=restricciones, integrality=np.ones(num_aristas),
+                         bounds=Bounds(0, 1))
+        if resultado.x is None:
+            raise RuntimeError(f"HiGHS no encontró solución: {resultado.message}")
+
+        elegidas = resultado.x > 0.5
+        sol_i, sol_j = aristas_i[elegidas], aristas_j[elegidas]
+        num_comp, etiquetas = connected_components(
+            coo_matrix((np.ones(len(sol_i)), (sol_i, sol_j)), shape=(n, n)), directed=False
+        )
+        ciclos = _ciclos(n, sol_i, sol_j)
+        ruta = [c for ciclo in ciclos for c in ciclo]
+        historial.append((ruta, float(resultado.fun)))
+
+        if logger:
+            logger(f" [Iteración {iteracion}] Valor: {resultado.fun:.4f} | Subtours: {num_comp}")
+
+        if num_comp == 1:
+            break
+
+        # eliminar cada subtour encontrado: sum(x_e, e ⊂ S) <= |S| - 1
+        for comp in range(num_comp):
+            en_s = etiquetas == comp
+            fila = (en_s[aristas_i] & en_s[aristas_j]).astype(float)
+            restricciones.append(LinearConstraint(fila, -np.inf, en_s.sum() - 1))
+    else:
+        raise RuntimeError(f"No se eliminaron los subtours en {max_iteraciones} iteraciones.")
+
+    mejor_ruta = ruta
+    mejor_dist = float(sum(matriz_dist[a, b] for a, b in zip(mejor_ruta, mejor_ruta[1:])))
+    historial[-1] = (list(mejor_ruta), mejor_dist)
+
+    if logger:
+        ruta_nombres = " -> ".join([nombre_ciudad(idx)[:9] for idx in mejor_ruta])
+        logger("-" * 80)
+        logger(f" FIN PROGRAMACIÓN ENTERA. Distancia óptima: {mejor_dist:.4f}")
+        logger(f"    Ruta: {ruta_nombres}")
+
+    return mejor_ruta, mejor_dist, historial
@@ -0,0 +1,84 @@
+import numpy as np
+from .spanning_tree import arbol_expansion_minima
+
+
+def _uno_arbol(matriz):
+    """
+    1-árbol con raíz 0: MST sobre las ciudades 1..n-1 más las dos aristas
+    más baratas de la ciudad 0. Retorna (costo, grados).
+    """
+    n = len(matriz)
+    costo, padres = arbol_expansion_minima(matriz, np.arange(1, n))
+    grados = np.zeros(n, dtype=int)
+    hijos = np.arange(1, n)[padres >= 0]
+    np.add.at(grados, hijos, 1)
+    np.add.at(grados, padres[padres >= 0], 1)
+
+    dos_mas_cercanas = np.argpartition(matriz[0, 1:], 1)[:2] + 1
+    costo += matriz[0, dos_mas_cercanas].sum()
+    grados[0] = 2
+    grados[dos_mas_cercanas] += 1
+    return costo, grados
+
+
+def cota_inferior_1arbol(matriz_dist, cota_superior=None, iteraciones=300, logger=None):
+    """
+    Cota inferior de Held-Karp: 1-árboles con penalizaciones por nodo optimizadas
+    por subgradiente. Con penalizaciones pi, d'_ij = d_ij + pi_i + pi_j y
+        L(pi) = costo_1arbol(d') - 2 * sum(pi)
+    es una cota inferior de cualquier ruta; pi se mueve en la dirección
+    (grado - 2) con paso de Polyak t = lam * (cota_superior - L) / ||grado - 2||².
+    Cada iteración cuesta O(n²) (un Prim), así que sirve para instancias donde
+    la búsqueda exhaustiva es imposible.
+    - cota_superior: largo de una ruta conocida (p. ej. vecino más cercano); si no
+      se indica se usa la ruta 0, 1, ..., n-1.
+    Retorna: cota, penalizaciones
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    n = len(matriz)
+    if n < 3:
+        return float(matriz.sum()), np.zeros(n)
+    if cota_superior is None:
+        orden = np.append(np.arange(n), 0)
+        cota_superior = float(matriz[orden[:-1], orden[1:]].sum())
+
+    if logger:
+        logger("\n" + "=" * 80)
+        logger(f"{' COTA INFERIOR (1-ÁRBOL + SUBGRADIENTE) ':^80}")
+        logger("=" * 80)
+
+    penalizaciones = np.zeros(n)
+    mejor_cota = -np.inf
+    mejores_penalizaciones = penalizaciones.copy()
+    lam = 2.0
+    sin_mejora = 0
+
+    for iteracion in range(1, iteraciones + 1):
+        ajustada = matriz + penalizaciones[:, None] + penalizaciones[None, :]
+        costo, grados = _uno_arbol(ajustada)
+        cota = costo - 2 * penalizaciones.sum()
+
+        if cota > mejor_cota + 1e-12:
+            mejor_cota = cota
+            mejores_penalizaciones = penalizaciones.copy()
+            sin_mejora = 0
+        else:
+            sin_mejora += 1
+            if sin_mejora >= 10:
+                lam /= 2
+                sin_mejora = 0
+
+        subgradiente = grados - 2
+        norma = float((subgradiente ** 2).sum())
+        if norma == 0:
+            # el 1-árbol es una ruta: la cota es el óptimo
+            break
+        if lam < 1e-6:
+            break
+        paso = lam * (cota_superior - cota) / norma
+        penalizaciones = penalizaciones + paso * subgradiente
+
+    if logger:
+        logger(f" -> {iteracion} iteraciones. Cota inferior: {mejor_cota:.4f}")
+
+    return float(mejor_cota), mejores_penalizaciones
@@ -1,18 +1,31 @@
-from .data import n, nombres_ciudades
+import numpy as np
+from .data import nombre_ciudad
+from .kernels import mas_cercano_libre
+
+# Tope de inicios sugerido para vecino_mas_cercano_multiinicio en instancias grandes
+# (por defecto prueba todas las ciudades; pasar max_inicios=MAX_INICIOS para acotarlo)
+MAX_INICIOS = 32
+
+# vecino_mas_cercano_rejilla guarda por defecto solo la ruta final desde este tamaño
+# (las rutas parciales del historial crecerían como O(100·n))
+MAX_CIUDADES_HISTORIAL = 10_000
 
 def vecino_mas_cercano(matriz_dist, inicio=0, logger=None):
     """
     Vecino más cercano. Retorna ruta, dist_total, historial (lista de rutas parciales).
     Muestra todas las decisiones paso a paso.
     """
+    n = len(matriz_dist)
     if logger:
         logger("=" * 80)
         logger(f"{' INICIANDO VECINO MÁS CERCANO (GREEDY) ':^80}")
         logger("=" * 80)
-        logger(f"Comenzamos en: {nombres_ciudades[inicio].upper()}")
+        logger(f"Comenzamos en: {nombre_ciudad(inicio).upper()}")
 
     ruta = [inicio]
     visitadas = {inicio}
+    mascara_visitadas = np.zeros(n, dtype=bool)
+    mascara_visitadas[inicio] = True
     actual = inicio
     dist_total = 0.0
     historial = [list(ruta)]
@@ -20,56 +33,57 @@ def vecino_mas_cercano(matriz_dist, inicio=0, logger=None):
     while len(visitadas) < n:
         if logger:
             logger("")  # Línea en blanco
-            logger(f"Estoy en {nombres_ciudades[actual]}... buscando destino más cercano:")
+            logger(f"Estoy en {nombre_ciudad(actual)}... buscando destino más cercano:")
         
         mejor_dist_local = float('inf')
         siguiente = None
         
         # Buscar el vecino no visitado más cercano
-        for vecino in range(n):
-            if vecino in visitadas:
-                continue
+        if logger:
+            for vecino in range(n):
+                if vecino in visitadas:
+                    continue
             
-            d = matriz_dist[actual, vecino]
+                d = matriz_dist[actual, vecino]
             
-            if logger:
                 if d < mejor_dist_local:
-                    logger(f"   - ¿Ir a {nombres_ciudades[vecino]}? Distancia: {d:.2f} (¡Candidato actual!)")
+                    logger(f"   - ¿Ir a {nombre_ciudad(vecino)}? Distancia: {d:.2f} (¡Candidato actual!)")
                     mejor_dist_local = d
                     siguiente = vecino
                 else:
-                    logger(f"   - ¿Ir a {nombres_ciudades[vecino]}? Distancia: {d:.2f}")
-            else:
-                # Sin logger, solo calcular
-                if d < mejor_dist_local:
-                    mejor_dist_local = d
-                    siguiente = vecino
+                    logger(f"   - ¿Ir a {nombre_ciudad(vecino)}? Distancia: {d:.2f}")
+        else:
+            # Sin logger, solo calcular (kernel compilado con numba si está disponible)
+            elegido, d = mas_cercano_libre(matriz_dist[actual], mascara_visitadas)
+            if elegido >= 0:
+                siguiente, mejor_dist_local = elegido, d
         
         if siguiente is None:
             # Esto no debería ocurrir si el grafo está conectado y n > 0
             if logger:
-                logger(f"Error: No se encontró un vecino para {nombres_ciudades[actual]}.")
+                logger(f"Error: No se encontró un vecino para {nombre_ciudad(actual)}.")
             break
 
         # Mover al siguiente
         if logger:
-            logger(f" >>> DECISIÓN: Viajo a {nombres_ciudades[siguiente]} (Dist: {mejor_dist_local:.2f})")
+            logger(f" >>> DECISIÓN: Viajo a {nombre_ciudad(siguiente)} (Dist: {mejor_dist_local:.2f})")
         
         dist_total += mejor_dist_local
         actual = siguiente
         ruta.append(actual)
         visitadas.add(actual)
+        mascara_visitadas[actual] = True
         historial.append(list(ruta))
 
     # Volver al inicio
     dist_retorno = matriz_dist[actual, inicio]
     if logger:
         logger("")  # Línea en blanco
-        logger(f"Todas visitadas. Regresando al inicio ({nombres_ciudades[inicio]})...")
+        logger(f"Todas visitadas. Regresando al inicio ({nombre_ciudad(inicio)})...")
         logger(f" >>> Retorno: {dist_retorno:.2f}")
         logger("")  # Línea en blanco
         logger("-" * 80)
-        logger(f"FIN VECINO MÁS CERCANO. Ruta final: {' → '.join([nombres_ciudades[i] for i in ruta])}")
+        logger(f"FIN VECINO MÁS CERCANO. Ruta final: {' → '.join([nombre_ciudad(i) for i in ruta])}")
         logger(f"Distancia total: {dist_total:.4f}")
         logger("-" * 80)
 
@@ -77,4 +91,246 @@ def vecino_mas_cercano(matriz_dist, inicio=0, logger=None):
     ruta.append(inicio)
     historial.append(list(ruta))
 
-    return ruta, dist_total, historial
\ No newline at end of file
+    return ruta, dist_total, historial
+
+def vecino_mas_cercano_vectorizado(matriz_dist, inicio=0, vecinos=None, logger=None):
+    """
+    Vecino más cercano con máscara booleana: cada paso elige el siguiente destino
+    con un argmin sobre la fila de la ciudad actual (las visitadas valen inf).
+    Misma ruta que vecino_mas_cercano (los empates se resuelven por el menor índice).
+    - vecinos: listas de candidatos (candidates.vecinos_cercanos). Si se dan,
+      primero se busca la primera candidata no visitada (que es la más
+      cercana, salvo empates) y solo si todas lo están se recorre la fila: la
+      mayoría de los pasos cuestan O(k) en vez de O(n).
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO VECINO MÁS CERCANO (VECTORIZADO) ':^80}")
+        logger("=" * 80)
+        logger(f"Comenzamos en: {nombre_ciudad(inicio).upper()}")
+
+    visitadas = np.zeros(num, dtype=bool)
+    visitadas[inicio] = True
+    ruta = [inicio]
+    actual = inicio
+    dist_total = 0.0
+    historial = [list(ruta)]
+    candidatas = np.asarray(vecinos).tolist() if vecinos is not None else None
+
+    for _ in range(num - 1):
+        siguiente = -1
+        if candidatas is not None:
+            for c in candidatas[actual]:
+                if not visitadas[c]:
+                    siguiente = c
+                    break
+        if siguiente < 0:
+            siguiente = int(np.argmin(np.where(visitadas, np.inf, matriz[actual])))
+        d = matriz[actual, siguiente]
+        if logger:
+            logger(f" >>> DECISIÓN: {nombre_ciudad(actual)} → {nombre_ciudad(siguiente)} "
+                   f"(Dist: {d:.2f})")
+        dist_total += d
+        visitadas[siguiente] = True
+        actual = siguiente
+        ruta.append(actual)
+        historial.append(list(ruta))
+
+    dist_total += matriz[actual, inicio]
+    ruta.append(inicio)
+    historial.append(list(ruta))
+
+    if logger:
+        logger("-" * 80)
+        logger(f"FIN VECINO MÁS CERCANO. Ruta final: {' → '.join([nombre_ciudad(i) for i in ruta])}")
+        logger(f"Distancia total: {dist_total:.4f}")
+        logger("-" * 80)
+
+    return ruta, float(dist_total), historial
+
+
+def vecino_mas_cercano_multiinicio(matriz_dist, inicio=0, vecinos=None, max_inicios=None, logger=None):
+    """
+    Vecino más cercano desde varias ciudades a la vez: las rutas avanzan
+    juntas con una máscara (m, n) de visitadas y se conserva la más corta,
+    rotada para que empiece y termine en `inicio`.
+    - max_inicios: None (por defecto) prueba cada ciudad como inicio. Con un
+      tope (p. ej. MAX_INICIOS) y n mayor que él, se prueban `inicio` y
+      max_inicios - 1 ciudades repartidas por índice.
+    - vecinos: listas de candidatos (n, k). Cada paso toma la primera
+      candidata libre de cada ruta y solo las rutas sin candidatas libres
+      recorren su fila completa.
+    Costo: O(m·n²) sin candidatos, unas m pasadas del vecino más cercano
+    simple, con m = n (O(n³)) o m = min(n, max_inicios); con candidatos, casi
+    siempre O(m·n·k). La máscara ocupa m·n bytes.
+    Retorna ruta, dist_total, historial (rutas parciales de la construcción ganadora).
+    """
+    matriz = np.asarray(matriz_dist, dtype=float)
+    num = len(matriz)
+    if max_inicios is None or num <= max_inicios:
+        inicios = np.arange(num)
+    else:
+        repartidos = np.linspace(0, num, max_inicios - 1, endpoint=False).astype(np.intp)
+        inicios = np.unique(np.append(repartidos, inicio))
+    m = len(inicios)
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO VECINO MÁS CERCANO (MULTI-INICIO) ':^80}")
+        logger("=" * 80)
+        logger(f"Construyendo {m} rutas en paralelo (una por ciudad de inicio)...")
+
+    filas = np.arange(m)
+    rutas = np.empty((m, num), dtype=np.intp)
+    rutas[:, 0] = inicios
+    visitadas = np.zeros((m, num), dtype=bool)
+    visitadas[filas, inicios] = True
+    actuales = inicios.copy()
+    dists = np.zeros(m)
+    if vecinos is not None:
+        vecinos = np.asarray(vecinos, dtype=np.intp)
+
+    for paso in range(1, num):
+        if vecinos is None:
+            siguientes = np.empty(m, dtype=np.intp)
+            sin_candidatas = filas
+        else:
+            # primera candidata libre de cada ruta (la más cercana, salvo empates)
+            candidatas = vecinos[actuales]
+            libres = ~visitadas[filas[:, None], candidatas]
+            siguientes = candidatas[filas, libres.argmax(axis=1)]
+            sin_candidatas = np.flatnonzero(~libres.any(axis=1))
+        if len(sin_candidatas):
+            resto = np.where(visitadas[sin_candidatas], np.inf, matriz[actuales[sin_candidatas]])
+            siguientes[sin_candidatas] = np.argmin(resto, axis=1)
+        dists += matriz[actuales, siguientes]
+        visitadas[filas, siguientes] = True
+        rutas[:, paso] = siguientes
+        actuales = siguientes
+    dists += matriz[actuales, inicios]
+
+    ganadora = int(np.argmin(dists))
+    construccion = rutas[ganadora].tolist()
+    historial = [construccion[:k] for k in range(1, num + 1)]
+
+    desplazamiento = construccion.index(inicio)
+    ruta = construccion[desplazamiento:] + construccion[:desplazamiento] + [inicio]
+    dist_total = float(dists[ganadora])
+    historial.append(ruta)
+
+    if logger:
+        for i, s in enumerate(inicios.tolist()):
+            marca = " (¡Mejor!)" if i == ganadora else ""
+            logger(f"   - Inicio en {nombre_ciudad(s)}: {dists[i]:.4f}{marca}")
+        logger("-" * 80)
+        logger(f"FIN VECINO MÁS CERCANO. Ruta final: {' → '.join([nombre_ciudad(i) for i in ruta])}")
+        logger(f"Distancia total: {dist_total:.4f}")
+        logger("-" * 80)
+
+    return ruta, dist_total, historial
+
+
+class _RejillaEspacial:
+    """
+    Rejilla uniforme sobre las coordenadas (~2 ciudades por celda) que permite
+    borrar ciudades y consultar la más cercana sin matriz de distancias.
+    """
+
+    def __init__(self, puntos):
+        self.puntos = puntos
+        self.puntos_lista = puntos.tolist()
+        minimo = puntos.min(axis=0)
+        extension = puntos.max(axis=0) - minimo
+        area = float(extension[0] * extension[1]) or float(extension.max() ** 2) or 1.0
+        self.lado = float(np.sqrt(2 * area / len(puntos))) or 1.0
+        self.minimo = minimo
+        self.dims = (extension // self.lado).astype(int) + 1
+        celdas = ((puntos - minimo) // self.lado).astype(int)
+        self.celda_de = [tuple(c) for c in celdas.tolist()]
+        self.celdas = {}
+        for idx, celda in enumerate(self.celda_de):
+            self.celdas.setdefault(celda, []).append(idx)
+
+    def borrar(self, idx):
+        celda = self.celda_de[idx]
+        self.celdas[celda].remove(idx)
+        if not self.celdas[celda]:
+            del self.celdas[celda]
+
+    def mas_cercana(self, idx):
+        """(distancia², índice) de la ciudad restante más cercana a `idx`; empates por menor índice."""
+        x, y = self.puntos_lista[idx]
+        cx, cy = self.celda_de[idx]
+        mejor = (float('inf'), -1)
+        radio_max = int(self.dims.max())
+        for radio in range(radio_max + 1):
+            # celdas a distancia de Chebyshev exactamente `radio`
+            for i in range(cx - radio, cx + radio + 1):
+                paso = 1 if abs(i - cx) == radio else 2 * radio
+                for j in range(cy - radio, cy + radio + 1, paso or 1):
+                    for otro in self.celdas.get((i, j), ()):
+                        ox, oy = self.puntos_lista[otro]
+                        candidato = ((ox - x) ** 2 + (oy - y) ** 2, otro)
+                        if candidato < mejor:
+                            mejor = candidato
+            # todo lo que queda fuera está a más de radio * lado
+            if mejor[1] >= 0 and mejor[0] < (radio * self.lado) ** 2:
+                break
+        return mejor
+
+
+def vecino_mas_cercano_rejilla(puntos, inicio=0, paso_historial=None, logger=None):
+    """
+    Vecino más cercano sobre coordenadas (array (n, 2)) con una rejilla espacial:
+    no construye la matriz de distancias y borra cada ciudad visitada, así que
+    usa memoria O(n) y en puntos bien repartidos cada consulta revisa pocas celdas.
+    Misma ruta que vecino_mas_cercano con la matriz euclidiana.
+    - paso_historial: guarda una ruta parcial cada tantos pasos (por defecto
+      n // 100, es decir, todas para instancias pequeñas; 0 guarda solo la ruta
+      final, el defecto desde MAX_CIUDADES_HISTORIAL ciudades).
+    Retorna ruta, dist_total, historial (lista de rutas parciales).
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    num = len(puntos)
+    if paso_historial is None:
+        paso_historial = max(1, num // 100) if num <= MAX_CIUDADES_HISTORIAL else 0
+    if logger:
+        logger("=" * 80)
+        logger(f"{' INICIANDO VECINO MÁS CERCANO (REJILLA ESPACIAL) ':^80}")
+        logger("=" * 80)
+
+    rejilla = _RejillaEspacial(puntos)
+    if logger:
+        logger(f" -> {num} ciudades en {len(rejilla.celdas)} celdas de lado {rejilla.lado:.4f}")
+
+    rejilla.borrar(inicio)
+    ruta = [inicio]
+    actual = inicio
+    dist_total = 0.0
+    historial = [list(ruta)] if paso_historial else []
+
+    for paso in range(1, num):
+        dist2, siguiente = rejilla.mas_cercana(actual)
+        rejilla.borrar(siguiente)
+        dist_total += np.sqrt(dist2)
+        actual = siguiente
+        ruta.append(actual)
+        if paso_historial and paso % paso_historial == 0:
+            historial.append(list(ruta))
+
+    x, y = rejilla.puntos_lista[actual]
+    ox, oy = rejilla.puntos_lista[inicio]
+    dist_total += np.sqrt((ox - x) ** 2 + (oy - y) ** 2)
+    ruta.append(inicio)
+    if historial and historial[-1] != ruta[:-1]:
+        historial.append(ruta[:-1])
+    historial.append(list(ruta))
+
+    if logger:
+        logger("-" * 80)
+        logger(f"FIN VECINO MÁS CERCANO (REJILLA). Distancia total: {dist_total:.4f}")
+        logger("-" * 80)
+
+    return ruta, float(dist_total), historial
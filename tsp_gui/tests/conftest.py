@@ -0,0 +1,5 @@
+import os
+import sys
+
+# los módulos se importan como logic.<módulo>, igual que desde core/app.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))